@@ -0,0 +1,226 @@
+#!/usr/bin/env python
+
+from __future__ import print_function
+import argparse
+import math
+import os
+import random
+import sys
+
+from edtslib import calc
+from edtslib import db_sqlite3
+from edtslib import env
+from edtslib import gzipstream
+from edtslib import solver
+from edtslib import util
+from edtslib.thirdparty import gzipinputstream
+from edtslib.station import Station
+from edtslib.system_internal import KnownSystem
+
+log = util.get_logger("benchmark")
+
+env.configure_logging(env.global_args.log_level)
+
+
+def make_star_field(count, radius = 40.0, density = 0.001, seed = 0):
+  # Scatter stars uniformly through a cylinder along the x axis, with the
+  # length chosen so that the star density stays constant as count grows
+  rng = random.Random(seed)
+  length = count / (density * math.pi * radius * radius)
+  stars = []
+  for i in range(count):
+    r = radius * math.sqrt(rng.random())
+    theta = rng.random() * 2 * math.pi
+    stars.append(KnownSystem({
+      'id': i,
+      'name': 'Synthetic {}'.format(i),
+      'x': rng.random() * length,
+      'y': r * math.cos(theta),
+      'z': r * math.sin(theta),
+      'id64': None}))
+  sys_from = min(stars, key=lambda s: s.position.x)
+  sys_to = max(stars, key=lambda s: s.position.x)
+  return stars, sys_from, sys_to
+
+
+def run_astar(stars, sys_from, sys_to, jump_range, use_grid):
+  valid_neighbour_fn = lambda n, current: n != current and n.distance_to(current) < jump_range
+  # Route variance and fuel validation are left out so that we time the search itself
+  cost_fn = lambda cur, neighbour, path: calc.time_for_jumps(calc.jump_count(cur, neighbour, jump_range)) + cur.distance_to(neighbour)
+  timer = util.start_timer()
+  route = calc.astar(stars, sys_from, sys_to, valid_neighbour_fn, cost_fn, jump_range if use_grid else None)
+  return route, util.get_timer(timer)
+
+
+def bench_astar(args):
+  for count in args.counts:
+    stars, sys_from, sys_to = make_star_field(count, seed = args.seed)
+    log.info("{} stars, {:.0f}LY route", count, sys_from.distance_to(sys_to))
+    route, grid_time = run_astar(stars, sys_from, sys_to, args.jump_range, True)
+    log.info("  grid:   {:.3f}s, {} jumps", grid_time, len(route) - 1 if route is not None else None)
+    if count <= args.linear_max:
+      linear_route, linear_time = run_astar(stars, sys_from, sys_to, args.jump_range, False)
+      log.info("  linear: {:.3f}s, {} jumps, speedup {:.1f}x, same route: {}", linear_time, len(linear_route) - 1 if linear_route is not None else None, linear_time / grid_time, route == linear_route)
+    else:
+      log.info("  linear: skipped (more than {} stars)", args.linear_max)
+
+
+def run_route_strategy(stars, sys_from, sys_to, jump_range, bidirectional):
+  # The same cost functions as Routing.plot_astar and plot_bidirectional, without a ship to validate fuel
+  valid_neighbour_fn = lambda n, current: n != current and n.distance_to(current) < jump_range
+  cost_fn = lambda cur, neighbour, path: calc.astar_cost(cur, neighbour, path, jump_range)
+  timer = util.start_timer()
+  if bidirectional:
+    route = calc.bidirectional_astar(stars, sys_from, sys_to, valid_neighbour_fn, cost_fn, cost_fn, None, jump_range)
+  else:
+    route = calc.astar(stars, sys_from, sys_to, valid_neighbour_fn, cost_fn, jump_range)
+  return route, util.get_timer(timer)
+
+
+def bench_bidirectional(args):
+  for count in args.counts:
+    stars, sys_from, sys_to = make_star_field(count, seed = args.seed)
+    log.info("{} stars, {:.0f}LY route", count, sys_from.distance_to(sys_to))
+    for name, bidirectional in [('astar', False), ('bidirectional', True)]:
+      route, elapsed = run_route_strategy(stars, sys_from, sys_to, args.jump_range, bidirectional)
+      if route is None:
+        log.info("  {:13s}: {:.3f}s, no route", name, elapsed)
+      else:
+        log.info("  {:13s}: {:.3f}s, {} jumps, {:.1f}LY", name, elapsed, len(route) - 1, sum(d for _, _, d in calc.route_legs(route)))
+
+
+def make_stations(count, size = 1000.0, seed = 0):
+  # Stations scattered through a cube, each in its own system
+  rng = random.Random(seed)
+  stations = []
+  for i in range(count):
+    system = KnownSystem({'id': i, 'name': 'Synthetic {}'.format(i), 'x': rng.uniform(0, size), 'y': rng.uniform(-size / 10, size / 10), 'z': rng.uniform(0, size), 'id64': None})
+    stations.append(Station({'name': 'Station {}'.format(i), 'distance_to_star': rng.randint(10, 5000), 'type': None, 'has_refuel': True, 'max_landing_pad_size': 'L', 'is_planetary': False}, system))
+  return stations
+
+
+def run_solver(stations, mode, jump_range, cost_matrix, seed, local_search = True):
+  # Seed the solver so that the clustered modes make the same random choices every run
+  s = solver.Solver(jump_range, 1.5, cost_matrix = cost_matrix, local_search = local_search, seed = seed)
+  start, end = stations[0], stations[-1]
+  timer = util.start_timer()
+  route, _ = s.solve(list(stations[1:-1]), start, end, len(stations), preferred_mode = mode)
+  elapsed = util.get_timer(timer)
+  cost = calc.solve_route_cost(route, jump_range) if route is not None else None
+  return route, cost, elapsed
+
+
+def bench_solver(args):
+  for count in args.counts:
+    stations = make_stations(count, seed = args.seed)
+    log.info("{} stops", count)
+    for mode in args.modes:
+      if mode == solver.BASIC and count > args.basic_max:
+        log.info("  {:17s}: skipped (more than {} stops)", mode, args.basic_max)
+        continue
+      if mode == solver.EXACT and count - 2 > solver.get_exact_max_size():
+        log.info("  {:17s}: skipped (more than {} stops)", mode, solver.get_exact_max_size() + 2)
+        continue
+      route, cost, matrix_time = run_solver(stations, mode, args.jump_range, True, args.seed, not args.no_local_search)
+      old_route, old_cost, old_time = run_solver(stations, mode, args.jump_range, False, args.seed, not args.no_local_search)
+      log.info("  {:17s}: matrix {:.3f}s, direct {:.3f}s, speedup {:.1f}x, cost {:.1f}, same route: {}", mode, matrix_time, old_time, old_time / matrix_time if matrix_time else float('inf'), cost if cost is not None else float('nan'), route == old_route)
+
+
+def legacy_find_all_systems(dbc):
+  # find_all_systems as it used to be, one fetchone and one dict per row
+  c = dbc._conn.cursor()
+  c.execute('SELECT {} FROM systems'.format(','.join(db_sqlite3._find_method_systems_entries)))
+  result = c.fetchone()
+  while result is not None:
+    yield db_sqlite3._process_system_result(result)
+    result = c.fetchone()
+
+
+def bench_stream(args):
+  path = args.db_file if args.db_file is not None else os.path.join(env.default_path, env.global_args.db_file)
+  dbc = db_sqlite3.open_db(path, read_only = True)
+  readers = [
+    ('fetchone', lambda: legacy_find_all_systems(dbc)),
+    ('find_all_systems', lambda: dbc.find_all_systems()),
+    ('stream', lambda: dbc.stream_systems(batch_size = args.batch_size)),
+    ('stream (name, x, y, z)', lambda: dbc.stream_systems(columns = ('name', 'x', 'y', 'z'), batch_size = args.batch_size)),
+  ]
+  for name, fn in readers:
+    # Best of several runs, so that the first doesn't pay for warming the page cache
+    best = None
+    for _ in range(args.repeat):
+      timer = util.start_timer()
+      count = sum(1 for _ in fn())
+      elapsed = util.get_timer(timer)
+      best = elapsed if best is None else min(best, elapsed)
+    log.info("  {:22s}: {} rows in {:.3f}s, {:.0f} rows/s", name, count, best, count / best if best else float('inf'))
+  dbc.close()
+
+
+def bench_gzip(args):
+  streams = [
+    ('GzipInputStream', gzipinputstream.GzipInputStream),
+    ('ThreadedGzipInputStream', gzipstream.ThreadedGzipInputStream),
+  ]
+  for name, cls in streams:
+    for how in ['lines', 'blocks']:
+      with open(args.file, 'rb') as f:
+        stream = cls(f)
+        timer = util.start_timer()
+        size = 0
+        if how == 'lines':
+          line = stream.readline()
+          while line:
+            size += len(line)
+            line = stream.readline()
+        else:
+          data = stream.read(args.block_size)
+          while data:
+            size += len(data)
+            data = stream.read(args.block_size)
+        elapsed = util.get_timer(timer)
+      log.info("  {:23s} {:6s}: {} bytes in {:.3f}s, {:.1f}MB/s", name, how, size, elapsed, size / elapsed / 1048576 if elapsed else float('inf'))
+
+
+# Benchmark modes
+if __name__ == '__main__':
+  ap = argparse.ArgumentParser(description = "Benchmarks for EDTS internals")
+  subparsers = ap.add_subparsers(dest = 'mode')
+  ap_astar = subparsers.add_parser('astar', help = "A* route plotting over synthetic star fields")
+  ap_astar.add_argument("counts", metavar = "count", type = int, nargs = '*', default = [10000, 100000, 1000000], help = "Numbers of stars to generate")
+  ap_astar.add_argument("-j", "--jump-range", type = float, default = 30.0, help = "The jump range to plot with")
+  ap_astar.add_argument("--linear-max", type = int, default = 100000, help = "Skip the linear scan comparison above this many stars")
+  ap_astar.add_argument("--seed", type = int, default = 0, help = "Random seed for the star field")
+  ap_astar.set_defaults(fn = bench_astar)
+
+  ap_bidir = subparsers.add_parser('bidirectional', help = "One-way and bidirectional A* over long synthetic star fields")
+  ap_bidir.add_argument("counts", metavar = "count", type = int, nargs = '*', default = [20000, 100000], help = "Numbers of stars to generate")
+  ap_bidir.add_argument("-j", "--jump-range", type = float, default = 30.0, help = "The jump range to plot with")
+  ap_bidir.add_argument("--seed", type = int, default = 0, help = "Random seed for the star field")
+  ap_bidir.set_defaults(fn = bench_bidirectional)
+
+  ap_solver = subparsers.add_parser('solver', help = "Stop ordering with each solve mode, with and without the cost matrix")
+  ap_solver.add_argument("counts", metavar = "count", type = int, nargs = '*', default = [10, 20, 40], help = "Numbers of stops to generate")
+  ap_solver.add_argument("-j", "--jump-range", type = float, default = 30.0, help = "The jump range to solve with")
+  ap_solver.add_argument("--modes", nargs = '+', choices = solver.modes, default = [solver.BASIC, solver.NEAREST_NEIGHBOUR, solver.CLUSTERED, solver.CLUSTERED_REPEAT, solver.EXACT], help = "The solve modes to compare")
+  ap_solver.add_argument("--basic-max", type = int, default = 10, help = "Skip the basic mode above this many stops")
+  ap_solver.add_argument("--seed", type = int, default = 0, help = "Random seed for the stations")
+  ap_solver.add_argument("--no-local-search", action = 'store_true', help = "Don't refine heuristic solutions with local search")
+  ap_solver.set_defaults(fn = bench_solver)
+
+  ap_stream = subparsers.add_parser('stream', help = "Rows per second reading the whole systems table")
+  ap_stream.add_argument("db_file", nargs = '?', help = "The database to read, by default the one given by --db-file")
+  ap_stream.add_argument("-b", "--batch-size", type = int, default = db_sqlite3.default_stream_batch_size, help = "Rows to fetch at a time when streaming")
+  ap_stream.add_argument("-r", "--repeat", type = int, default = 3, help = "Runs of each reader to take the best of")
+  ap_stream.set_defaults(fn = bench_stream)
+
+  ap_gzip = subparsers.add_parser('gzip', help = "Decompression speed of the gzip stream readers, by line and by block")
+  ap_gzip.add_argument("file", help = "A gzip file, such as a downloaded EDSM dump")
+  ap_gzip.add_argument("-b", "--block-size", type = int, default = 1024 * 1024, help = "Bytes to read at a time when reading by block")
+  ap_gzip.set_defaults(fn = bench_gzip)
+
+  args = ap.parse_args(env.local_args)
+  if getattr(args, 'fn', None) is None:
+    ap.print_help()
+    sys.exit(1)
+  args.fn(args)
@@ -2,6 +2,8 @@
 
 from __future__ import print_function
 import argparse
+import struct
+import sys
 from edtslib.cow import ColumnObjectWriter
 from edtslib.dist import Lightyears
 from edtslib import distance
@@ -15,17 +17,58 @@ def parse_args(arg, hosted, state):
   ap.add_argument("-o", "--ordered", action='store_true', default=False, help="List is ordered (do not sort alphabetically)")
   ap.add_argument("-f", "--full-width", action='store_true', default=False, help="Do not truncate heading names for readability")
   ap.add_argument("-s", "--start", type=str, required=False, help="Defines a start system to calculate all other distances from")
+  ap.add_argument("-m", "--matrix", action='store_true', default=False, help="Calculate all the distances in one pass and stream them as CSV, for many systems")
+  ap.add_argument(      "--output", type=str, required=False, help="With --matrix, write to this file rather than the screen; a name ending in .npy gives a numpy array of float64 distances")
   ap.add_argument("-r", "--route", action='store_true', default=False, help="List of systems is a sequential list to visit and get distances between")
   ap.add_argument("systems", metavar="systems", nargs='+', help="Systems")
 
   return ap.parse_args(arg)
 
+def npy_header(rows, columns):
+  # Version 1.0 of the .npy format, padded so that the data is aligned
+  header = "{{'descr': '<f8', 'fortran_order': False, 'shape': ({}, {}), }}".format(rows, columns)
+  header += ' ' * (63 - (len(header) + 10) % 64) + '\n'
+  return b'\x93NUMPY\x01\x00' + struct.pack('<H', len(header)) + header.encode('ascii')
+
+def npy_row(distances):
+  if hasattr(distances, 'astype'):
+    return distances.astype('<f8').tobytes()
+  return struct.pack('<{}d'.format(len(distances)), *distances)
+
+def write_matrix(app, results, output):
+  npy = output is not None and output.endswith('.npy')
+  f = open(output, 'wb' if npy else 'w') if output is not None else sys.stdout
+  try:
+    line_format = None
+    for row in results:
+      # Rows are written as they are calculated; the systems are known by the first
+      if line_format is None:
+        count = len(app.matrix_systems)
+        if npy:
+          f.write(npy_header(count, count))
+        else:
+          f.write(','.join([''] + [s.name for s in app.matrix_systems]) + '\n')
+        # Formatting a whole row at once is much quicker than a cell at a time
+        line_format = '%s' + ',%.2f' * count + '\n'
+      if npy:
+        f.write(npy_row(row.distances))
+      else:
+        distances = row.distances.tolist() if hasattr(row.distances, 'tolist') else row.distances
+        f.write(line_format % tuple([row.origin.system.name] + distances))
+  finally:
+    if f is not sys.stdout:
+      f.close()
+
 def run(args, hosted = False, state = {}):
   parsed = parse_args(args, hosted, state)
-  results = distance.Application(**vars(parsed)).run()
+  app = distance.Application(**vars(parsed))
+  results = app.run()
   if env.global_args.json:
     print(util.to_json(list(results)))
     return
+  if parsed.matrix:
+    write_matrix(app, results, parsed.output)
+    return
   cow = ColumnObjectWriter()
   raikogram_mode = False
   last_origin = None
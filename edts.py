@@ -84,6 +84,8 @@ def parse_args(arg, hosted, state):
   ap.add_argument("--hbuffer", type=float, default=edts.default_hbuffer, help="A minimum buffer distance, in LY, used to search for valid next legs. Not used by the 'astar' strategy.")
   ap.add_argument("--solve-mode", type=str, default=edts.default_solve_mode, choices=solver.modes, help="The mode used by the travelling salesman solver")
   ap.add_argument("--tolerance", type=float, default=edts.default_tolerance, help="Tolerance checking for obscured jumps")
+  ap.add_argument("--jobs", type=int, default=edts.default_jobs, help="The number of processes to use for plotting route legs in parallel")
+  ap.add_argument("--no-route-cache", dest="route_cache", action="store_false", default=True, help="Don't use or store previously plotted routes")
   ap.add_argument("stations", metavar="system[/station]", nargs="*", help="A station to travel via, in the form 'system/station' or 'system'")
 
   parsed = ap.parse_args(arg)
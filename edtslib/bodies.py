@@ -133,6 +133,9 @@ class Star(Body):
       star_type = data.get('subType')
       if star_type is not None:
         self.spectral_class = self.EDSM_CLASS_NAMES.get(star_type)
+    elif data.get('spectral_class'):
+      # Our own data, already classified.
+      self.spectral_class = data.get('spectral_class')
 
   @property
   def main_sequence(self):
@@ -1,5 +1,8 @@
+import heapq
+import itertools
 import math
 from . import ship
+from . import spatial
 from .station import Station
 from . import util
 
@@ -26,7 +29,9 @@ def jump_count(a, b, jump_range, slf = default_slf):
 
 # Gets an estimated range of number of jumps required to jump from a to b
 def jump_count_range(a, b, jump_range, slf = default_slf):
-  legdist = a.distance_to(b)
+  return jump_count_range_for_distance(a.distance_to(b), jump_range, slf)
+
+def jump_count_range_for_distance(legdist, jump_range, slf = default_slf):
   if legdist == float('inf'):
     return 0, 0
 
@@ -41,8 +46,8 @@ def jump_count_range(a, b, jump_range, slf = default_slf):
 def route_fuel_cost(route, ship, track_usage, starting_fuel = None, strict = None):
   cost = 0.0
   cur_fuel = starting_fuel if starting_fuel is not None else ship.tank_size
-  for i in range(1, len(route)):
-    jump_cost = ship.cost(route[i-1].distance_to(route[i]), cur_fuel)
+  for _, _, jdist in route_legs(route):
+    jump_cost = ship.cost(jdist, cur_fuel)
     if strict and jump_cost > ship.fsd.maxfuel:
       return None
     cost += jump_cost
@@ -54,8 +59,12 @@ def route_fuel_cost(route, ship, track_usage, starting_fuel = None, strict = Non
 
 # The cost to go from a to b, as used in simple (non-routed) solving
 def solve_cost(a, b, jump_range, witchspace_time = default_ws_time):
-  hs_jumps = time_for_jumps(jump_count(a, b, jump_range), witchspace_time) * 2
-  hs_jdist = a.distance_to(b)
+  return solve_cost_for_distance(a.distance_to(b), b, jump_range, witchspace_time)
+
+# As solve_cost, for when the distance from a to b is already known
+def solve_cost_for_distance(hs_jdist, b, jump_range, witchspace_time = default_ws_time):
+  _, maxjumps = jump_count_range_for_distance(hs_jdist, jump_range)
+  hs_jumps = time_for_jumps(maxjumps, witchspace_time) * 2
   sc = sc_cost(b.distance if b.uses_sc else 0.0)
   return (hs_jumps + hs_jdist + sc)
 
@@ -97,8 +106,7 @@ def astar_cost(a, b, route, jump_range, dist_threshold = None, witchspace_time =
     if jcount == 1 and a.distance_to(b) > dist_threshold:
       penalty += 20
 
-    for i in range(0, len(route)-1):
-      cdist = route[i+1].distance_to(route[i])
+    for _, _, cdist in route_legs_reversed(route):
       if cdist > dist_threshold:
         penalty += 20
 
@@ -156,35 +164,150 @@ def route_stdev(route, dist):
 def _route_sd_or_var(route, dist, power):
   if len(route) <= 1:
     return 0.0
-  meanjump = dist / (len(route)-1)
+  jcount = len(route)-1
+  meanjump = dist / jcount
+  if isinstance(route, RoutePath) and power in (1, 2):
+    # Expand the sum using the running totals kept on the path
+    if power == 1:
+      return route.jump_sum - jcount * meanjump
+    else:
+      return route.jump_sq_sum - 2 * meanjump * route.jump_sum + jcount * meanjump * meanjump
   cvar = 0.0
-  for i in range(0, len(route)-1):
-    jdist = route[i+1].distance_to(route[i])
+  for _, _, jdist in route_legs(route):
     cvar += math.pow((jdist - meanjump), power)
   return cvar
 
 
-def astar(stars, sys_from, sys_to, valid_neighbour_fn, cost_fn):
+_route_key_multiplier = 1000003
+_route_key_mask = (1 << 64) - 1
+
+def _route_key_step(key, system):
+  return ((key * _route_key_multiplier) ^ hash(system)) & _route_key_mask
+
+# A route stored as a chain of parent pointers, so that extending a route by
+# one system is O(1) and routes sharing a prefix share its nodes
+# Each node caches its depth, a rolling hash of the systems on the route and
+# running jump totals; it behaves enough like a list for the cost functions
+class RoutePath(object):
+  __slots__ = ('system', 'parent', 'first', 'depth', 'key', 'jump', 'jump_sum', 'jump_sq_sum')
+
+  def __init__(self, system, parent = None):
+    self.system = system
+    self.parent = parent
+    if parent is None:
+      self.first = system
+      self.depth = 0
+      self.key = _route_key_step(0, system)
+      self.jump = 0.0
+      self.jump_sum = 0.0
+      self.jump_sq_sum = 0.0
+    else:
+      self.first = parent.first
+      self.depth = parent.depth + 1
+      self.key = _route_key_step(parent.key, system)
+      self.jump = parent.system.distance_to(system)
+      self.jump_sum = parent.jump_sum + self.jump
+      self.jump_sq_sum = parent.jump_sq_sum + self.jump * self.jump
+
+  def extend(self, system):
+    return RoutePath(system, self)
+
+  def __len__(self):
+    return self.depth + 1
+
+  def __reversed__(self):
+    node = self
+    while node is not None:
+      yield node.system
+      node = node.parent
+
+  def __iter__(self):
+    return iter(self.to_list())
+
+  def __getitem__(self, index):
+    if index < 0:
+      index += self.depth + 1
+    if index == 0:
+      return self.first
+    if index < 0 or index > self.depth:
+      raise IndexError("RoutePath index out of range")
+    node = self
+    for _ in range(self.depth - index):
+      node = node.parent
+    return node.system
+
+  def to_list(self):
+    result = list(reversed(self))
+    result.reverse()
+    return result
+
+  def __repr__(self):
+    return "RoutePath({})".format(self.to_list())
+
+# Gets a key identifying the sequence of systems in a route
+def route_key(route):
+  if isinstance(route, RoutePath):
+    return route.key
+  key = 0
+  for s in route:
+    key = _route_key_step(key, s)
+  return key
+
+# Yields (from, to, distance) for each jump in a route, last jump first
+def route_legs_reversed(route):
+  if isinstance(route, RoutePath):
+    node = route
+    while node.parent is not None:
+      yield node.parent.system, node.system, node.jump
+      node = node.parent
+  else:
+    for i in range(len(route)-1, 0, -1):
+      yield route[i-1], route[i], route[i-1].distance_to(route[i])
+
+# Yields (from, to, distance) for each jump in a route, in order
+def route_legs(route):
+  if isinstance(route, RoutePath):
+    legs = list(route_legs_reversed(route))
+    legs.reverse()
+    for leg in legs:
+      yield leg
+  else:
+    for i in range(0, len(route)-1):
+      yield route[i], route[i+1], route[i].distance_to(route[i+1])
+
+
+def astar(stars, sys_from, sys_to, valid_neighbour_fn, cost_fn, neighbour_range = None):
+  # If we know the furthest a valid neighbour can be, index the stars on a grid
+  # of that size so each expansion only has to look at nearby cells
+  grid = spatial.Grid(stars, neighbour_range) if neighbour_range else None
+
   closedset = set()          # The set of nodes already evaluated.
-  openset = set([sys_from])  # The set of tentative nodes to be evaluated, initially containing the start node
-  came_from = dict()
 
   g_score = dict()
   g_score[sys_from] = 0      # Cost from sys_from along best known path.
+  paths = dict()             # Best known path to each node
+  paths[sys_from] = RoutePath(sys_from)
   f_score = dict()
-  f_score[sys_from] = cost_fn(sys_from, sys_to, [sys_from])
+  f_score[sys_from] = cost_fn(sys_from, sys_to, paths[sys_from])
+
+  # The open set is a heap of (f_score, insertion order, node) entries
+  # Improving a node pushes a new entry; stale entries are skipped when popped
+  counter = itertools.count()
+  openheap = [(f_score[sys_from], next(counter), sys_from)]
 
-  while len(openset) > 0:
-    current = min(openset, key=f_score.get)  # the node in openset having the lowest f_score[] value
+  while len(openheap) > 0:
+    f, _, current = heapq.heappop(openheap)
+    if current in closedset or f != f_score[current]:
+      continue
     if current == sys_to:
-      return _astar_reconstruct_path(came_from, sys_to)
+      return paths[sys_to].to_list()
 
-    openset.remove(current)
     closedset.add(current)
 
-    neighbor_nodes = [n for n in stars if valid_neighbour_fn(n, current)]
+    candidates = grid.near(current.position, neighbour_range) if grid is not None else stars
+    neighbor_nodes = [n for n in candidates if valid_neighbour_fn(n, current)]
 
-    path = _astar_reconstruct_path(came_from, current)
+    path = paths[current]
 
     for neighbor in neighbor_nodes:
       if neighbor in closedset:
@@ -196,21 +319,137 @@ def astar(stars, sys_from, sys_to, valid_neighbour_fn, cost_fn):
       # tentative_g_score = g_score[current] + (current.position - neighbor.position).length
       tentative_g_score = g_score[current] + cost
 
-      if neighbor not in g_score:
-        g_score[neighbor] = float('inf')
-
-      if neighbor not in openset or tentative_g_score < g_score[neighbor]:
-        came_from[neighbor] = current
+      if neighbor not in g_score or tentative_g_score < g_score[neighbor]:
+        new_path = path.extend(neighbor)
+        new_f = cost_fn(neighbor, sys_to, new_path)
+        if new_f is None:
+          continue
+        paths[neighbor] = new_path
         g_score[neighbor] = tentative_g_score
-        f_score[neighbor] = cost_fn(neighbor, sys_to, _astar_reconstruct_path(came_from, neighbor))
-        openset.add(neighbor)
+        f_score[neighbor] = new_f
+        heapq.heappush(openheap, (new_f, next(counter), neighbor))
 
   return None
 
-def _astar_reconstruct_path(came_from, current):
-  total_path = [current]
-  while current in came_from:
-      current = came_from[current]
-      total_path.append(current)
-  return list(reversed(total_path))
 
+# A* in its usual form, expanding nodes in order of cost so far plus an
+# estimate of the cost to go; with a heuristic_fn that never overestimates,
+# the result is the cheapest path
+def shortest_path(sys_from, sys_to, neighbours_fn, cost_fn, heuristic_fn):
+  closedset = set()
+  g_score = {sys_from: 0.0}
+  parents = {sys_from: None}
+  counter = itertools.count()
+  openheap = [(heuristic_fn(sys_from), next(counter), sys_from)]
+  while len(openheap) > 0:
+    f, _, current = heapq.heappop(openheap)
+    if current in closedset:
+      continue
+    if current == sys_to:
+      path = []
+      while current is not None:
+        path.append(current)
+        current = parents[current]
+      path.reverse()
+      return path
+    closedset.add(current)
+    for neighbor in neighbours_fn(current):
+      if neighbor in closedset:
+        continue
+      cost = cost_fn(current, neighbor)
+      if cost is None:
+        continue
+      tentative_g_score = g_score[current] + cost
+      if neighbor not in g_score or tentative_g_score < g_score[neighbor]:
+        g_score[neighbor] = tentative_g_score
+        parents[neighbor] = current
+        heapq.heappush(openheap, (tentative_g_score + heuristic_fn(neighbor), next(counter), neighbor))
+  return None
+
+
+# One side of a bidirectional search: the same best-first search as astar,
+# driven one expansion at a time
+class _SearchFrontier(object):
+  def __init__(self, origin, target, cost_fn):
+    self.target = target
+    self.cost_fn = cost_fn
+    self.closedset = set()
+    self.g_score = {origin: 0}
+    self.paths = {origin: RoutePath(origin)}
+    self.f_score = {origin: cost_fn(origin, target, self.paths[origin])}
+    self.counter = itertools.count()
+    self.openheap = [(self.f_score[origin], next(self.counter), origin)]
+
+  def pop(self):
+    while len(self.openheap) > 0:
+      f, _, current = heapq.heappop(self.openheap)
+      if current in self.closedset or f != self.f_score[current]:
+        continue
+      self.closedset.add(current)
+      return current
+    return None
+
+  def relax(self, current, neighbor):
+    # Returns whether neighbor now has a better path through current
+    if neighbor in self.closedset:
+      return False
+    path = self.paths[current]
+    cost = self.cost_fn(current, neighbor, path)
+    if cost is None:
+      return False
+    tentative_g_score = self.g_score[current] + cost
+    if neighbor not in self.g_score or tentative_g_score < self.g_score[neighbor]:
+      new_path = path.extend(neighbor)
+      new_f = self.cost_fn(neighbor, self.target, new_path)
+      if new_f is None:
+        return False
+      self.paths[neighbor] = new_path
+      self.g_score[neighbor] = tentative_g_score
+      self.f_score[neighbor] = new_f
+      heapq.heappush(self.openheap, (new_f, next(self.counter), neighbor))
+      return True
+    return False
+
+
+def bidirectional_astar(stars, sys_from, sys_to, valid_neighbour_fn, cost_fn, reverse_cost_fn, validate_fn = None, neighbour_range = None):
+  # Searches forwards from sys_from and backwards from sys_to, expanding each
+  # side in turn until a system is reached from both. reverse_cost_fn is
+  # given routes which start at sys_to, so can't check anything that depends
+  # on the direction of travel such as fuel; instead each joined-up route is
+  # checked with validate_fn, and the search carries on if it fails
+  if sys_from == sys_to:
+    return [sys_from]
+  grid = spatial.Grid(stars, neighbour_range) if neighbour_range else None
+  forward = _SearchFrontier(sys_from, sys_to, cost_fn)
+  backward = _SearchFrontier(sys_to, sys_from, reverse_cost_fn)
+
+  def join(system):
+    route = forward.paths[system].to_list()
+    back = backward.paths[system].to_list()
+    back.reverse()
+    route += back[1:]
+    if validate_fn is not None and validate_fn(route) is None:
+      return None
+    return route
+
+  sides = (forward, backward)
+  turn = 0
+  while True:
+    side, other = sides[turn], sides[1 - turn]
+    turn = 1 - turn
+    current = side.pop()
+    if current is None:
+      # One side has run out of systems it can reach, so there's no route
+      return None
+    if current in other.paths:
+      route = join(current)
+      if route is not None:
+        return route
+    candidates = grid.near(current.position, neighbour_range) if grid is not None else stars
+    for neighbor in candidates:
+      if not valid_neighbour_fn(neighbor, current):
+        continue
+      if side.relax(current, neighbor) and neighbor in other.paths:
+        route = join(neighbor)
+        if route is not None:
+          return route
@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 
 from __future__ import print_function
+import itertools
 import math
 import sys
 
@@ -17,6 +18,9 @@ log = util.get_logger(app_name)
 default_num = 10
 default_max_angle = 15.0
 
+# The system columns needed to build results
+_result_columns = ('id', 'name', 'x', 'y', 'z', 'id64', 'needs_permit', 'arrival_star_class')
+
 class Result(Opaq):
   def __init__(self, **args):
     self.system = args.get('system')
@@ -87,9 +91,9 @@ class Application(object):
       envdata.find_filtered_systems_from_edsm(filters)
       # Filter out our reference systems from the results
       names = [d['sysobj'].name for d in self._systems]
-      asys = [s for s in envdata.find_all_systems(filters=envdata.convert_filter_object(filters)) if s.name not in names]
+      rows = (r for r in envdata.stream_systems(filters=envdata.convert_filter_object(filters), columns=_result_columns) if r.name not in names)
+      asys = [env.make_known_system_from_row(r) for r in itertools.islice(rows, self._num)]
       if self._num:
-        asys = asys[0:self._num]
 
         stations = {}
         if self._list_stations:
@@ -4,18 +4,24 @@ import math
 import re
 import sqlite3
 import time
+try:
+  from urllib.request import pathname2url
+except ImportError:
+  from urllib import pathname2url
 
 from . import defs
 from . import env_backend as eb
 from . import filtering
+from . import spatial
 from . import util
 from . import vector3
 from .bodies import Star
 from .edsm import EDSMCache, EDSMCacheHit
+from .routecache import RouteCache
 
 log = util.get_logger("db_sqlite3")
 
-schema_version = 12
+schema_version = 16
 
 _find_operators = ['=','LIKE','REGEXP']
 # This is nasty, and it may well not be used up in the main code
@@ -53,6 +59,24 @@ _find_method_systems_entries = [
   'systems.arrival_star_class AS arrival_star_class',
 ]
 
+# The SQL for each column stream_systems can project
+_stream_system_columns = {
+  'id': 'systems.id',
+  'name': 'systems.name',
+  'x': 'systems.pos_x',
+  'y': 'systems.pos_y',
+  'z': 'systems.pos_z',
+  'id64': 'systems.id64',
+  'needs_permit': 'systems.needs_permit',
+  'allegiance': 'systems.allegiance',
+  'arrival_star_class': 'systems.arrival_star_class',
+}
+
+default_stream_batch_size = 2000
+
+# Page cache to use while bulk loading, in KiB
+bulk_load_cache_kib = 256 * 1024
+
 _find_method_stations_entries = [
   'stations.id AS station_id',
   'stations.name AS station_name',
@@ -76,6 +100,29 @@ def _vec3_angle(x1, y1, z1, x2, y2, z2):
   return vector3.Vector3(x1, y1, z1).angle_to(vector3.Vector3(x2, y2, z2))
 
 
+# Keep the R*Tree in step with systems for incremental inserts and updates
+# REPLACE INTO systems only fires the insert trigger, hence INSERT OR REPLACE
+_systems_rtree_row = '(new.id, new.pos_x, new.pos_x, new.pos_y, new.pos_y, new.pos_z, new.pos_z)'
+_systems_rtree_triggers = [
+  'trg_systems_rtree_insert AFTER INSERT ON systems BEGIN INSERT OR REPLACE INTO systems_rtree VALUES {}; END'.format(_systems_rtree_row),
+  'trg_systems_rtree_update AFTER UPDATE OF id, pos_x, pos_y, pos_z ON systems BEGIN DELETE FROM systems_rtree WHERE id = old.id; INSERT OR REPLACE INTO systems_rtree VALUES {}; END'.format(_systems_rtree_row),
+  'trg_systems_rtree_delete AFTER DELETE ON systems BEGIN DELETE FROM systems_rtree WHERE id = old.id; END',
+]
+
+def _spatial_clause(min_x, min_y, min_z, max_x, max_y, max_z):
+  # The R*Tree stores 32-bit floats rounded outwards, so this is a superset
+  # of the exact box; callers still apply their precise tests afterwards
+  return ('systems.id IN (SELECT id FROM systems_rtree WHERE max_x >= ? AND min_x <= ? AND max_y >= ? AND min_y <= ? AND max_z >= ? AND min_z <= ?)',
+          [min_x, max_x, min_y, max_y, min_z, max_z])
+
+
+def _morton_clause(min_x, min_y, min_z, max_x, max_y, max_z):
+  # Used when the R*Tree isn't available; each range is a contiguous scan of idx_systems_morton
+  ranges = spatial.morton_ranges(min_x, min_y, min_z, max_x, max_y, max_z)
+  return ('({})'.format(' OR '.join(['systems.morton BETWEEN ? AND ?'] * len(ranges))) if ranges else '0',
+          [v for r in ranges for v in r])
+
+
 def _list_clause(field, mode, names):
   if mode in [eb.FIND_GLOB, eb.FIND_REGEX]:
     operator = _find_operators[mode]
@@ -84,12 +131,68 @@ def _list_clause(field, mode, names):
     return "{} IN ({})".format(field, ','.join(['?'] * len(names)))
 
 
+def _fetch_batches(c, batch_size = default_stream_batch_size):
+  rows = c.fetchmany(batch_size)
+  while rows:
+    for r in rows:
+      yield r
+    rows = c.fetchmany(batch_size)
+
+
+def _unsafe_names(namelist, mode):
+  names = util.flatten(namelist)
+  if mode == eb.FIND_GLOB and _find_operators[mode] == 'LIKE':
+    names = map(lambda name: name.replace('*','%').replace('?','_'), names)
+  names = map(lambda name: _bad_char_regex.sub("", name), names)
+  names = map(lambda name: name.replace("'", r"''"), names)
+  return list(names)
+
+
+# The systems table row for a system from an EDSM dump or API response
+# A plain function so that import worker processes can use it
+def edsm_system_row(s):
+  coords = s['coords']
+  x, y, z = float(coords['x']), float(coords['y']), float(coords['z'])
+  # Attempt to get the ID64 from the EDSM dump, otherwise fall back to our data
+  if 'id64' in s:
+    id64 = s['id64']
+  else:
+    from . import id64data
+    id64 = id64data.get_id64(s['name'], vector3.Vector3(x, y, z))
+  info = s.get('information', {})
+  # EDSM API sometimes returns [].
+  if not any(info):
+    info = {}
+  primary_star = s.get('primaryStar')
+  if primary_star is not None:
+    classification = Star(primary_star).classification
+  else:
+    classification = None
+  return (int(s['id']), s['name'], x, y, z, id64, s.get('needsPermit'), info.get('allegiance'), classification, spatial.morton_key(x, y, z))
+
+
 def log_versions():
   log.debug("SQLite3: {} / PySQLite: {}", sqlite3.sqlite_version, sqlite3.version)
 
 
-def open_db(filename = defs.default_db_path, check_version = True, use_edsm = 'never'):
-  conn = sqlite3.connect(filename)
+def _connect_read_only(filename):
+  try:
+    conn = sqlite3.connect('file:{}?mode=ro'.format(pathname2url(filename)), uri = True)
+  except TypeError:
+    # Older sqlite3 modules can't open URIs; settle for refusing writes
+    conn = sqlite3.connect(filename)
+  conn.execute('PRAGMA query_only = ON')
+  return conn
+
+
+def open_db(filename = defs.default_db_path, check_version = True, use_edsm = 'never', read_only = False):
+  if read_only and use_edsm != 'never':
+    raise ValueError("Cannot fetch data from EDSM into a read-only DB connection")
+  if read_only:
+    log.debug("Opening read-only DB connection")
+    conn = _connect_read_only(filename)
+  else:
+    conn = sqlite3.connect(filename)
   conn.row_factory = sqlite3.Row
   conn.create_function("REGEXP", 2, _regexp)
   conn.create_function("vec3_angle", 6, _vec3_angle)
@@ -98,14 +201,17 @@ def open_db(filename = defs.default_db_path, check_version = True, use_edsm = 'n
     c = conn.cursor()
     c.execute('SELECT db_version FROM edts_info')
     (db_version, ) = c.fetchone()
-    if db_version != schema_version:
-      log.warning("DB file's schema version {0} does not match the expected version {1}.", db_version, schema_version)
-      log.warning("This is likely to cause errors; you may wish to rebuild the database by running update.py")
   else:
     log.debug("Opening DB connection without checking schema version")
     db_version = 0
+  dbc = SQLite3DBConnection(conn, db_version, use_edsm, filename, read_only = read_only)
+  if check_version and db_version != schema_version and not read_only:
+    db_version = dbc._migrate(db_version)
+    if db_version != schema_version:
+      log.warning("DB file's schema version {0} does not match the expected version {1}.", db_version, schema_version)
+      log.warning("This is likely to cause errors; you may wish to rebuild the database by running update.py")
   log.debug("DB connection opened")
-  return SQLite3DBConnection(conn, db_version, use_edsm)
+  return dbc
 
 
 def initialise_db(filename = defs.default_db_path):
@@ -115,9 +221,11 @@ def initialise_db(filename = defs.default_db_path):
 
 
 class SQLite3DBConnection(eb.EnvBackend):
-  def __init__(self, conn, schema_version, use_edsm):
+  def __init__(self, conn, schema_version, use_edsm, filename = None, read_only = False):
     super(SQLite3DBConnection, self).__init__("db_sqlite3")
     self._conn = conn
+    self._filename = filename
+    self._read_only = read_only
     self._use_edsm = use_edsm
     if use_edsm == 'never':
       self._edsm_cache = None
@@ -127,12 +235,40 @@ class SQLite3DBConnection(eb.EnvBackend):
         args['cache_time'] = 0
       self._edsm_cache = EDSMCache(**args)
     self._schema_version = schema_version
+    self._spatial_index = None
+    self._morton_index = None
+    self._route_cache = None
     self._is_closed = False
 
   @property
   def schema_version(self):
     return self._schema_version
 
+  def _probe(self, query):
+    try:
+      self._conn.execute(query)
+      return True
+    except sqlite3.OperationalError:
+      return False
+
+  @property
+  def spatial_index(self):
+    if self._spatial_index is None:
+      self._spatial_index = self._probe('SELECT id FROM systems_rtree LIMIT 0')
+    return self._spatial_index
+
+  @property
+  def morton_index(self):
+    if self._morton_index is None:
+      self._morton_index = self._probe('SELECT morton FROM systems LIMIT 0')
+    return self._morton_index
+
+  @property
+  def route_cache(self):
+    if self._route_cache is None:
+      self._route_cache = RouteCache(self._conn, read_only = self._read_only) if self._probe('SELECT key FROM route_cache LIMIT 0') else False
+    return self._route_cache
+
   @property
   def closed(self):
     return self._is_closed
@@ -142,6 +278,31 @@ class SQLite3DBConnection(eb.EnvBackend):
     self._is_closed = True
     log.debug("DB connection closed")
 
+  def get_data_version(self):
+    c = self._conn.cursor()
+    c.execute('SELECT db_mtime FROM edts_info')
+    result = c.fetchone()
+    return result[0] if result is not None else None
+
+  def get_sidecar_path(self, suffix):
+    if self._filename is None or self._filename == ':memory:':
+      return None
+    return self._filename + suffix
+
+  def _touch_mtime(self, cursor = None):
+    c = cursor if cursor is not None else self._conn.cursor()
+    c.execute('UPDATE edts_info SET db_mtime = ?', (int(time.time()), ))
+    # Any cached routes may pass through systems which have changed
+    if self.route_cache:
+      self.route_cache.clear(cursor = c)
+
+  def get_cached_route(self, key):
+    return self.route_cache.get(key) if self.route_cache else None
+
+  def cache_route(self, key, data):
+    if self.route_cache:
+      self.route_cache.put(key, data)
+
   def _drop_indices(self, indices, cursor = None, commit = False):
     c = cursor if cursor is not None else self._conn.cursor()
     for index in util.flatten(indices):
@@ -158,16 +319,93 @@ class SQLite3DBConnection(eb.EnvBackend):
     if commit:
       self._conn.commit()
 
+  def _drop_triggers(self, triggers, cursor = None):
+    c = cursor if cursor is not None else self._conn.cursor()
+    for trigger in util.flatten(triggers):
+      name = trigger.split(' ', 1)[0]
+      log.debug("Dropping trigger {}", name)
+      c.execute("DROP TRIGGER IF EXISTS {}".format(name))
+
+  def _create_triggers(self, triggers, cursor = None):
+    c = cursor if cursor is not None else self._conn.cursor()
+    for trigger in util.flatten(triggers):
+      log.debug("Creating trigger {}", trigger.split(' ', 1)[0])
+      c.execute("CREATE TRIGGER IF NOT EXISTS {}".format(trigger))
+
+  def _create_spatial_index(self, cursor = None):
+    c = cursor if cursor is not None else self._conn.cursor()
+    try:
+      c.execute('CREATE VIRTUAL TABLE IF NOT EXISTS systems_rtree USING rtree(id, min_x, max_x, min_y, max_y, min_z, max_z)')
+    except sqlite3.OperationalError as ex:
+      # SQLite may be built without the R*Tree module; everything still works, just slower
+      log.warning("Could not create spatial index, position searches will be slower: {}", ex)
+      self._spatial_index = False
+      return False
+    self._create_triggers(_systems_rtree_triggers, cursor = c)
+    self._spatial_index = True
+    return True
+
+  def _rebuild_spatial_index(self, cursor = None):
+    c = cursor if cursor is not None else self._conn.cursor()
+    log.debug("Going to rebuild systems spatial index...")
+    c.execute('DELETE FROM systems_rtree')
+    c.execute('INSERT INTO systems_rtree SELECT id, pos_x, pos_x, pos_y, pos_y, pos_z, pos_z FROM systems')
+    log.debug("Done, {} rows indexed.", c.rowcount)
+
+  # Upgrades an existing DB one schema version at a time
+  def _migrate(self, db_version):
+    c = self._conn.cursor()
+    while db_version in self._migrations:
+      log.info("Upgrading DB schema from version {} to {}...", db_version, db_version + 1)
+      self._migrations[db_version](self, c)
+      db_version += 1
+      c.execute('UPDATE edts_info SET db_version = ?', (db_version, ))
+      self._conn.commit()
+    self._schema_version = db_version
+    return db_version
+
+  def _migrate_12(self, c):
+    if self._create_spatial_index(cursor = c):
+      self._rebuild_spatial_index(cursor = c)
+
+  def _migrate_13(self, c):
+    self._conn.create_function('morton_key', 3, spatial.morton_key)
+    c.execute('ALTER TABLE systems ADD COLUMN morton INTEGER')
+    c.execute('UPDATE systems SET morton = morton_key(pos_x, pos_y, pos_z)')
+    self._create_indices('idx_systems_morton ON systems (morton, pos_x, pos_y, pos_z)', cursor = c)
+    self._morton_index = True
+
+  def _migrate_14(self, c):
+    self._create_route_cache(cursor = c)
+    self._route_cache = None
+
+  def _migrate_15(self, c):
+    c.execute('ALTER TABLE edts_info ADD COLUMN systems_watermark TEXT')
+
+  _migrations = {
+    12: _migrate_12,
+    13: _migrate_13,
+    14: _migrate_14,
+    15: _migrate_15,
+  }
+
+  def _create_route_cache(self, cursor = None):
+    c = cursor if cursor is not None else self._conn.cursor()
+    c.execute('CREATE TABLE IF NOT EXISTS route_cache (key TEXT NOT NULL PRIMARY KEY, route TEXT NOT NULL, last_used REAL NOT NULL)')
+    self._create_indices('idx_route_cache_last_used ON route_cache (last_used)', cursor = c)
+
   def _create_tables(self):
     log.debug("Creating tables...")
     c = self._conn.cursor()
-    c.execute('CREATE TABLE edts_info (db_version INTEGER, db_mtime INTEGER NOT NULL)')
-    c.execute('INSERT INTO edts_info VALUES (?, ?)', (schema_version, int(time.time())))
+    c.execute('CREATE TABLE edts_info (db_version INTEGER, db_mtime INTEGER NOT NULL, systems_watermark TEXT)')
+    c.execute('INSERT INTO edts_info VALUES (?, ?, NULL)', (schema_version, int(time.time())))
 
-    c.execute('CREATE TABLE systems (id INTEGER PRIMARY KEY, name TEXT COLLATE NOCASE NOT NULL, pos_x REAL NOT NULL, pos_y REAL NOT NULL, pos_z REAL NOT NULL, id64 INTEGER, needs_permit BOOLEAN, allegiance TEXT, arrival_star_class TEXT)')
+    c.execute('CREATE TABLE systems (id INTEGER PRIMARY KEY, name TEXT COLLATE NOCASE NOT NULL, pos_x REAL NOT NULL, pos_y REAL NOT NULL, pos_z REAL NOT NULL, id64 INTEGER, needs_permit BOOLEAN, allegiance TEXT, arrival_star_class TEXT, morton INTEGER)')
     c.execute('CREATE TABLE stations (id INTEGER PRIMARY KEY, system_id INTEGER NOT NULL, name TEXT COLLATE NOCASE NOT NULL, sc_distance INTEGER, station_type TEXT, max_pad_size TEXT, has_refuel BOOLEAN, is_planetary BOOLEAN)')
     c.execute('CREATE TABLE coriolis_fsds (id TEXT NOT NULL PRIMARY KEY, data TEXT NOT NULL)')
     c.execute('CREATE TABLE edsm_cache (id INTEGER PRIMARY KEY, api TEXT NOT NULL, endpoint TEXT NOT NULL, name TEXT COLLATE NOCASE NOT NULL, timestamp INTEGER NOT NULL)')
+    self._create_route_cache(cursor = c)
+    self._create_spatial_index(cursor = c)
 
     self._conn.commit()
     log.debug("Done.")
@@ -178,21 +416,8 @@ class SQLite3DBConnection(eb.EnvBackend):
   # ###
 
   def _generate_systems_edsm(self, systems):
-    from . import id64data
     for s in systems:
-      pos = vector3.Vector3(float(s['coords']['x']), float(s['coords']['y']), float(s['coords']['z']))
-      # Attempt to get the ID64 from the EDSM dump, otherwise fall back to our data
-      id64 = s.get('id64', id64data.get_id64(s['name'], pos))
-      info = s.get('information', {})
-      # EDSM API sometimes returns [].
-      if not any(info):
-        info = {}
-      primary_star = s.get('primaryStar')
-      if primary_star is not None:
-        classification = Star(s.get('primaryStar', {})).classification
-      else:
-        classification = None
-      yield (int(s['id']), s['name'], pos.x, pos.y, pos.z, id64, s.get('needsPermit'), info.get('allegiance'), classification)
+      yield edsm_system_row(s)
 
   def _generate_stations_edsm(self, stations):
     for s in stations:
@@ -212,34 +437,110 @@ class SQLite3DBConnection(eb.EnvBackend):
       yield ('{0}{1}'.format(fsd['class'], fsd['rating']), json.dumps(fsd))
 
   def insert_or_replace_systems_edsm(self, many, cursor = None, mode = 'INSERT'):
+    self.insert_or_replace_system_rows(self._generate_systems_edsm(many), cursor, mode)
+
+  def insert_or_replace_system_rows(self, rows, cursor = None, mode = 'INSERT'):
     c = cursor if cursor is not None else self._conn.cursor()
     log.debug('Going for {} INTO systems...', mode)
-    c.executemany('{} INTO systems VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)'.format(mode), self._generate_systems_edsm(many))
+    c.executemany('{} INTO systems VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)'.format(mode), rows)
+    # Including systems fetched from EDSM, which may have moved or changed
+    self._touch_mtime(cursor = c)
     self._conn.commit()
 
+  # For bulk loads into a new DB, which is thrown away or picked up again from
+  # its last commit if anything goes wrong: keep the rollback journal in
+  # memory, so that a failed batch can still be rolled back, and skip
+  # syncing to disk for this connection
+  def enable_bulk_load(self):
+    log.debug("Using in-memory journal and no sync for bulk load")
+    c = self._conn.cursor()
+    c.execute('PRAGMA journal_mode = MEMORY')
+    c.execute('PRAGMA synchronous = OFF')
+    c.execute('PRAGMA cache_size = -{}'.format(bulk_load_cache_kib))
+
   def populate_table_systems(self, many, drop_indices = False):
+    self.populate_table_system_rows(self._generate_systems_edsm(many), drop_indices)
+
+  # rows as made by edsm_system_row; with batches set, rows is instead an
+  # iterable of lists of rows, each committed before the next is fetched
+  def populate_table_system_rows(self, rows, drop_indices = False, batches = False):
     c = self._conn.cursor()
     if drop_indices:
       self._drop_indices([
         'idx_systems_name',
         'idx_systems_pos',
         'idx_systems_id',
-        'idx_systems_id64'
+        'idx_systems_id64',
+        'idx_systems_morton'
       ], cursor = c)
-    self.insert_or_replace_systems_edsm(many, cursor = c, mode = 'REPLACE')
-    self._conn.commit()
-    log.debug("Done, {} rows inserted.", c.rowcount)
-    log.debug("Going to add indexes to systems for name, pos_x/pos_y/pos_z, id...")
+      # Maintaining the R*Tree row by row is slow; rebuild it in one go afterwards
+      if self.spatial_index:
+        self._drop_triggers(_systems_rtree_triggers, cursor = c)
+    if batches:
+      for batch in rows:
+        self.insert_or_replace_system_rows(batch, cursor = c, mode = 'REPLACE')
+    else:
+      self.insert_or_replace_system_rows(rows, cursor = c, mode = 'REPLACE')
+      log.debug("Done, {} rows inserted.", c.rowcount)
+    if drop_indices and self.spatial_index:
+      self._rebuild_spatial_index(cursor = c)
+      self._create_triggers(_systems_rtree_triggers, cursor = c)
+      self._conn.commit()
+    log.debug("Going to add indexes to systems for name, pos_x/pos_y/pos_z, id, morton...")
     self._create_indices([
       'idx_systems_name ON systems (name COLLATE NOCASE)',
       'idx_systems_pos ON systems (pos_x, pos_y, pos_z)',
       'idx_systems_id ON systems (id)',
+      # Covering, so Morton range scans read positions without visiting the table
+      'idx_systems_morton ON systems (morton, pos_x, pos_y, pos_z)',
     ], cursor = c)
     self._create_indices('idx_systems_id64 ON systems (id64)', cursor = c)
     self._create_indices('idx_edsm_cache_entry ON edsm_cache (api, endpoint, name)', unique = True, cursor = c)
     self._conn.commit()
     log.debug("Indexes added.")
 
+  # For starting an interrupted clean import of systems again from scratch
+  def clear_table_systems(self):
+    c = self._conn.cursor()
+    c.execute('DELETE FROM systems')
+    self._touch_mtime(cursor = c)
+    self._conn.commit()
+
+  def check_integrity(self):
+    c = self._conn.cursor()
+    c.execute('PRAGMA quick_check')
+    return c.fetchone()[0] == 'ok'
+
+  # For applying changed systems to a populated DB: indexes, triggers and the
+  # spatial index all stay in place and are kept up to date row by row
+  def upsert_system_rows(self, rows):
+    c = self._conn.cursor()
+    if sqlite3.sqlite_version_info >= (3, 24, 0):
+      # Update rows in place, rather than deleting and reinserting them as REPLACE does
+      columns = ['name', 'pos_x', 'pos_y', 'pos_z', 'id64', 'needs_permit', 'allegiance', 'arrival_star_class', 'morton']
+      log.debug('Going for upsert INTO systems...')
+      c.executemany('INSERT INTO systems VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) ON CONFLICT(id) DO UPDATE SET {}'.format(', '.join('{0}=excluded.{0}'.format(col) for col in columns)), rows)
+      count = c.rowcount
+      self._touch_mtime(cursor = c)
+      self._conn.commit()
+    else:
+      self.insert_or_replace_system_rows(rows, cursor = c, mode = 'REPLACE')
+      count = c.rowcount
+    log.debug("Done, {} rows upserted.", count)
+    return count
+
+  # The date of the newest change applied by a delta update, as EDSM formats it
+  def get_systems_watermark(self):
+    c = self._conn.cursor()
+    c.execute('SELECT systems_watermark FROM edts_info')
+    result = c.fetchone()
+    return result[0] if result is not None else None
+
+  def set_systems_watermark(self, watermark):
+    c = self._conn.cursor()
+    c.execute('UPDATE edts_info SET systems_watermark = ?', (watermark, ))
+    self._conn.commit()
+
   def update_table_systems_with_id64(self):
     from . import id64data
     get_id64 = lambda s, x, y, z: id64data.get_id64(s, vector3.Vector3(x, y, z))
@@ -247,8 +548,9 @@ class SQLite3DBConnection(eb.EnvBackend):
     c = self._conn.cursor()
     log.debug("Going for UPDATE systems for ID64 data...")
     c.execute('UPDATE systems SET id64=get_id64(systems.name,systems.pos_x,systems.pos_y,systems.pos_z)')
-    self._conn.commit()
     log.debug("Done, {} rows affected.", c.rowcount)
+    self._touch_mtime(cursor = c)
+    self._conn.commit()
 
   def insert_or_replace_stations_edsm(self, many, cursor = None, mode = 'INSERT'):
     c = cursor if cursor is not None else self._conn.cursor()
@@ -503,7 +805,8 @@ class SQLite3DBConnection(eb.EnvBackend):
       ['stations.system_id IN ({})'.format(','.join(['?'] * len(sysids)))],
       [],
       sysids,
-      filters)
+      filters,
+      spatial_index = self.spatial_index)
     log.debug("Executing: {}; params = {}", cmd, params)
     c.execute(cmd, params)
     results = c.fetchall()
@@ -512,13 +815,23 @@ class SQLite3DBConnection(eb.EnvBackend):
 
   def find_systems_by_aabb(self, min_x, min_y, min_z, max_x, max_y, max_z, filters = None):
     c = self._conn.cursor()
+    qfilter = ['? <= systems.pos_x', 'systems.pos_x < ?', '? <= systems.pos_y', 'systems.pos_y < ?', '? <= systems.pos_z', 'systems.pos_z < ?']
+    qparams = [min_x, max_x, min_y, max_y, min_z, max_z]
+    if self.spatial_index or self.morton_index:
+      # Stop the planner preferring idx_systems_pos, which only narrows on X
+      qfilter = [clause.replace('systems.', '+systems.') for clause in qfilter]
+      clause_fn = _spatial_clause if self.spatial_index else _morton_clause
+      clause, clause_params = clause_fn(min_x, min_y, min_z, max_x, max_y, max_z)
+      qfilter = [clause] + qfilter
+      qparams = clause_params + qparams
     cmd, params = _construct_query(
       ['systems'],
       _find_method_systems_entries,
-      ['? <= systems.pos_x', 'systems.pos_x < ?', '? <= systems.pos_y', 'systems.pos_y < ?', '? <= systems.pos_z', 'systems.pos_z < ?'],
+      qfilter,
       [],
-      [min_x, max_x, min_y, max_y, min_z, max_z],
-      filters)
+      qparams,
+      filters,
+      spatial_index = self.spatial_index)
     log.debug("Executing: {}; params = {}", cmd, params)
     c.execute(cmd, params)
     results = c.fetchall()
@@ -547,7 +860,8 @@ class SQLite3DBConnection(eb.EnvBackend):
       [_list_clause('systems.name', mode, names)],
       [],
       names,
-      filters)
+      filters,
+      spatial_index = self.spatial_index)
     log.debug("Executing: {}; params = {}", cmd, params)
     c.execute(cmd, params)
     result = c.fetchone()
@@ -566,7 +880,8 @@ class SQLite3DBConnection(eb.EnvBackend):
       ['stations.name {} ?'.format(_find_operators[mode])],
       [],
       [name],
-      filters)
+      filters,
+      spatial_index = self.spatial_index)
     log.debug("Executing: {}; params = {}", cmd, params)
     c.execute(cmd, params)
     result = c.fetchone()
@@ -583,7 +898,8 @@ class SQLite3DBConnection(eb.EnvBackend):
       ["systems.id64 IN ({})".format(','.join(['?'] * len(id64list)))],
       [],
       id64list,
-      filters)
+      filters,
+      spatial_index = self.spatial_index)
     log.debug("Executing: {}; params = {}", cmd, params)
     c.execute(cmd, params)
     result = c.fetchone()
@@ -599,12 +915,7 @@ class SQLite3DBConnection(eb.EnvBackend):
   # So, these methods are fast but vulnerable to SQL injection due to use of string literals
   # This will hopefully be unnecessary in Python 2.7.11+ / 3.6.0+ if porting of a newer pysqlite2 version is completed
   def find_systems_by_name_unsafe(self, namelist, mode=eb.FIND_EXACT, filters = None):
-    names = util.flatten(namelist)
-    if mode == eb.FIND_GLOB and _find_operators[mode] == 'LIKE':
-      names = map(lambda name: name.replace('*','%').replace('?','_'), names)
-    names = map(lambda name: _bad_char_regex.sub("", name), names)
-    names = map(lambda name: name.replace("'", r"''"), names)
-    names = list(names)
+    names = _unsafe_names(namelist, mode)
     c = self._conn.cursor()
     cmd, params = _construct_query(
       ['systems'],
@@ -612,7 +923,8 @@ class SQLite3DBConnection(eb.EnvBackend):
       [_list_clause('systems.name', mode, names)],
       [],
       names,
-      filters)
+      filters,
+      spatial_index = self.spatial_index)
     log.debug("Executing (U): {}; params = {}", cmd, params)
     c.execute(cmd, params)
     result = c.fetchone()
@@ -632,7 +944,8 @@ class SQLite3DBConnection(eb.EnvBackend):
       ["stations.name {} '{}'".format(_find_operators[mode], name)],
       [],
       [],
-      filters)
+      filters,
+      spatial_index = self.spatial_index)
     c = self._conn.cursor()
     log.debug("Executing (U): {}; params = {}", cmd, params)
     c.execute(cmd, params)
@@ -651,14 +964,13 @@ class SQLite3DBConnection(eb.EnvBackend):
       [],
       [],
       [],
-      filters)
+      filters,
+      spatial_index = self.spatial_index)
     log.debug("Executing: {}; params = {}", cmd, params)
     c.execute(cmd, params)
-    result = c.fetchone()
     log.debug("Done.")
-    while result is not None:
+    for result in _fetch_batches(c):
       yield _process_system_result(result)
-      result = c.fetchone()
 
   # Slow as sin; avoid if at all possible
   def find_all_stations(self, filters = None):
@@ -669,14 +981,48 @@ class SQLite3DBConnection(eb.EnvBackend):
       [],
       [],
       [],
-      filters) 
+      filters,
+      spatial_index = self.spatial_index)
     log.debug("Executing: {}; params = {}", cmd, params)
     c.execute(cmd, params)
-    result = c.fetchone()
     log.debug("Done.")
-    while result is not None:
+    for result in _fetch_batches(c):
       yield (_process_system_result(result), _process_station_result(result))
-      result = c.fetchone()
+
+  # Much quicker than find_all_systems: rows are plain namedtuples of only the
+  # requested columns, fetched batch_size at a time
+  def stream_systems(self, filters = None, columns = None, batch_size = None):
+    return self._stream_systems([], [], filters, columns, batch_size)
+
+  def stream_systems_by_name(self, namelist, mode = eb.FIND_EXACT, filters = None, columns = None, batch_size = None):
+    # Names are inlined in the same way as find_systems_by_name_unsafe
+    names = _unsafe_names(namelist, mode)
+    return self._stream_systems([_list_clause('systems.name', mode, names)], names, filters, columns, batch_size)
+
+  def _stream_systems(self, qfilter, filter_params, filters, columns, batch_size):
+    row_type = eb.system_row_type(columns)
+    c = self._conn.cursor()
+    c.row_factory = None
+    cmd, params = _construct_query(
+      ['systems'],
+      [_stream_system_columns[col] for col in row_type._fields],
+      qfilter,
+      [],
+      filter_params,
+      filters,
+      spatial_index = self.spatial_index)
+    log.debug("Executing: {}; params = {}", cmd, params)
+    c.execute(cmd, params)
+    log.debug("Done.")
+    width = len(row_type._fields)
+    make = row_type._make
+    # Filters may add columns of their own (e.g. distances to sort by) after ours
+    if len(c.description) > width:
+      for result in _fetch_batches(c, batch_size or default_stream_batch_size):
+        yield make(result[:width])
+    else:
+      for result in _fetch_batches(c, batch_size or default_stream_batch_size):
+        yield make(result)
 
   def get_populated_systems(self):
     c = self._conn.cursor()
@@ -690,7 +1036,7 @@ class SQLite3DBConnection(eb.EnvBackend):
       result = c.fetchone()
 
 
-def _construct_query(qtables, select, qfilter, select_params = None, filter_params = None, filters = None):
+def _construct_query(qtables, select, qfilter, select_params = None, filter_params = None, filters = None, spatial_index = False):
   select_params = select_params or []
   filter_params = filter_params or []
   tables = qtables
@@ -698,7 +1044,7 @@ def _construct_query(qtables, select, qfilter, select_params = None, filter_para
   qmodifier_params = []
   # Apply any user-defined filters
   if filters:
-    fsql = filtering.generate_sql(filters)
+    fsql = filtering.generate_sql(filters, spatial_index)
     tables = set(qtables + fsql['tables'])
     select = select + fsql['select'][0]
     qfilter = qfilter + fsql['filter'][0]
@@ -719,8 +1065,11 @@ def _construct_query(qtables, select, qfilter, select_params = None, filter_para
     if any(fsql['order'][0]):
       qmodifier.append('ORDER BY {}'.format(', '.join(fsql['order'][0])))
       qmodifier_params += fsql['order'][1]
+    # A parameter, so that queries differing only in their limit share a
+    # prepared statement in sqlite3's statement cache
     if fsql['limit']:
-      qmodifier.append('LIMIT {}'.format(fsql['limit']))
+      qmodifier.append('LIMIT ?')
+      qmodifier_params.append(fsql['limit'])
   else:
     # Still need to check this
     if 'stations' in tables and 'systems' in tables:
@@ -8,6 +8,7 @@ from . import calc
 from . import env
 from . import pgnames
 from . import util
+from . import vecarray
 from .dist import Lightyears
 from .opaque_types import Location, Opaq
 
@@ -21,6 +22,17 @@ class Result(Opaq):
     self.destination = args.get('destination')
     self.distance = args.get('distance', Lightyears(0))
 
+# One row of a distance matrix: distances in LY from origin to every system,
+# in the same order as the rows; a numpy array if numpy is available
+class MatrixRow(Opaq):
+  def __init__(self, **args):
+    self.origin = args.get('origin')
+    self.distances = args.get('distances', [])
+
+  def to_opaq(self):
+    distances = self.distances.tolist() if hasattr(self.distances, 'tolist') else self.distances
+    return {'origin': self.origin, 'distances': distances}
+
 class Application(object):
 
   def __init__(self, **args):
@@ -29,6 +41,9 @@ class Application(object):
     self._ordered = args.get('ordered')
     self._route = args.get('route')
     self._systems = args.get('systems')
+    self._matrix = args.get('matrix')
+    # The systems of a distance matrix, in row order, once run has started
+    self.matrix_systems = None
 
   def run(self):
     with env.use() as envdata:
@@ -75,7 +90,7 @@ class Application(object):
 
     else:
       # If we have many systems, generate a Raikogram
-      if len(self._systems) > 2 or self._csv:
+      if len(self._systems) > 2 or self._csv or self._matrix:
 
         if not self._ordered:
           # Remove duplicates
@@ -85,6 +100,11 @@ class Application(object):
           # Sort alphabetically
           self._systems.sort()
 
+        if self._matrix:
+          for row in self._matrix_rows([systems[s] for s in self._systems]):
+            yield row
+          return
+
         for x in self._systems:
           sobjx = systems[x]
           for y in self._systems:
@@ -93,3 +113,12 @@ class Application(object):
 
       else:
         raise RuntimeError("For a simple distance calculation, at least two system names must be provided!")
+
+  def _matrix_rows(self, sobjs):
+    # One vectorised pass over the coordinates, a block of rows at a time,
+    # rather than a Result for every pair
+    self.matrix_systems = sobjs
+    points = vecarray.coords(sobjs)
+    for start, block in vecarray.distance_matrix_blocks(points):
+      for i, distances in enumerate(block):
+        yield MatrixRow(origin = Location(system = sobjs[start + i]), distances = distances)
@@ -0,0 +1,219 @@
+import hashlib
+import json
+import os
+import zlib
+
+from . import util
+
+log = util.get_logger("download")
+
+# Bytes downloaded between journal updates
+checkpoint_bytes = 16 * 1024 * 1024
+block_size = 1024 * 1024
+
+
+# Downloads are written to <path>.part, with a journal in <path>.part.json
+# recording how much of which URL has safely reached the disk. A later
+# download of the same URL continues from there with an HTTP Range request,
+# provided the server still has the same file. Completed files are verified
+# as they download, and their SHA-256 is recorded in <path>.sha256 so they can
+# be checked again before being imported without decompressing them again
+
+def part_path(path):
+  return path + '.part'
+
+def journal_path(path):
+  return path + '.part.json'
+
+def manifest_path(path):
+  return path + '.sha256'
+
+
+def load_json(path):
+  try:
+    with open(path, 'r') as f:
+      return json.load(f)
+  except (IOError, OSError, ValueError):
+    return None
+
+def save_json(path, data):
+  tmp = path + '.tmp'
+  with open(tmp, 'w') as f:
+    json.dump(data, f)
+  if os.path.exists(path):
+    os.unlink(path)
+  os.rename(tmp, path)
+
+def _remove(path):
+  if os.path.exists(path):
+    os.unlink(path)
+
+
+def _total_length(response):
+  info = response.info()
+  if response.getcode() == 206:
+    # Content-Range: bytes <start>-<end>/<total>
+    total = (info.get('Content-Range') or '').rpartition('/')[2]
+    return int(total) if total.isdigit() else None
+  length = info.get('Content-Length')
+  return int(length) if length is not None and length.isdigit() else None
+
+
+def fetch(url, path, allow_no_ssl = False):
+  part = part_path(path)
+  journal = load_json(journal_path(path))
+  if journal is None or journal.get('url') != url or not os.path.isfile(part):
+    journal = {'url': url, 'offset': 0, 'length': None, 'validator': None}
+  journal['offset'] = min(journal['offset'], os.path.getsize(part)) if os.path.isfile(part) else 0
+
+  checker = _Checker(path.endswith('.gz'))
+  if journal['length'] is None or journal['offset'] < journal['length']:
+    headers = {}
+    if journal['offset']:
+      headers['Range'] = 'bytes={}-'.format(journal['offset'])
+      if journal['validator']:
+        # Only resume if the file hasn't changed, otherwise we get all of it again
+        headers['If-Range'] = journal['validator']
+    response = util.open_url(url, allow_gzip = False, allow_no_ssl = allow_no_ssl, headers = headers)
+    if response is None:
+      return None
+    if journal['offset'] and response.getcode() == 206:
+      log.info("Resuming download of {} from byte {}", url, journal['offset'])
+    else:
+      journal['offset'] = 0
+    info = response.info()
+    journal['length'] = _total_length(response)
+    journal['validator'] = info.get('ETag') or info.get('Last-Modified')
+    save_json(journal_path(path), journal)
+    if not _download(response, part, journal, path, checker):
+      return None
+  else:
+    # Finished downloading last time, but wasn't checked
+    _check_file(checker, part)
+
+  if journal['length'] is not None and journal['offset'] != journal['length']:
+    log.error("Download of {} stopped after {} of {} bytes; run again to resume it", url, journal['offset'], journal['length'])
+    return None
+  digest = checker.digest()
+  if digest is None:
+    log.error("Downloaded file {} is corrupt; discarding it", part)
+    _remove(part)
+    _remove(journal_path(path))
+    return None
+  with open(manifest_path(path), 'w') as f:
+    f.write('{}  {}\n'.format(digest, os.path.basename(path)))
+  _remove(path)
+  os.rename(part, path)
+  _remove(journal_path(path))
+  return path
+
+
+def _download(response, part, journal, path, checker):
+  since_checkpoint = 0
+  with open(part, 'r+b' if journal['offset'] else 'wb') as f:
+    # The checks have to start from the beginning of the file
+    _check_file(checker, f, journal['offset'])
+    f.seek(journal['offset'])
+    f.truncate()
+    try:
+      while True:
+        data = util.read_stream_block(response, block_size)
+        if not data:
+          break
+        f.write(data)
+        checker.update(data)
+        journal['offset'] += len(data)
+        since_checkpoint += len(data)
+        if since_checkpoint >= checkpoint_bytes:
+          f.flush()
+          os.fsync(f.fileno())
+          save_json(journal_path(path), journal)
+          since_checkpoint = 0
+    except Exception as ex:
+      log.error("Download interrupted: {}", ex)
+      return False
+    finally:
+      f.flush()
+      os.fsync(f.fileno())
+      save_json(journal_path(path), journal)
+  return True
+
+
+# The SHA-256 of data fed to it a block at a time, or None if it is gzip data
+# which doesn't decompress cleanly; every member of a multi-member file is
+# checked
+class _Checker(object):
+  def __init__(self, is_gzip):
+    self._sha = hashlib.sha256()
+    self._is_gzip = is_gzip
+    self._inflater = None
+    self._failed = False
+
+  def update(self, data):
+    self._sha.update(data)
+    try:
+      while self._is_gzip and not self._failed and data:
+        if self._inflater is None:
+          self._inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        self._inflater.decompress(data)
+        data = self._inflater.unused_data
+        # Anything after the end of a member starts another
+        if data or getattr(self._inflater, 'eof', False):
+          self._inflater = None
+    except zlib.error as ex:
+      log.debug("Failed to decompress: {}", ex)
+      self._failed = True
+
+  def digest(self):
+    if self._failed:
+      return None
+    if self._inflater is not None and not getattr(self._inflater, 'eof', True):
+      # A truncated final member never reaches its end
+      log.debug("Data ends part way through a gzip member")
+      return None
+    return self._sha.hexdigest()
+
+
+# Feeds the file (a path, or an open file from its start) to checker, up to length bytes
+def _check_file(checker, f, length = None):
+  if not hasattr(f, 'read'):
+    with open(f, 'rb') as f:
+      return _check_file(checker, f, length)
+  f.seek(0)
+  while length is None or length > 0:
+    data = f.read(block_size if length is None else min(block_size, length))
+    if not data:
+      break
+    checker.update(data)
+    if length is not None:
+      length -= len(data)
+
+
+def verify_data(path, is_gzip):
+  checker = _Checker(is_gzip)
+  try:
+    _check_file(checker, path)
+  except (IOError, OSError) as ex:
+    log.debug("Failed to read {}: {}", path, ex)
+    return None
+  return checker.digest()
+
+
+# Checks a local data file against the SHA-256 recorded when it was downloaded;
+# without one, all that can be checked is that a gzip file decompresses
+def verify(path):
+  expected = None
+  if os.path.isfile(manifest_path(path)):
+    with open(manifest_path(path), 'r') as f:
+      expected = f.read().split(' ', 1)[0].strip()
+  if expected is None and not path.endswith('.gz'):
+    return True
+  # The file was checked when the manifest was written, so it only needs to be the same file
+  digest = verify_data(path, expected is None)
+  if digest is None:
+    log.error("{} is corrupt", path)
+    return False
+  if expected is not None and digest != expected:
+    log.error("{} does not match the checksum recorded when it was downloaded", path)
+    return False
+  return True
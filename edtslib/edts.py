@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 
 from __future__ import print_function
+import multiprocessing
 from .opaque_types import Opaq
 from . import env
 from . import calc
@@ -24,6 +25,9 @@ default_diff_limit = 1.5
 default_fuel_strategy = rx.default_fuel_strategy
 default_hbuffer = rx.default_hbuffer_ly
 default_initial_cargo = 0
+default_jobs = 1
+# Upper limit on jobs besides the number of CPUs, for servers to set
+max_jobs = None
 default_jump_decay = 0.0
 default_pad_size = 'M'
 default_rbuffer = rx.default_rbuffer_ly
@@ -33,6 +37,20 @@ default_solve_mode = solver.CLUSTERED
 default_tolerance = 5
 default_ws_time = calc.default_ws_time
 
+# Legs are plotted in worker processes when --jobs is given; each worker has
+# its own copy of the Routing object and a read-only environment
+_worker_routing = None
+
+def _init_plot_worker(routing):
+  global _worker_routing
+  env.start_worker()
+  _worker_routing = routing
+
+def _plot_leg(leg):
+  log.debug("Doing route plot for {0} --> {1}", leg[0].name, leg[1].name)
+  return _worker_routing.plot(*leg)
+
+
 class Result(Opaq):
   def __init__(self, **args):
     self.destination = args.get('destination')
@@ -60,6 +78,7 @@ class Application(object):
     self._hbuffer = args.get('hbuffer', default_hbuffer)
     self._initial_cargo = args.get('initial_cargo', default_initial_cargo)
     self._jump_decay = args.get('jump_decay', default_jump_decay)
+    self._jobs = args.get('jobs', default_jobs)
     self._jump_range = args.get('jump_range')
     self._long_jumps = args.get('long_jumps')
     self._num_jumps = args.get('num_jumps')
@@ -71,6 +90,7 @@ class Application(object):
     self._route_filters = args.get('route_filters')
     self._route_set = args.get('route_set')
     self._route_strategy = args.get('route_strategy', default_route_strategy)
+    self._route_cache = args.get('route_cache', True)
     self._slf = args.get('slf', default_slf)
     self._solve_mode = args.get('solve_mode', default_solve_mode)
     self._ship = args.get('ship')
@@ -86,6 +106,25 @@ class Application(object):
       if self._tolerance < 0 or self._tolerance > 100:
         raise RuntimeError("Tolerance must be in range 0 to 100 (percent)!")
 
+    if self._jobs is None:
+      self._jobs = default_jobs
+    try:
+      self._jobs = int(self._jobs)
+    except (TypeError, ValueError):
+      raise RuntimeError("Number of jobs must be a whole number!")
+    if self._jobs < 1:
+      raise RuntimeError("Number of jobs must be at least 1!")
+    # More processes than CPUs can't plot any faster
+    try:
+      job_limit = multiprocessing.cpu_count()
+    except NotImplementedError:
+      job_limit = 1
+    if max_jobs is not None:
+      job_limit = min(job_limit, max_jobs)
+    if self._jobs > job_limit:
+      log.debug("Limiting number of jobs from {} to {}", self._jobs, job_limit)
+      self._jobs = max(1, job_limit)
+
     if self._ship is not None:
       if not isinstance(self._ship, ship.Ship):
         self._ship = ship.Ship.from_args(**self._ship)
@@ -202,7 +241,7 @@ class Application(object):
       full_jump_range = self._ship.range()
       jump_range = self._ship.max_range() if self._long_jumps else full_jump_range
 
-    r = rx.Routing(self._ship, self._rbuffer, self._hbuffer, self._route_strategy, self._fuel_strategy, witchspace_time=self._witchspace_time, starting_fuel = self.starting_fuel, jump_range = self._jump_range)
+    r = rx.Routing(self._ship, self._rbuffer, self._hbuffer, self._route_strategy, self._fuel_strategy, witchspace_time=self._witchspace_time, starting_fuel = self.starting_fuel, jump_range = self._jump_range, use_cache = self._route_cache)
     s = solver.Solver(jump_range, self._diff_limit, witchspace_time=self._witchspace_time)
 
     if len(tours) == 1:
@@ -222,27 +261,16 @@ class Application(object):
 
     if route is not None and len(route) > 0:
       output_data.append({'src': route[0].to_string()})
+      if self._route:
+        leg_routes = self.plot_legs(r, route, avoid, route_filters, envdata)
 
       for i in range(1, len(route)):
         cur_data = {'src': route[i-1], 'dst': route[i]}
-        cargo = self._initial_cargo + self._cargo * (i-1)
-
-        if self._jump_range is not None:
-          full_max_jump = self._jump_range - (self._jump_decay * (i-1))
-          cur_max_jump = full_max_jump
-        else:
-          full_max_jump = self._ship.range(cargo = cargo)
-          cur_max_jump = self._ship.max_range(cargo = cargo) if self._long_jumps else full_max_jump
+        cargo, full_max_jump, cur_max_jump = self.leg_ranges(i)
 
         cur_data['jumpcount_min'], cur_data['jumpcount_max'] = calc.jump_count_range(route[i-1], route[i], cur_max_jump, slf=self._slf)
         if self._route:
-          envdata.find_intermediate_systems_from_edsm(route[i-1].system.position, route[i].system.position)
-          log.debug("Doing route plot for {0} --> {1}", route[i-1].system_name, route[i].system_name)
-          if route[i-1].system != route[i].system and cur_data['jumpcount_max'] > 1:
-            leg_route = r.plot(route[i-1].system, route[i].system, avoid, cur_max_jump, full_max_jump, cargo, route_filters)
-          else:
-            leg_route = [route[i-1].system, route[i].system]
-
+          leg_route = leg_routes[i]
           if leg_route is not None:
             route_jcount = len(leg_route)-1
             # For hoppy routes, always use stats for the jumps reported (less confusing)
@@ -352,6 +380,50 @@ class Application(object):
         else:
           yield Result(origin = Location(system = od['src'].system, station = od['src'] if od['src'].name is not None else None), destination = Location(system = od['dst'].system, station = od['dst'] if od['dst'].name is not None else None), distance = wp.direct, fuel = None, summary = summary, waypoint = wp)
 
+  def leg_ranges(self, i):
+    # The cargo carried and the jump ranges available on leg i of the route
+    cargo = self._initial_cargo + self._cargo * (i-1)
+    if self._jump_range is not None:
+      full_max_jump = self._jump_range - (self._jump_decay * (i-1))
+      cur_max_jump = full_max_jump
+    else:
+      full_max_jump = self._ship.range(cargo = cargo)
+      cur_max_jump = self._ship.max_range(cargo = cargo) if self._long_jumps else full_max_jump
+    return (cargo, full_max_jump, cur_max_jump)
+
+  def plot_legs(self, r, route, avoid, route_filters, envdata):
+    # Once the stops are chosen each leg can be plotted independently, so work
+    # out all the plots needed first and then run them, in parallel if asked
+    leg_routes = [None] * len(route)
+    plots = []
+    for i in range(1, len(route)):
+      cargo, full_max_jump, cur_max_jump = self.leg_ranges(i)
+      envdata.find_intermediate_systems_from_edsm(route[i-1].system.position, route[i].system.position)
+      if route[i-1].system != route[i].system and calc.jump_count_range(route[i-1], route[i], cur_max_jump, slf=self._slf)[1] > 1:
+        plots.append((i, (route[i-1].system, route[i].system, avoid, cur_max_jump, full_max_jump, cargo, route_filters)))
+      else:
+        leg_routes[i] = [route[i-1].system, route[i].system]
+    jobs = min(self._jobs, len(plots))
+    if jobs > 1:
+      log.debug("Plotting {} legs using {} processes", len(plots), jobs)
+      pool = multiprocessing.Pool(jobs, _init_plot_worker, (r, ))
+      try:
+        results = pool.map(_plot_leg, [leg for i, leg in plots], chunksize = 1)
+      finally:
+        pool.close()
+        pool.join()
+      # The workers' connections are read-only, so keep their routes from here
+      for (i, leg), result in zip(plots, results):
+        r.cache_plot(result, *leg)
+    else:
+      results = []
+      for i, leg in plots:
+        log.debug("Doing route plot for {0} --> {1}", route[i-1].system_name, route[i].system_name)
+        results.append(r.plot(*leg))
+    for (i, leg), result in zip(plots, results):
+      leg_routes[i] = result
+    return leg_routes
+
   def direction_hint(self, reference, src, dst):
     v = (src.position - reference.position).get_normalised()
     w = (dst.position - reference.position).get_normalised()
@@ -36,7 +36,7 @@ def register_backend(name, fn):
 def unregister_backend(name):
   del _registered_backends[name]
 
-def _get_default_backend(path):
+def _get_default_backend(path, read_only = False):
   db_path = os.path.join(os.path.normpath(path), os.path.normpath(global_args.db_file))
   db_sqlite3.log_versions()
   if not os.path.isfile(db_path):
@@ -53,7 +53,7 @@ def _get_default_backend(path):
     else:
       log.error("Error: EDSM/Coriolis data not found. Please run update.py to download this data and create the local database.")
       return None
-  return db_sqlite3.open_db(db_path, use_edsm = global_args.use_edsm)
+  return db_sqlite3.open_db(db_path, use_edsm = 'never' if read_only else global_args.use_edsm, read_only = read_only)
 
 register_backend(default_backend_name, _get_default_backend)
 
@@ -64,6 +64,25 @@ def _make_known_system(s):
   sysobj = system_internal.KnownSystem(s)
   return sysobj
 
+# The row must include at least the name, x, y, z and id64 columns
+def make_known_system_from_row(row):
+  return system_internal.KnownSystem(row._asdict())
+
+_system_row_getters = {
+  'id': lambda s: s.id,
+  'name': lambda s: s.name,
+  'x': lambda s: s.position.x,
+  'y': lambda s: s.position.y,
+  'z': lambda s: s.position.z,
+  'id64': lambda s: s.id64,
+  'needs_permit': lambda s: s.needs_system_permit,
+  'allegiance': lambda s: s.allegiance,
+  'arrival_star_class': lambda s: s.arrival_star.spectral_class,
+}
+
+def _make_system_row(row_type, s):
+  return row_type._make(_system_row_getters[c](s) for c in row_type._fields)
+
 def _make_station(sy, st):
   sysobj = _make_known_system(sy) if not isinstance(sy, system_internal.KnownSystem) else sy
   stnobj = station.Station(st, sysobj)
@@ -71,11 +90,14 @@ def _make_station(sy, st):
 
 
 class Env(object):
-  def __init__(self, backend):
+  def __init__(self, backend, use_star_index = False):
     log_versions(extra = ['Env Backend: {}'.format(backend.backend_name)])
     self.is_data_loaded = False
     self._backend = backend
+    self._star_index = None
     self._load_data()
+    if use_star_index and self.is_data_loaded:
+      self._load_star_index()
 
   def find_systems_from_edsm(self, names):
     return self._backend.find_systems_from_edsm(names)
@@ -105,6 +127,15 @@ class Env(object):
     if self._backend is not None:
       self._backend.close()
 
+  def get_data_version(self):
+    return self._backend.get_data_version()
+
+  def get_cached_route(self, key):
+    return self._backend.get_cached_route(key)
+
+  def cache_route(self, key, data):
+    return self._backend.cache_route(key, data)
+
   @property
   def backend_name(self):
     return (self._backend.backend_name if self._backend else None)
@@ -279,16 +310,51 @@ class Env(object):
     max_x = max(vec_from.x, vec_to.x) + buffer_to
     max_y = max(vec_from.y, vec_to.y) + buffer_to
     max_z = max(vec_from.z, vec_to.z) + buffer_to
-    return [system_internal.KnownSystem(s) for s in self._backend.find_systems_by_aabb(min_x, min_y, min_z, max_x, max_y, max_z, filters=self._get_as_filters(filters))]
- 
+    filters = self._get_as_filters(filters)
+    if self._use_star_index(filters):
+      return self._star_index.find_systems_by_aabb(min_x, min_y, min_z, max_x, max_y, max_z, filters=filters)
+    return [system_internal.KnownSystem(s) for s in self._backend.find_systems_by_aabb(min_x, min_y, min_z, max_x, max_y, max_z, filters=filters)]
+
+  def find_systems_by_cylinder(self, vec_from, vec_to, buffer_both, filters = None):
+    vec_from = util.get_as_position(vec_from)
+    vec_to = util.get_as_position(vec_to)
+    if vec_from is None or vec_to is None:
+      raise ValueError("could not get a position from input cylinder coords")
+    filters = self._get_as_filters(filters)
+    if self._use_star_index(filters):
+      return self._star_index.find_systems_by_cylinder(vec_from, vec_to, buffer_both, filters=filters)
+    denominator = (vec_to - vec_from).length
+    return [s for s in self.find_systems_by_aabb(vec_from, vec_to, buffer_both, buffer_both, filters=filters)
+            if ((s.position - vec_from).cross(s.position - vec_to)).length / denominator < buffer_both]
+
   def find_all_systems(self, filters = None):
-    for s in self._backend.find_all_systems(filters=self._get_as_filters(filters)):
+    filters = self._get_as_filters(filters)
+    if self._use_star_index(filters):
+      for s in self._star_index.find_all_systems(filters=filters):
+        yield s
+      return
+    for s in self._backend.find_all_systems(filters=filters):
       yield _make_known_system(s)
 
   def find_all_stations(self, filters = None):
     for sy,st in self._backend.find_all_stations(filters=self._get_as_filters(filters)):
       yield _make_station(sy, st)
 
+  # Rows are namedtuples of the requested SystemResult columns (by default
+  # eb.SYSTEM_COLUMNS); much cheaper than KnownSystems if few of them are used
+  def stream_systems(self, filters = None, columns = None, batch_size = None):
+    filters = self._get_as_filters(filters)
+    if self._use_star_index(filters):
+      row_type = eb.system_row_type(columns)
+      for s in self._star_index.find_all_systems(filters=filters):
+        yield _make_system_row(row_type, s)
+      return
+    for r in self._backend.stream_systems(filters=filters, columns=columns, batch_size=batch_size):
+      yield r
+
+  def stream_systems_by_glob(self, name, filters = None, columns = None, batch_size = None):
+    return self._backend.stream_systems_by_name(name, mode=eb.FIND_GLOB, filters=self._get_as_filters(filters), columns=columns, batch_size=batch_size)
+
   def find_systems_by_name(self, name, filters = None):
     for s in self._backend.find_systems_by_name(name, mode=eb.FIND_EXACT, filters=self._get_as_filters(filters)):
       yield _make_known_system(s)
@@ -317,6 +383,22 @@ class Env(object):
     for (sy, st) in self._backend.find_stations_by_name(name, mode=eb.FIND_REGEX, filters=self._get_as_filters(filters)):
       yield _make_station(sy, st)
 
+  def _use_star_index(self, filters):
+    return self._star_index is not None and self._star_index.supports_filters(filters)
+
+  def _load_star_index(self):
+    # Only imported here, as it brings numpy with it
+    from . import starindex
+    try:
+      self._star_index = starindex.open_index(self._backend)
+    except Exception as ex:
+      log.error("Failed to load star index: {}", ex)
+      self._star_index = None
+
+  @property
+  def star_index(self):
+    return self._star_index
+
   def _load_data(self):
     try:
       self._load_coriolis_data()
@@ -358,16 +440,21 @@ class EnvWrapper(object):
 
 
 _open_backends = {}
+_inherited_backends = []
 
-def start(path = default_path, backend = default_backend_name):
+def start(path = default_path, backend = default_backend_name, read_only = False):
   if backend not in _registered_backends:
     raise ValueError("Specified backend name '{}' is not registered".format(backend))
   if not is_started(path, backend):
-    backend_obj = _registered_backends[backend](path)
+    backend_obj = _registered_backends[backend](path, read_only = True) if read_only else _registered_backends[backend](path)
     if backend_obj is None or not isinstance(backend_obj, eb.EnvBackend):
       log.error("Failed to start environment: backend name '{}' failed to create object", backend)
       return False
-    newdata = Env(backend_obj)
+    use_star_index = global_args.star_index
+    if use_star_index and global_args.use_edsm != 'never' and not read_only:
+      log.warning("The star index cannot be used while fetching data from EDSM; ignoring it")
+      use_star_index = False
+    newdata = Env(backend_obj, use_star_index = use_star_index)
     if newdata.is_data_loaded:
       _open_backends[(backend, path)] = newdata
       return True
@@ -377,6 +464,14 @@ def start(path = default_path, backend = default_backend_name):
     return True
 
 
+# For worker processes: connections inherited from the parent process must not
+# be used (or closed) by the child, so set them aside and open read-only ones
+def start_worker(path = default_path, backend = default_backend_name):
+  _inherited_backends.extend(_open_backends.values())
+  _open_backends.clear()
+  return start(path, backend, read_only = True)
+
+
 def is_started(path = default_path, backend = default_backend_name):
   return ((backend, path) in _open_backends and _open_backends[(backend, path)].is_data_loaded)
 
@@ -396,5 +491,6 @@ arg_parser = argparse.ArgumentParser(description = "Elite: Dangerous Travel Scri
 arg_parser.add_argument("-v", "--verbose", dest='log_level', type=int, default=2, help="Increases the logging output")
 arg_parser.add_argument("-J", "--json", action='store_true', default=False, help="Return output in JSON format")
 arg_parser.add_argument("--db-file", type=str, default=defs.default_db_file, help="Specifies the database file to use")
+arg_parser.add_argument("--star-index", action='store_true', default=False, help="Answer spatial queries from an in-memory star index (requires numpy)")
 arg_parser.add_argument("--use-edsm", type=str.lower, choices=['always', 'periodically', 'when-missing', 'never'], default=defs.use_edsm, help="Refresh system and station data from EDSM")
 global_args, local_args = arg_parser.parse_known_args(sys.argv[1:])
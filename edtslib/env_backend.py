@@ -1,8 +1,25 @@
+import collections
 
 FIND_EXACT = 0
 FIND_GLOB = 1
 FIND_REGEX = 2
 
+# The fields of a SystemResult which stream_systems can project, in their default order
+SYSTEM_COLUMNS = ('id', 'name', 'x', 'y', 'z', 'id64', 'needs_permit', 'allegiance', 'arrival_star_class')
+
+_system_row_types = {}
+
+def system_row_type(columns = None):
+  # A namedtuple type holding the given columns of a SystemResult; types are shared between calls
+  columns = tuple(columns) if columns is not None else SYSTEM_COLUMNS
+  if columns not in _system_row_types:
+    unknown = [c for c in columns if c not in SYSTEM_COLUMNS]
+    if unknown or not columns:
+      raise ValueError("Invalid system columns: {}".format(', '.join(unknown) if unknown else '(none)'))
+    _system_row_types[columns] = collections.namedtuple('SystemRow', columns)
+  return _system_row_types[columns]
+
+
 class EnvBackend(object):
   # SystemResult = {"id": int, "name": str, "x": float, "y": float, "z": float, "id64": int or None, ...}
   # StationResult = {"id": int, name": str, "type": str, "has_refuel": bool, "is_planetary": bool,
@@ -12,6 +29,22 @@ class EnvBackend(object):
   def __init__(self, backend_name):
     self.backend_name = backend_name
 
+  def get_data_version(self):
+    # return a value which changes whenever the system data does, or None if this is not known
+    return None
+
+  def get_sidecar_path(self, suffix):
+    # return a path alongside the backend's data where derived data can be cached, or None
+    return None
+
+  def get_cached_route(self, key):
+    # return the data stored by cache_route for this key, or None
+    return None
+
+  def cache_route(self, key, data):
+    # store JSON-serialisable route data under this key, if the backend can
+    pass
+
   def retrieve_fsd_list(self):
     # return {"fsd_class": fsd_object}
     raise NotImplementedError("Invalid use of base EnvBackend retrieve_fsd_list method")
@@ -63,3 +96,16 @@ class EnvBackend(object):
   def find_all_stations(self, filters = None):
     # return [(SystemResult, StationResult), ...]
     raise NotImplementedError("Invalid use of base EnvBackend find_all_stations method")
+
+  def stream_systems(self, filters = None, columns = None, batch_size = None):
+    # return [SystemRow, ...], holding only the requested columns
+    # Backends which can fetch just those columns should override this
+    row_type = system_row_type(columns)
+    for s in self.find_all_systems(filters=filters):
+      yield row_type._make(s.get(c) for c in row_type._fields)
+
+  def stream_systems_by_name(self, namelist, mode = FIND_EXACT, filters = None, columns = None, batch_size = None):
+    # return [SystemRow, ...], holding only the requested columns
+    row_type = system_row_type(columns)
+    for s in self.find_systems_by_name(namelist, mode=mode, filters=filters):
+      yield row_type._make(s.get(c) for c in row_type._fields)
@@ -378,7 +378,9 @@ def normalise(filters, strip_unexpected = False, anonymous_posargs = True, assum
   return output
 
 
-def generate_sql(filters):
+# With spatial_index set, bounded close_to searches are also restricted using
+# the systems_rtree table, which must then exist
+def generate_sql(filters, spatial_index = False):
   select_str = []
   filter_str = []
   group_str = []
@@ -423,6 +425,9 @@ def generate_sql(filters):
           for opval in oentry['distance']:
             # If we're checking within a radius, restrict to a cube first to pare candidates down faster
             if opval.operator in ('<', '<=', '='):
+              if spatial_index:
+                filter_str.append('systems.id IN (SELECT id FROM systems_rtree WHERE max_x >= ? AND min_x <= ? AND max_y >= ? AND min_y <= ? AND max_z >= ? AND min_z <= ?)')
+                filter_params += [pos.x - opval.value, pos.x + opval.value, pos.y - opval.value, pos.y + opval.value, pos.z - opval.value, pos.z + opval.value]
               filter_str.append('diff{} {} ?'.format(idx+0, opval.operator))
               filter_str.append('diff{} {} ?'.format(idx+1, opval.operator))
               filter_str.append('diff{} {} ?'.format(idx+2, opval.operator))
@@ -7,6 +7,11 @@ from . import util
 log = util.get_logger("fsd")
 
 
+# Range multipliers for each FSD boost: synthesis levels, then supercharging
+# at a white dwarf (D) or neutron star (N)
+boost_multipliers = {'0': 1.0, '1': 1.25, '2': 1.5, '3': 2.0, 'D': 1.25, 'N': 4.0}
+
+
 class FSD(object):
   def __init__(self, classrating):
     drive_class = None
@@ -118,14 +123,12 @@ class FSD(object):
   def supercharge(self, boost):
     if not boost:
       self.boost = 1.0
-    elif str(boost).upper() == 'D':
-      self.boost = 1.25
-    elif str(boost).upper() == 'N':
-      self.boost = 4.0
+    elif str(boost).upper() in boost_multipliers:
+      self.boost = boost_multipliers[str(boost).upper()]
     else:
       try:
-        self.boost = [1.0, 1.25, 1.5, 2.0][int(boost)]
-      except:
+        self.boost = boost_multipliers[str(int(boost))]
+      except (KeyError, TypeError, ValueError):
         log.error("Invalid boost value {}", boost)
         self.boost = 1.0
 
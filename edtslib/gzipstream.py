@@ -0,0 +1,163 @@
+import threading
+import zlib
+
+try:
+  import queue
+except ImportError:
+  import Queue as queue
+
+# Compressed bytes read from the underlying stream at a time
+read_block_size = 1024 * 1024
+# Largest piece of decompressed data handed over at a time
+output_block_size = 4 * 1024 * 1024
+# Decompressed pieces allowed to wait for the reader before decompression pauses
+queue_depth = 8
+
+_end = object()
+
+
+# The decompressed contents of gzip data already held in memory, such as an
+# API response, where starting a decompression thread would cost more than
+# it saves; concatenated members are handled as in ThreadedGzipInputStream
+def decompress(data):
+  pieces = []
+  while data:
+    inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    pieces.append(inflater.decompress(data))
+    pieces.append(inflater.flush())
+    if not getattr(inflater, 'eof', True):
+      raise IOError("Compressed data ended before the end of the gzip stream")
+    data = inflater.unused_data
+  return b''.join(pieces)
+
+
+# A read-only stream of the decompressed contents of a gzip stream, which
+# can be made of several concatenated gzip members (as written by pigz and
+# by appending .gz files together). Decompression happens on a separate
+# thread, which zlib and socket reads let run alongside the reader since
+# both release the GIL, and runs up to queue_depth pieces ahead
+class ThreadedGzipInputStream(object):
+  def __init__(self, fileobj):
+    self._file = fileobj
+    self._queue = queue.Queue(queue_depth)
+    self._stopped = threading.Event()
+    self._buffer = b''
+    self._pos = 0
+    self._offset = 0
+    self._eof = False
+    self._thread = threading.Thread(target = self._decompress, name = 'gzip decompression')
+    self._thread.daemon = True
+    self._thread.start()
+
+  def _put(self, item):
+    while not self._stopped.is_set():
+      try:
+        self._queue.put(item, timeout = 0.1)
+        return True
+      except queue.Full:
+        continue
+    return False
+
+  def _decompress(self):
+    inflater = None
+    try:
+      while True:
+        data = self._file.read(read_block_size)
+        if not data:
+          break
+        while data:
+          if inflater is None:
+            inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)
+          out = inflater.decompress(data, output_block_size)
+          if out and not self._put(out):
+            return
+          if getattr(inflater, 'eof', False) or inflater.unused_data:
+            # Everything after the end of a member starts the next one
+            data = inflater.unused_data
+            inflater = None
+          else:
+            data = inflater.unconsumed_tail
+      if inflater is not None:
+        out = inflater.flush()
+        if out and not self._put(out):
+          return
+        # Python 2 can't tell us whether the last member was complete
+        if not getattr(inflater, 'eof', True):
+          raise IOError("Compressed data ended before the end of the gzip stream")
+      self._put(_end)
+    except Exception as ex:
+      self._put(ex)
+
+  def _fill(self):
+    # Fetch the next piece of decompressed data into the buffer, dropping
+    # what has already been read; returns False at the end of the data
+    if self._eof:
+      return False
+    item = self._queue.get()
+    if item is _end:
+      self._eof = True
+      return False
+    if isinstance(item, Exception):
+      self._eof = True
+      raise item
+    self._buffer = self._buffer[self._pos:] + item
+    self._pos = 0
+    return True
+
+  def _take(self, end):
+    data = self._buffer[self._pos:end]
+    self._pos = end
+    self._offset += len(data)
+    return data
+
+  def read(self, size = -1):
+    if size is None or size < 0:
+      size = None
+    # Collect whole pieces rather than growing the buffer for each one
+    pieces = []
+    while size is None or size > 0:
+      if self._pos == len(self._buffer) and not self._fill():
+        break
+      end = len(self._buffer) if size is None else min(self._pos + size, len(self._buffer))
+      pieces.append(self._take(end))
+      if size is not None:
+        size -= len(pieces[-1])
+    return b''.join(pieces)
+
+  def readline(self):
+    start = self._pos
+    while True:
+      end = self._buffer.find(b'\n', start)
+      if end >= 0:
+        return self._take(end + 1)
+      start = len(self._buffer) - self._pos
+      if not self._fill():
+        return self._take(len(self._buffer))
+
+  def readlines(self):
+    return list(self)
+
+  def __iter__(self):
+    return self
+
+  def next(self):
+    line = self.readline()
+    if not line:
+      raise StopIteration()
+    return line
+  __next__ = next
+
+  def tell(self):
+    return self._offset
+
+  def close(self):
+    self._stopped.set()
+    self._thread.join(1)
+    if hasattr(self._file, 'close'):
+      self._file.close()
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *args):
+    self.close()
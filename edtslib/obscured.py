@@ -10,6 +10,7 @@ from . import env
 from . import filtering
 from . import ship
 from . import util
+from . import vector3
 
 app_name = "obscured"
 
@@ -23,6 +24,9 @@ DISTANCE_TO = 'DISTANCE-TO'
 DEVIATION = 'DEVIATION'
 default_sort = DEVIATION
 
+# The system columns needed to build results
+_result_columns = ('id', 'name', 'x', 'y', 'z', 'id64', 'needs_permit', 'arrival_star_class')
+
 class Result(Opaq):
   def __init__(self, **args):
     self.system = args.get('system')
@@ -49,8 +53,11 @@ class Application(object):
       log.debug(str(self._ship))
 
   def deviation(self, a, b, r):
-    v = (a.position - r.position).get_normalised()
-    w = (b.position - r.position).get_normalised()
+    return self.position_deviation(a.position, b.position, r.position)
+
+  def position_deviation(self, a, b, r):
+    v = (a - r).get_normalised()
+    w = (b - r).get_normalised()
     d = v.dot(w)
     return 100 * (1 - d)
 
@@ -80,15 +87,24 @@ class Application(object):
         filters['close_to'].append({filtering.PosArgs: [filtering.Operator('=', start)], 'distance': [filtering.Operator('<=', start.distance_to(end))]})
       envdata.find_filtered_systems_from_edsm(filters)
       names = [start.name, obscured.name, end.name]
-      asys = [s for s in envdata.find_all_systems(filters = envdata.convert_filter_object(filters)) if s.name not in names and self.deviation(s, obscured, start) >= self._min_deviation]
+      # Only build systems for the candidates we keep; (row, position, deviation)
+      candidates = []
+      for r in envdata.stream_systems(filters = envdata.convert_filter_object(filters), columns = _result_columns):
+        if r.name in names:
+          continue
+        pos = vector3.Vector3(r.x, r.y, r.z)
+        deviation = self.position_deviation(pos, obscured.position, start.position)
+        if deviation >= self._min_deviation:
+          candidates.append((r, pos, deviation))
       if self._sort == DISTANCE_TO:
-        asys.sort(key = lambda s: s.distance_to(end))
+        candidates.sort(key = lambda c: (c[1] - end.position).length)
       elif self._sort == DISTANCE_FROM:
-        asys.sort(key = lambda s: s.distance_to(end))
+        candidates.sort(key = lambda c: (c[1] - end.position).length)
       else:
-        asys.sort(key = lambda s: self.deviation(s, obscured, start), reverse = True)
+        candidates.sort(key = lambda c: c[2], reverse = True)
       if self._num:
-        asys = asys[0:self._num]
+        candidates = candidates[0:self._num]
+        asys = [env.make_known_system_from_row(c[0]) for c in candidates]
 
         for i in range(0, len(asys)):
-          yield Result(system = asys[i], deviation = self.deviation(asys[i], obscured, start), distances = { start.name: Lightyears(asys[i].distance_to(start)), end.name: Lightyears(asys[i].distance_to(end)) })
+          yield Result(system = asys[i], deviation = candidates[i][2], distances = { start.name: Lightyears(asys[i].distance_to(start)), end.name: Lightyears(asys[i].distance_to(end)) })
@@ -1,10 +1,11 @@
 from __future__ import print_function, division
 import collections
+import numbers
 import string
-import time
 
 from . import pgdata
 from . import sector
+from . import spatial
 from . import util
 from . import vector3
 
@@ -49,11 +50,7 @@ def get_sector_name(pos, allow_ha=True, format_output=True):
     ha_name = _ha_get_name(pos)
     if ha_name is not None:
       return ha_name
-  offset = _c1_get_offset(pos)
-  if _get_c1_or_c2(offset) == 1:
-    output = _c1_get_name(pos)
-  else:
-    output = _c2_get_name(pos)
+  output = _get_name_from_offset(_c1_get_offset(pos))
   
   if format_output:
     return format_sector_name(output)
@@ -113,6 +110,81 @@ def get_system(input, mcode = None, allow_ha = True):
     return _get_system_from_name(input, allow_ha)
 
 
+def get_sectors(inputs, allow_ha = True, get_name = True):
+  """
+  Get Sector objects for many names or positions at once, as get_sector would for each of them.
+  Each distinct PG sector is only looked up once. Positions are checked against HA regions one at a time,
+  each only against the regions near it in the HA region tree.
+
+  Args:
+    inputs: An iterable of sector names and/or positions
+    allow_ha: Whether to include hand-authored sectors in the search
+    get_name: Whether to look up the names of the sectors
+  Returns:
+    A list of Sector objects in the same order as the inputs, with None for any which could not be looked up
+  """
+  inputs = list(inputs)
+  result = [None] * len(inputs)
+  positions = []
+  position_idx = []
+  by_name = {}
+  for i, input in enumerate(inputs):
+    pos = util.get_as_position(input)
+    if pos is not None:
+      positions.append(pos)
+      position_idx.append(i)
+    elif util.is_str(input):
+      if input not in by_name:
+        by_name[input] = get_sector(input, allow_ha=allow_ha, get_name=get_name)
+      result[i] = by_name[input]
+    else:
+      result[i] = get_sector(input, allow_ha=allow_ha, get_name=get_name)
+  for i, sect in zip(position_idx, _get_sectors_from_positions(positions, allow_ha, get_name)):
+    result[i] = sect
+  return result
+
+
+def get_systems(inputs, mcodes = None, allow_ha = True):
+  """
+  Get system objects for many names or positions at once, as get_system would for each of them.
+
+  Args:
+    inputs: An iterable of system names and/or positions
+    mcodes: The systems' mass codes, as an iterable in the same order as inputs or one for them all; only required for positions
+  Returns:
+    A list of system or system prototype objects in the same order as the inputs, with None for any which could not be looked up
+  """
+  inputs = list(inputs)
+  if mcodes is None or util.is_str(mcodes) or isinstance(mcodes, numbers.Number):
+    mcodes = [mcodes] * len(inputs)
+  else:
+    mcodes = list(mcodes)
+    if len(mcodes) != len(inputs):
+      raise ValueError("mcodes argument to get_systems must be a single mcode or one per input")
+  result = [None] * len(inputs)
+  names = []
+  name_idx = []
+  positions = []
+  position_mcodes = []
+  position_idx = []
+  for i, input in enumerate(inputs):
+    pos = util.get_as_position(input)
+    if pos is not None:
+      if mcodes[i] is None:
+        raise ValueError("mcode argument must be provided to get_systems for each input which is a position")
+      positions.append(pos)
+      position_mcodes.append(mcodes[i])
+      position_idx.append(i)
+    else:
+      names.append(input)
+      name_idx.append(i)
+  for i, syst in zip(name_idx, _get_systems_from_names(names, allow_ha)):
+    result[i] = syst
+  for i, syst in zip(position_idx, _get_systems_from_positions(positions, position_mcodes, allow_ha)):
+    result[i] = syst
+  return result
+
+
 def get_canonical_name(name, sector_only = False):
   """
   Get the correctly-cased name for a given sector or system name
@@ -274,13 +346,14 @@ def format_system_name(input):
   return "{} {}".format(input['SectorName'], sysid)
 
 
-def get_ha_regions(reference = None, max_distance = None):
+def get_ha_regions(reference = None, max_distance = None, limit = None):
   """
   Get hand-authored sectors, optionally in distance order around a reference point
 
   Args:
     reference: Optional, position or System/Sector-like object. If provided, returned sectors will be ordered by distance from this point
     max_distance: Optional, may only be provided with reference. A maximum distance from the reference point, in LY, to limit returned sectors to.
+    limit: Optional, may only be provided with reference. The maximum number of sectors to return, nearest first.
   Returns:
     An OrderedDict object where keys are the names of the sectors, and values are the sector objects themselves.
   """
@@ -288,17 +361,53 @@ def get_ha_regions(reference = None, max_distance = None):
     pos_reference = util.get_as_position(reference)
     if pos_reference is None:
       raise ValueError("if provided, reference must be a position, or a System/Sector-like object")
-    result = [(s.name, s) for s in pgdata.ha_regions.values() if (max_distance is None or (pos_reference - s.centre).length < max_distance)]
-    result.sort(key=lambda s: (pos_reference - s[1].centre).length)
+    if max_distance is None and limit is None:
+      # Every region is wanted anyway, so just sort them
+      result = [(s.name, s) for s in pgdata.ha_regions.values()]
+      result.sort(key=lambda s: (pos_reference - s[1].centre).length)
+      return collections.OrderedDict(result)
+    tree = _get_ha_region_tree()
+    result = []
+    for _, i in tree.nearest(pos_reference, max_distance):
+      if limit is not None and len(result) >= limit:
+        break
+      result.append((tree.items[i].name, tree.items[i]))
     return collections.OrderedDict(result)
   else:
-    if max_distance is not None:
-      raise ValueError("cannot provide max_distance without a reference position")
+    if max_distance is not None or limit is not None:
+      raise ValueError("cannot provide max_distance or limit without a reference position")
     return collections.OrderedDict([(s.name, s) for s in pgdata.ha_regions.values()])
 # Alias for backwards compatibility
 get_ha_sectors = get_ha_regions
 
 
+def load_sector_table(path = None):
+  """
+  Load a precomputed table of PG sector names, which is then used to name sectors and to look them up by name.
+  Sectors which are not in the table are still handled by calculating their names as usual.
+
+  Args:
+    path: Optional, the table file to load. Defaults to the one built by the sector_table update step.
+  Returns:
+    True if the table was loaded, False if it is missing, out of date or invalid
+  """
+  from . import pgtable
+  use_sector_table(pgtable.SectorTable.load(path))
+  return _sector_table is not None
+
+
+def use_sector_table(table):
+  """
+  Set the sector table to use for naming and looking up PG sectors.
+
+  Args:
+    table: A pgtable.SectorTable, or None to always calculate sector names
+  """
+  global _sector_table, _sector_table_checked
+  _sector_table = table
+  _sector_table_checked = True
+
+
 def get_grid_coords(pos, mcode):
   """
   Get the grid (1/32LY) coordinates for the given position.
@@ -345,6 +454,9 @@ _srp_divisor3 = _srp_divisor1**3
 _srp_rowlength = 128
 _srp_sidelength = _srp_rowlength**2
 _expected_fragment_limit = 4
+# The sector name table, if there is one; see load_sector_table
+_sector_table = None
+_sector_table_checked = False
 
 
 # #
@@ -440,14 +552,19 @@ def _get_canonical_name_fragments(name, sector_only = False):
   else:
     return None
 
-  # Check if this sector name appears in ha_regions, pass it through the fragment process if not
+  # Check if this sector name appears in ha_regions, then the sector table, pass it through the fragment process if not
   if sectname_raw.lower() in pgdata.ha_regions:
     sectname = pgdata.ha_regions[sectname_raw.lower()].name
   else:
-    # get_sector_fragments converts to Title Case, so we don't need to
-    frags = get_sector_fragments(sectname_raw)
-    if frags is not None:
-      sectname = format_sector_name(frags)
+    table = _get_sector_table()
+    offset = table.get_offset(sectname_raw) if table is not None else None
+    if offset is not None:
+      sectname = format_sector_name(table.get_name(offset))
+    else:
+      # get_sector_fragments converts to Title Case, so we don't need to
+      frags = get_sector_fragments(sectname_raw)
+      if frags is not None:
+        sectname = format_sector_name(frags)
 
   # Work out what we should be returning, and do it
   if not sector_only and m is not None and sectname is not None:
@@ -532,6 +649,26 @@ def _get_sector_pos_from_offset(offset, galsize):
   return [x, y, z]
 
 
+# Get the sector table, loading the default one if it hasn't been set yet
+def _get_sector_table():
+  if not _sector_table_checked:
+    load_sector_table()
+  return _sector_table
+
+
+# Get the name fragments of the PG sector at an offset
+def _get_name_from_offset(offset):
+  table = _get_sector_table()
+  if table is not None:
+    frags = table.get_name(offset)
+    if frags is not None:
+      return frags
+  if _get_c1_or_c2(offset) == 1:
+    return _c1_get_name_from_offset(offset)
+  else:
+    return _c2_get_name_from_offset(offset)
+
+
 # Determines whether a given sector should be C1 or C2
 def _get_c1_or_c2(key):
   # Use Jenkins hash
@@ -547,6 +684,12 @@ def _get_sector_from_name(sector_name, allow_ha = True):
     return None
   if allow_ha and util.is_str(sector_name) and sector_name.lower() in pgdata.ha_regions:
     return pgdata.ha_regions[sector_name.lower()]
+  # Use the sector table if we have one, falling back to working out the position
+  table = _get_sector_table() if util.is_str(sector_name) else None
+  offset = table.get_offset(sector_name) if table is not None else None
+  if offset is not None:
+    spos = _get_sector_pos_from_offset(offset, sector.galaxy_size)
+    return sector.PGSector(spos[0], spos[1], spos[2], sector_name, _get_c1_or_c2(offset))
   else:
     frags = get_sector_fragments(sector_name) if util.is_str(sector_name) else sector_name
     if frags is not None:
@@ -628,12 +771,118 @@ def _get_system_from_name(input, allow_ha = True):
     return None
 
 
+# Spatial indexes over the HA regions, made when first needed: one of their
+# spheres, to find which region a position is in, and one of their centres,
+# to find the regions nearest to a position
+_ha_sphere_tree = None
+_ha_region_tree = None
+
+def _get_ha_sphere_tree():
+  global _ha_sphere_tree
+  if _ha_sphere_tree is None:
+    # Spheres are in the order their regions are checked in
+    spheres = [(s, r) for r in pgdata.ha_regions.values() for s in r.spheres]
+    _ha_sphere_tree = spatial.SphereTree(spheres, lambda o: o[0].centre, lambda o: o[0].radius)
+  return _ha_sphere_tree
+
+
+def _get_ha_region_tree():
+  global _ha_region_tree
+  if _ha_region_tree is None:
+    _ha_region_tree = spatial.SphereTree(pgdata.ha_regions.values(), radius_fn = lambda r: 0.0)
+  return _ha_region_tree
+
+
 # Get which HA sector this position would be part of, if any
 def _ha_get_name(pos):
-  for (_, s) in pgdata.ha_regions.items():
-    if s.contains(pos):
-      return s.name
-  return None
+  # The first region containing the position wins, as in a scan over them
+  tree = _get_ha_sphere_tree()
+  indices = tree.indices_containing(pos)
+  return tree.items[indices[0]][1].name if indices else None
+
+
+# #
+# Internal functions: batches
+# #
+
+# These import vecarray (and with it numpy) when first called rather than
+# with this module, which everything that handles system names imports
+
+def _get_sectors_from_positions(positions, allow_ha, get_name):
+  from . import vecarray
+  # The HA region tree only looks at spheres near each position, which beats
+  # testing every position against every sphere even with numpy
+  ha_names = [_ha_get_name(pos) for pos in positions] if allow_ha else [None] * len(positions)
+  if vecarray.have_numpy() and positions:
+    points = vecarray.coords(positions, lambda pos: pos)
+    indices = ((points - vecarray.np.array(tuple(sector.base_coords))) // sector.sector_size).astype(vecarray.np.int64).tolist()
+  else:
+    indices = [(int((pos.x - sector.base_coords.x) // sector.sector_size), int((pos.y - sector.base_coords.y) // sector.sector_size), int((pos.z - sector.base_coords.z) // sector.sector_size)) for pos in positions]
+  # PG sectors are named once per batch, however many positions fall in them
+  pg_sectors = {}
+  result = []
+  for pos, ha_name, index in zip(positions, ha_names, indices):
+    if ha_name is not None:
+      result.append(pgdata.ha_regions[ha_name.lower()])
+      continue
+    index = tuple(index)
+    if index not in pg_sectors:
+      pg_sectors[index] = get_sector(pos, allow_ha=False, get_name=get_name)
+    result.append(pg_sectors[index])
+  return result
+
+
+def _get_systems_from_positions(positions, mcodes, allow_ha):
+  from . import vecarray
+  sectors = _get_sectors_from_positions(positions, allow_ha, True)
+  widths = [sector.get_mcode_cube_width(mcode) for mcode in mcodes]
+  # Boxel origins only depend on the sector and cube width
+  origins = {}
+  boxel_origins = []
+  for sect, width in zip(sectors, widths):
+    key = (id(sect), width)
+    if key not in origins:
+      origins[key] = tuple(sect.get_origin(width))
+    boxel_origins.append(origins[key])
+  if vecarray.have_numpy() and positions:
+    np = vecarray.np
+    relpos = vecarray.coords(positions, lambda pos: pos) - np.array(boxel_origins, dtype=np.float64)
+    cells = (relpos // np.array(widths, dtype=np.float64)[:, np.newaxis]).astype(np.int64)
+    soffsets = (cells[:, 0] + (_srp_rowlength * cells[:, 1]) + (_srp_sidelength * cells[:, 2])).tolist()
+  else:
+    soffsets = [_get_soffset_from_relpos(vector3.Vector3(pos.x - o[0], pos.y - o[1], pos.z - o[2]), width) for pos, o, width in zip(positions, boxel_origins, widths)]
+  return [system.PGSystemPrototype(pos.x, pos.y, pos.z, "{} {}".format(sect.name, _get_sysid_from_soffset(soffset, mcode, format_output=True)), sector=sect, uncertainty=0)
+          for pos, sect, soffset, mcode in zip(positions, sectors, soffsets, mcodes)]
+
+
+def _get_systems_from_names(names, allow_ha):
+  if not allow_ha:
+    return [_get_system_from_name(name, allow_ha) for name in names]
+  # Sector names are canonicalised and looked up once per batch
+  sectors = {}
+  result = []
+  for name in names:
+    m = pgdata.pg_system_regex.match(name)
+    if m is None:
+      result.append(None)
+      continue
+    sectname_raw = m.group('sector')
+    if sectname_raw not in sectors:
+      sectname = get_canonical_name(sectname_raw, sector_only=True)
+      sectors[sectname_raw] = (sectname, get_sector(sectname) if sectname is not None else None)
+    sectname, sect = sectors[sectname_raw]
+    if sect is None:
+      result.append(None)
+      continue
+    frags = {
+      'SectorName': sectname,
+      'L1': m.group('l1').upper(), 'L2': m.group('l2').upper(), 'L3': m.group('l3').upper(),
+      'MCode': m.group('mcode').lower(),
+      'N1': int(m.group('n1')) if m.group('n1') is not None else 0, 'N2': int(m.group('n2'))}
+    rel_pos, uncertainty = _get_relpos_from_sysid(frags['L1'], frags['L2'], frags['L3'], frags['MCode'], frags['N1'], frags['N2'])
+    coords = sect.get_origin(sector.get_mcode_cube_width(frags['MCode'])) + rel_pos
+    result.append(system.PGSystem(coords.x, coords.y, coords.z, uncertainty=uncertainty, name=format_system_name(frags), sector=sect))
+  return result
 
 
 # #
@@ -762,8 +1011,10 @@ def _c1_get_sector(input):
 def _c1_get_name(pos):
   if pos is None:
     return None
-  offset = _c1_get_offset(pos)
+  return _c1_get_name_from_offset(_c1_get_offset(pos))
+
 
+def _c1_get_name_from_offset(offset):
   # Get the current prefix run we're on, and keep the remaining offset
   prefix_cnt, cur_offset = divmod(offset, pgdata.cx_prefix_total_run_length)
   # Work out which prefix we're currently within
@@ -907,6 +1158,6 @@ def _construct_offsets():
 # Initialisation
 # #
 
-_init_start = time.clock()
+_init_start = util.start_timer()
 _construct_offsets()
-_init_time = time.clock() - _init_start
+_init_time = util.get_timer(_init_start)
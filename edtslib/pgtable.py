@@ -0,0 +1,251 @@
+import json
+import mmap
+import os
+import struct
+import zlib
+
+from . import defs
+from . import pgdata
+from . import pgnames
+from . import sector
+from . import util
+
+log = util.get_logger("pgtable")
+
+table_version = 1
+default_path = os.path.join(defs.default_path, os.path.normpath('data/pgsectors.tbl'))
+
+# File layout, all little-endian:
+#   header: magic, version, checksum of the naming data, sector count, log2 of the slot count
+#   names:  one uint32 per sector offset, holding four one-byte fragment codes
+#   slots:  open-addressed hash table of offset + 1 (0 is empty), keyed on the lower case name
+_magic = b'EDTSPGST'
+_header = struct.Struct('<8sIIII')
+_uint32 = struct.Struct('<I')
+_codes = struct.Struct('<4B')
+_none = 0xFF
+# Name of a sector which isn't in the table
+_missing = 0xFFFFFFFF
+
+# The first fragment, and the third of a class 2 name, is always a prefix; the
+# rest are infixes or suffixes. Each of those sets has fewer than 255 entries,
+# so a fragment fits in one byte once we know which set it comes from
+_prefixes = list(pgdata.cx_prefixes)
+_others = []
+for _f in pgdata.c1_infixes_s1 + pgdata.c1_infixes_s2 + pgdata.cx_suffixes_s1 + pgdata.c1_suffixes_s2:
+  if _f not in _others:
+    _others.append(_f)
+_prefix_codes = dict((f, i) for i, f in enumerate(_prefixes))
+_other_codes = dict((f, i) for i, f in enumerate(_others))
+
+
+def _source_checksum():
+  # Any change to the naming data invalidates existing tables
+  source = [
+    sector.galaxy_size, pgdata.cx_prefixes, pgdata.c1_infixes_s1, pgdata.c1_infixes_s2,
+    pgdata.cx_suffixes_s1, pgdata.c1_suffixes_s2, pgdata.cx_prefix_length_default,
+    pgdata.cx_prefix_length_overrides, pgdata.c1_infix_length_overrides,
+    pgdata.c2_prefix_suffix_override_map, pgdata.c1_prefix_infix_override_map]
+  return zlib.crc32(json.dumps(source, sort_keys=True).encode('utf-8')) & 0xFFFFFFFF
+
+
+def _roles(sector_class):
+  # Which fragments of a name are prefixes
+  return (True, False, True, False) if sector_class == 2 else (True, False, False, False)
+
+
+def _encode(frags, sector_class):
+  if len(frags) not in (3, 4) or (sector_class == 2 and len(frags) != 4):
+    return None
+  codes = []
+  for frag, is_prefix in zip(frags, _roles(sector_class)):
+    code = (_prefix_codes if is_prefix else _other_codes).get(frag)
+    if code is None:
+      return None
+    codes.append(code)
+  codes += [_none] * (4 - len(codes))
+  return _uint32.unpack(_codes.pack(*codes))[0]
+
+
+def _decode(key, sector_class):
+  return [(_prefixes if is_prefix else _others)[code] for code, is_prefix in zip(_codes.unpack(_uint32.pack(key)), _roles(sector_class)) if code != _none]
+
+
+def _slot(name, bits):
+  return (zlib.crc32(name.encode('utf-8')) & 0xFFFFFFFF) >> (32 - bits)
+
+
+def _format(key, sector_class):
+  # The name a key decodes to, as used for the hash index
+  return pgnames.format_sector_name(_decode(key, sector_class)).lower()
+
+
+# A precomputed table of every PG sector's name, by offset (as used in
+# pgnames), with a hashed index from name back to offset
+# The file is memory-mapped rather than read, so opening it costs next to
+# nothing and each lookup only touches a couple of pages
+class SectorTable(object):
+  def __init__(self, path, f, data, count, slot_bits):
+    self._path = path
+    self._file = f
+    self._data = data
+    self._count = count
+    self._slot_bits = slot_bits
+    self._slot_mask = (1 << slot_bits) - 1
+    self._names_start = _header.size
+    self._slots_start = _header.size + 4 * count
+
+  def __len__(self):
+    return self._count
+
+  @property
+  def path(self):
+    return self._path
+
+  def _key(self, offset):
+    return _uint32.unpack_from(self._data, self._names_start + 4 * offset)[0]
+
+  def get_name(self, offset):
+    # Returns the name fragments of the sector at offset, or None if it is not in the table
+    if offset is None or offset < 0 or offset >= self._count:
+      return None
+    key = self._key(offset)
+    return _decode(key, pgnames._get_c1_or_c2(offset)) if key != _missing else None
+
+  def get_offset(self, name):
+    # Returns the offset of the sector with this name (in any case), or None if it is not in the table
+    name = name.lower()
+    slot = _slot(name, self._slot_bits)
+    while True:
+      entry = _uint32.unpack_from(self._data, self._slots_start + 4 * slot)[0]
+      if entry == 0:
+        return None
+      offset = entry - 1
+      if _format(self._key(offset), pgnames._get_c1_or_c2(offset)) == name:
+        return offset
+      slot = (slot + 1) & self._slot_mask
+
+  def close(self):
+    self._data.close()
+    self._file.close()
+
+  @classmethod
+  def load(self, path = None):
+    path = default_path if path is None else path
+    try:
+      f = open(path, 'rb')
+    except (IOError, OSError):
+      return None
+    try:
+      header = f.read(_header.size)
+      if len(header) != _header.size:
+        raise ValueError("file is truncated")
+      magic, version, checksum, count, slot_bits = _header.unpack(header)
+      if magic != _magic:
+        raise ValueError("not a sector table")
+      if version != table_version:
+        log.debug("Sector table at {} has version {}, expected {}", path, version, table_version)
+        f.close()
+        return None
+      if checksum != _source_checksum():
+        log.debug("Sector table at {} was built from different naming data", path)
+        f.close()
+        return None
+      if os.fstat(f.fileno()).st_size != _header.size + 4 * count + (4 << slot_bits):
+        raise ValueError("file is the wrong size")
+      data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (IOError, OSError, ValueError, struct.error) as ex:
+      log.warning("Failed to load sector table from {}: {}", path, ex)
+      f.close()
+      return None
+    log.debug("Loaded sector table of {} sectors from {}", count, path)
+    return self(path, f, data, count, slot_bits)
+
+  @classmethod
+  def build(self, path = None, count = None):
+    # Names the first count sectors (default all of them) using the
+    # arithmetic in pgnames, and writes them out along with the name index
+    path = default_path if path is None else path
+    total = sector.galaxy_size[0] * sector.galaxy_size[1] * sector.galaxy_size[2]
+    count = total if count is None else min(count, total)
+    # Keep the hash table at most half full
+    slot_bits = max(1, (2 * count - 1).bit_length())
+    slot_mask = (1 << slot_bits) - 1
+    timer = util.start_timer()
+    names = bytearray(4 * count)
+    slots = bytearray(4 << slot_bits)
+    missing = 0
+    for offset in range(count):
+      sector_class = pgnames._get_c1_or_c2(offset)
+      frags = _arithmetic_name(offset, sector_class)
+      key = _encode(frags, sector_class) if frags is not None else None
+      if key is None:
+        # Left for the arithmetic to fail on again, as it would without a table
+        _uint32.pack_into(names, 4 * offset, _missing)
+        missing += 1
+        continue
+      _uint32.pack_into(names, 4 * offset, key)
+      name = pgnames.format_sector_name(frags).lower()
+      slot = _slot(name, slot_bits)
+      while True:
+        entry = _uint32.unpack_from(slots, 4 * slot)[0]
+        if entry == 0:
+          _uint32.pack_into(slots, 4 * slot, offset + 1)
+          break
+        other = entry - 1
+        if _format(_uint32.unpack_from(names, 4 * other)[0], pgnames._get_c1_or_c2(other)) == name:
+          # Two sectors with one name; answer as the arithmetic would
+          log.debug("Sector name {} is used at offsets {} and {}", pgnames.format_sector_name(frags), other, offset)
+          if _arithmetic_offset(frags) == offset:
+            _uint32.pack_into(slots, 4 * slot, offset + 1)
+          break
+        slot = (slot + 1) & slot_mask
+      if offset and offset % 100000 == 0:
+        log.debug("Named {} of {} sectors", offset, count)
+
+    if os.path.dirname(path) and not os.path.isdir(os.path.dirname(path)):
+      os.makedirs(os.path.dirname(path))
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+      f.write(_header.pack(_magic, table_version, _source_checksum(), count, slot_bits))
+      f.write(names)
+      f.write(slots)
+    if os.path.isfile(path):
+      os.unlink(path)
+    os.rename(tmp_path, path)
+    if missing:
+      log.debug("{} sectors could not be named, and are not in the table", missing)
+    log.debug("Wrote sector table of {} sectors to {} in {}", count, path, util.format_timer(timer))
+    return self.load(path)
+
+
+def _arithmetic_name(offset, sector_class):
+  try:
+    if sector_class == 1:
+      return pgnames._c1_get_name_from_offset(offset)
+    else:
+      return pgnames._c2_get_name_from_offset(offset)
+  except (IndexError, ValueError):
+    # Not every offset in the grid can be named yet
+    return None
+
+
+def _arithmetic_offset(frags):
+  # The offset the arithmetic finds for a name, classifying it the same way
+  if pgnames._get_sector_class(frags) == 1:
+    return pgnames._c1_get_offset_from_name(frags)
+  else:
+    return pgnames._c2_get_offset_from_name(frags)
+
+
+def validate(table, offsets = None):
+  # Checks the table against the arithmetic in pgnames, returning the
+  # offsets it names differently, or whose names it doesn't find again
+  bad = []
+  for offset in (range(len(table)) if offsets is None else offsets):
+    frags = _arithmetic_name(offset, pgnames._get_c1_or_c2(offset))
+    if table.get_name(offset) != frags:
+      bad.append(offset)
+    elif frags is not None and table.get_offset(pgnames.format_sector_name(frags)) not in (offset, _arithmetic_offset(frags)):
+      bad.append(offset)
+  return bad
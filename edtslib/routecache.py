@@ -0,0 +1,87 @@
+import hashlib
+import json
+import time
+
+from . import util
+from .system_internal import KnownSystem
+
+log = util.get_logger("routecache")
+
+default_max_entries = 1000
+
+
+# Plotted routes, keyed on everything that can change the result of a plot
+# Entries are evicted least recently used first once there are more than
+# max_entries of them, and the whole cache is cleared when the systems change
+class RouteCache(object):
+  def __init__(self, conn, max_entries = default_max_entries, read_only = False):
+    self.conn = conn
+    self.max_entries = max_entries
+    self.read_only = read_only
+    self.hits = 0
+    self.misses = 0
+
+  def get(self, key):
+    c = self.conn.cursor()
+    c.execute('SELECT route FROM route_cache WHERE key = ?', (key, ))
+    row = c.fetchone()
+    if row is None:
+      self.misses += 1
+      log.debug("Route cache miss for {} ({} hits, {} misses)", key, self.hits, self.misses)
+      return None
+    self.hits += 1
+    log.debug("Route cache hit for {} ({} hits, {} misses)", key, self.hits, self.misses)
+    if not self.read_only:
+      c.execute('UPDATE route_cache SET last_used = ? WHERE key = ?', (time.time(), key))
+      self.conn.commit()
+    return json.loads(row[0])
+
+  def put(self, key, data):
+    if self.read_only:
+      return
+    c = self.conn.cursor()
+    c.execute('REPLACE INTO route_cache VALUES (?, ?, ?)', (key, json.dumps(data), time.time()))
+    c.execute('DELETE FROM route_cache WHERE key IN (SELECT key FROM route_cache ORDER BY last_used DESC LIMIT -1 OFFSET ?)', (self.max_entries, ))
+    if c.rowcount > 0:
+      log.debug("Evicted {} routes from the route cache", c.rowcount)
+    self.conn.commit()
+
+  def clear(self, cursor = None):
+    c = cursor if cursor is not None else self.conn.cursor()
+    c.execute('DELETE FROM route_cache')
+    log.debug("Route cache cleared")
+
+
+def _system_key(system):
+  return [system.id64, system.name, system.position.x, system.position.y, system.position.z]
+
+
+def _ship_key(ship):
+  if ship is None:
+    return None
+  fsd = ship.fsd
+  return [type(ship).__name__, ship.mass, ship.tank_size, ship.reserve_tank, ship.cargo_capacity,
+          type(fsd).__name__, getattr(fsd, 'drive', None), getattr(fsd, 'optmass', None), getattr(fsd, 'mass', None),
+          getattr(fsd, 'maxfuel', None), getattr(fsd, 'fuelmul', None), getattr(fsd, 'fuelpower', None),
+          getattr(fsd, 'boost', None), getattr(fsd, 'range_boost', None)]
+
+
+def make_key(sys_from, sys_to, avoid, ship, options):
+  # options is a list of anything else which affects the route, e.g. ranges and strategies
+  parts = [_system_key(sys_from), _system_key(sys_to), sorted(_system_key(s) for s in (avoid or [])), _ship_key(ship), options]
+  return hashlib.sha1(json.dumps(parts, sort_keys = True, default = str).encode('utf-8')).hexdigest()
+
+
+def encode_route(route):
+  # Intermediate systems come from the DB so can be stored as their data;
+  # the endpoints are whatever the caller asked for, so are supplied again on reading
+  if route is None or len(route) < 2 or not all(isinstance(s, KnownSystem) for s in route[1:-1]):
+    return None
+  return [{
+    'id': s.id, 'name': s.name, 'x': s.position.x, 'y': s.position.y, 'z': s.position.z, 'id64': s.id64,
+    'needs_permit': s.needs_system_permit, 'allegiance': s.allegiance, 'arrival_star_class': s.arrival_star.spectral_class,
+  } for s in route[1:-1]]
+
+
+def decode_route(data, sys_from, sys_to):
+  return [sys_from] + [KnownSystem(s) for s in data] + [sys_to]
@@ -4,11 +4,15 @@ import sys
 from . import calc
 from . import env
 from . import filtering
+from . import fsd
+from . import spatial
+from . import routecache
 from . import util
+from . import vecarray
 
 log = util.get_logger("route")
 
-route_strategies = ["astar", "trunkle", "trundle"]
+route_strategies = ["astar", "bidirectional", "neutron", "trunkle", "trundle"]
 default_route_strategy = "astar"
 fuel_strategies = ["none", "station", "scoop", "optimal"]
 default_fuel_strategy = "optimal"
@@ -20,7 +24,7 @@ hbuffer_relax_max = 31.0
 
 class Routing(object):
 
-  def __init__(self, ship, rbuf_base = default_rbuffer_ly, hbuf_base = default_hbuffer_ly, route_strategy = default_route_strategy, fuel_strategy = default_fuel_strategy, witchspace_time = calc.default_ws_time, starting_fuel = None, jump_range = None):
+  def __init__(self, ship, rbuf_base = default_rbuffer_ly, hbuf_base = default_hbuffer_ly, route_strategy = default_route_strategy, fuel_strategy = default_fuel_strategy, witchspace_time = calc.default_ws_time, starting_fuel = None, jump_range = None, use_cache = True):
     self._ship = ship
     if jump_range is not None:
       if fuel_strategy not in ['none', 'optimal']:
@@ -42,32 +46,32 @@ class Routing(object):
     self._trunkle_leg_size = 5.0
     self._trunkle_search_radius = 10.0
     self._trunkle_search_radius_relax_mul = 0.01
+    self._neutron_filler_jumps = 2
+    self._neutron_buffer_mul = 2.0
     self._rejected_routes = {}
+    self._use_cache = use_cache
 
   def lerp(self, in_min, in_max, out_min, out_max, value):
     if in_max == in_min:
       raise Exception("in_min and in_max cannot be the same")
     return out_min + ((out_max - out_min) * (min(in_max, max(0, value - in_min)) / (in_max - in_min)))
 
-  def cylinder(self, stars, vec_from, vec_to, buffer_both):
-    denominator = (vec_to - vec_from).length
-    candidates = []
-    for s in stars:
-      numerator = ((s.position - vec_from).cross(s.position - vec_to)).length
-      dist = numerator / denominator
-      if dist < buffer_both:
-        candidates.append(s)
+  def cylinder_mask(self, coords, vec_from, vec_to, buffer_both):
+    return vecarray.cylinder_mask(coords, vec_from, vec_to, buffer_both)
 
-    return candidates
+  def circle_mask(self, coords, vec, radius):
+    return vecarray.sphere_mask(coords, vec, radius)
 
-  def circle(self, stars, vec, radius):
-    candidates = []
-    for s in stars:
-      dist = (s.position - vec).length
-      if dist < radius:
-        candidates.append(s)
+  # These take either a list of systems or a PointSet, and return the same type
+  def cylinder(self, stars, vec_from, vec_to, buffer_both):
+    if isinstance(stars, vecarray.PointSet):
+      return stars.cylinder(vec_from, vec_to, buffer_both)
+    return vecarray.PointSet(stars).cylinder(vec_from, vec_to, buffer_both).items
 
-    return candidates
+  def circle(self, stars, vec, radius):
+    if isinstance(stars, vecarray.PointSet):
+      return stars.sphere(vec, radius)
+    return vecarray.PointSet(stars).sphere(vec, radius).items
 
   def plot(self, sys_from, sys_to, avoid, jump_range, full_range = None, cargo = 0, route_filters = None):
     self._rejected_routes = {}
@@ -76,6 +80,13 @@ class Routing(object):
       full_range = jump_range
     timer = util.start_timer()
 
+    if self._use_cache:
+      with env.use() as envdata:
+        cached = envdata.get_cached_route(self._cache_key(envdata, sys_from, sys_to, avoid, jump_range, full_range, cargo, route_filters))
+      if cached is not None:
+        log.debug("Route plot from {} to {} found in route cache after {}", sys_from, sys_to, util.format_timer(timer))
+        return routecache.decode_route(cached, sys_from, sys_to)
+
     if self._route_strategy == "trundle":
       # My algorithm - slower but pinpoint
       result = self.plot_trundle(sys_from, sys_to, avoid, jump_range, full_range, cargo, route_filters = route_filters)
@@ -85,33 +96,141 @@ class Routing(object):
     elif self._route_strategy == "astar":
       # A* search - faster but worse fuel efficiency
       result = self.plot_astar(sys_from, sys_to, avoid, jump_range, full_range, cargo, route_filters = route_filters)
+    elif self._route_strategy == "neutron":
+      # Supercharged jumps between neutron stars/white dwarfs where they help
+      result = self.plot_neutron(sys_from, sys_to, avoid, jump_range, full_range, cargo, route_filters = route_filters)
+    elif self._route_strategy == "bidirectional":
+      # A* from both ends at once - explores less of the cylinder on long routes
+      result = self.plot_bidirectional(sys_from, sys_to, avoid, jump_range, full_range, cargo, route_filters = route_filters)
     else:
       log.error("Tried to use invalid route strategy {0}", self._route_strategy)
       result = None
 
+    self.cache_plot(result, sys_from, sys_to, avoid, jump_range, full_range, cargo, route_filters)
+
     log.debug("Route plot from {} to {} using strategy {} finished after {}", sys_from, sys_to, self._route_strategy, util.format_timer(timer))
     return result
 
-  def plot_astar(self, sys_from, sys_to, avoid, jump_range, full_range, cargo = 0, route_filters = None):
+  def _cache_key(self, envdata, sys_from, sys_to, avoid, jump_range, full_range, cargo, route_filters):
+    options = [jump_range, full_range, cargo, route_filters, self._route_strategy, self._fuel_strategy, self._starting_fuel,
+               self._rbuffer_base, self._hbuffer_base, self._ws_time, envdata.get_data_version()]
+    return routecache.make_key(sys_from, sys_to, avoid, self._ship, options)
+
+  # Stores the result of plot(); called separately for plots made in read-only worker processes
+  def cache_plot(self, result, sys_from, sys_to, avoid, jump_range, full_range = None, cargo = 0, route_filters = None):
+    if not self._use_cache:
+      return
+    data = routecache.encode_route(result)
+    if data is not None:
+      with env.use() as envdata:
+        envdata.cache_route(self._cache_key(envdata, sys_from, sys_to, avoid, jump_range, full_range if full_range is not None else jump_range, cargo, route_filters), data)
+
+  def _astar_stars(self, sys_from, sys_to, avoid, route_filters):
     rbuffer_ly = self._rbuffer_base
     with env.use() as envdata:
-      stars_tmp = envdata.find_systems_by_aabb(sys_from.position, sys_to.position, rbuffer_ly, rbuffer_ly, filters = route_filters)
-    stars = [s for s in list(self.cylinder(stars_tmp, sys_from.position, sys_to.position, rbuffer_ly)) if s not in avoid]
+      stars_tmp = envdata.find_systems_by_cylinder(sys_from.position, sys_to.position, rbuffer_ly, filters = route_filters)
+    stars = [s for s in stars_tmp if s not in avoid]
     # Ensure the target system is present, in case it's a "fake" system not in the main list
     if sys_to not in stars:
       stars.append(sys_to)
+    return stars
+
+  def plot_astar(self, sys_from, sys_to, avoid, jump_range, full_range, cargo = 0, route_filters = None):
+    stars = self._astar_stars(sys_from, sys_to, avoid, route_filters)
+
+    valid_neighbour_fn = lambda n, current: n != current and n.distance_to(current) < jump_range
+    validate_fn = lambda route: self.apply_fuel_strategy(route, cargo)
+    cost_fn = lambda cur, neighbour, path: calc.astar_cost(cur, neighbour, path, jump_range, full_range, witchspace_time=self._ws_time, validate_fn=validate_fn)
+    return calc.astar(stars, sys_from, sys_to, valid_neighbour_fn, cost_fn, jump_range)
+
+  def plot_bidirectional(self, sys_from, sys_to, avoid, jump_range, full_range, cargo = 0, route_filters = None):
+    stars = self._astar_stars(sys_from, sys_to, avoid, route_filters)
+    # The backward search needs to be able to reach the start too
+    if sys_from not in stars:
+      stars.append(sys_from)
 
     valid_neighbour_fn = lambda n, current: n != current and n.distance_to(current) < jump_range
     validate_fn = lambda route: self.apply_fuel_strategy(route, cargo)
     cost_fn = lambda cur, neighbour, path: calc.astar_cost(cur, neighbour, path, jump_range, full_range, witchspace_time=self._ws_time, validate_fn=validate_fn)
-    return calc.astar(stars, sys_from, sys_to, valid_neighbour_fn, cost_fn)
+    # Fuel use depends on the route so far, so the backward search can't check it
+    reverse_cost_fn = lambda cur, neighbour, path: calc.astar_cost(cur, neighbour, path, jump_range, full_range, witchspace_time=self._ws_time)
+    return calc.bidirectional_astar(stars, sys_from, sys_to, valid_neighbour_fn, cost_fn, reverse_cost_fn, validate_fn, jump_range)
+
+  def supercharge_boost(self, system):
+    star_class = system.arrival_star_class
+    return fsd.boost_multipliers[star_class] if star_class in system.arrival_star.SUPERCHARGEABLE else 1.0
+
+  def neutron_leg_jumps(self, sys_from, sys_to, jump_range):
+    # The first jump from a superchargeable star is boosted, the rest are normal
+    first_range = jump_range * self.supercharge_boost(sys_from)
+    dist = sys_from.distance_to(sys_to)
+    if dist < first_range:
+      return 1
+    return 1 + int(math.ceil((dist - first_range) / jump_range))
+
+  def neutron_cost_fns(self, sys_to, jump_range, boosted_range):
+    # Costs of legs between superchargeable stars, and the estimate of the
+    # cost from a star to sys_to
+    # Every jump is charged a full cooldown, so that leg costs add up the same
+    # way the estimate counts them; no leg of n jumps covers more than n
+    # boosted ranges, so the estimate never overestimates
+    jump_time = calc.jump_spool_time + self._ws_time + calc.jump_cooldown_time
+    cost_fn = lambda cur, neighbour: jump_time * self.neutron_leg_jumps(cur, neighbour, jump_range) + cur.distance_to(neighbour)
+    heuristic_fn = lambda cur: jump_time * cur.distance_to(sys_to) / boosted_range + cur.distance_to(sys_to)
+    return cost_fn, heuristic_fn
+
+  def plot_neutron(self, sys_from, sys_to, avoid, jump_range, full_range, cargo = 0, route_filters = None):
+    # Plan the route over superchargeable stars alone, allowing a few normal
+    # jumps after each supercharged one, then fill in those normal jumps with
+    # short A* plots. The supercharged jumps aren't checked for fuel.
+    boosted_range = jump_range * max(fsd.boost_multipliers[c] for c in sys_from.arrival_star.SUPERCHARGEABLE)
+    leg_max = boosted_range + jump_range * self._neutron_filler_jumps
+    buffer_ly = max(self._rbuffer_base, jump_range * self._neutron_buffer_mul)
+    # The plan is over superchargeable stars whatever the route filters say;
+    # those only apply to the stars jumped to in between
+    if route_filters is not None and 'arrival_star' in filtering.parse(route_filters):
+      log.warning("Neutron routes supercharge from neutron stars and white dwarfs regardless of the arrival star filter")
+    with env.use() as envdata:
+      stars_tmp = envdata.find_systems_by_cylinder(sys_from.position, sys_to.position, buffer_ly, filters = 'arrival_star=superchargeable')
+    nodes = [s for s in stars_tmp if s not in avoid and s != sys_from and s != sys_to and self.supercharge_boost(s) > 1.0]
+    log.debug("Planning neutron route over {} superchargeable stars", len(nodes))
+    grid = spatial.Grid(nodes + [sys_to], leg_max)
+
+    # sys_to can always be reached, if only by normal jumps
+    neighbours_fn = lambda cur: [n for n in grid.within(cur.position, leg_max) if n != cur] + ([sys_to] if cur.distance_to(sys_to) >= leg_max else [])
+    cost_fn, heuristic_fn = self.neutron_cost_fns(sys_to, jump_range, boosted_range)
+    plan = calc.shortest_path(sys_from, sys_to, neighbours_fn, cost_fn, heuristic_fn)
+    if plan is None:
+      return None
+    log.debug("Neutron plan: {}", plan)
+
+    route = [sys_from]
+    for leg_from, leg_to in zip(plan, plan[1:]):
+      first_range = jump_range * self.supercharge_boost(leg_from)
+      if leg_from.distance_to(leg_to) < first_range:
+        route.append(leg_to)
+        continue
+      if first_range > jump_range:
+        # Supercharged jump as far towards the next star as possible
+        with env.use() as envdata:
+          stars_tmp = envdata.find_systems_by_cylinder(leg_from.position, leg_to.position, self._rbuffer_base, filters = route_filters)
+        landing = [s for s in stars_tmp if s not in avoid and s != leg_from and s.distance_to(leg_from) < first_range]
+        if any(landing):
+          leg_from = min(landing, key=lambda s: s.distance_to(leg_to))
+          route.append(leg_from)
+      filler = self.plot_astar(leg_from, leg_to, avoid, jump_range, full_range, cargo, route_filters = route_filters)
+      if filler is None:
+        log.debug("No filler route from {} to {}", leg_from, leg_to)
+        return None
+      route += filler[1:]
+    return route
 
   def plot_trunkle(self, sys_from, sys_to, avoid, jump_range, full_range, cargo = 0, route_filters = None):
     rbuffer_ly = self._rbuffer_base
     # Get full cylinder to work from
     with env.use() as envdata:
-      stars_tmp = envdata.find_systems_by_aabb(sys_from.position, sys_to.position, rbuffer_ly, rbuffer_ly, filters = route_filters)
-    stars = list(self.cylinder(stars_tmp, sys_from.position, sys_to.position, rbuffer_ly))
+      stars_tmp = vecarray.PointSet(envdata.find_systems_by_aabb(sys_from.position, sys_to.position, rbuffer_ly, rbuffer_ly, filters = route_filters))
+    stars = self.cylinder(stars_tmp, sys_from.position, sys_to.position, rbuffer_ly)
 
     best_jump_count = int(math.ceil(sys_from.distance_to(sys_to) / jump_range))
 
@@ -211,7 +330,9 @@ class Routing(object):
     else:
       with env.use() as envdata:
         stars_tmp = envdata.find_systems_by_aabb(sys_from.position, sys_to.position, rbuffer_ly, rbuffer_ly, filters = route_filters)
-    stars = [s for s in list(self.cylinder(stars_tmp, sys_from.position, sys_to.position, rbuffer_ly)) if s not in avoid]
+    if not isinstance(stars_tmp, vecarray.PointSet):
+      stars_tmp = vecarray.PointSet(stars_tmp)
+    stars = self.cylinder(stars_tmp, sys_from.position, sys_to.position, rbuffer_ly).filter(lambda s: s not in avoid)
 
     log.debug("{0} --> {1}: systems to search from: {2}", sys_from.name, sys_to.name, len(stars))
 
@@ -321,7 +442,7 @@ class Routing(object):
   def apply_fuel_strategy(self, route, cargo = 0):
     if len(route) == 1:
       return route
-    key = ','.join([str(s.id) for s in route])
+    key = calc.route_key(route)
     if key in self._rejected_routes:
       return None
 
@@ -333,16 +454,16 @@ class Routing(object):
         return route
     elif self._fuel_strategy in ['station', 'scoop']:
       cmin, cmax = None, None
-      for i in range(len(route)-1, 0, -1):
-        sys_from, sys_to = route[i-1], route[i]
-        dist = route[i-1].distance_to(route[i])
+      i = len(route)
+      for sys_from, sys_to, dist in calc.route_legs_reversed(route):
+        i -= 1
         at_station = (i == 1)
 
         if cmin is None:
           # Last jump.
           fmin, fmax = self._ship.fuel_weight_range(dist, cargo)
         else:
-          if self.refuel_percent(route[i-1], 0, cmin, cmax, at_station)[0] is not None:
+          if self.refuel_percent(sys_from, 0, cmin, cmax, at_station)[0] is not None:
             # If we can scoop at this star we can arrive on fumes.
             fmin, fmax = self._ship.fuel_weight_range(dist, cargo)
           else:
@@ -362,7 +483,7 @@ class Routing(object):
           if fmin > self._starting_fuel:
             # We are starting off without enough fuel for the first jump.
             # Maybe we can scoop or refuel at the station.
-            pmin, pmax = self.refuel_percent(route[i-1], self._starting_fuel, fmin, fmax, True)
+            pmin, pmax = self.refuel_percent(sys_from, self._starting_fuel, fmin, fmax, True)
             if pmin is None:
               return None
           if fmax < self._starting_fuel:
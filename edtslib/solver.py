@@ -5,6 +5,7 @@ import time
 
 from . import calc
 from . import util
+from . import vecarray
 from . import vector3
 
 log = util.get_logger("solver")
@@ -15,15 +16,22 @@ cluster_size_min = 1
 cluster_divisor = 10
 cluster_iteration_limit = 50
 cluster_repeat_limit = 100
+cluster_restarts = 8
 cluster_route_search_limit = 4
 supercluster_size_max = 8
+exact_max_size = 20
+exact_max_size_python = 12
+local_search_time_limit = 2.0
+local_search_pass_limit = 100
+local_search_segment_max = 3
 
 
 CLUSTERED         = "clustered"
 CLUSTERED_REPEAT  = "clustered-repeat"
 BASIC             = "basic"
 NEAREST_NEIGHBOUR = "nearest-neighbour"
-modes = [CLUSTERED, CLUSTERED_REPEAT, BASIC, NEAREST_NEIGHBOUR]
+EXACT             = "exact"
+modes = [CLUSTERED, CLUSTERED_REPEAT, BASIC, NEAREST_NEIGHBOUR, EXACT]
 
 
 class RouteSet(object):
@@ -74,11 +82,60 @@ class _Cluster(object):
     return "Cluster(size={}, pos={})".format(len(self.systems), self.position)
 
 
+# Solve costs between every pair of a fixed set of stations, worked out once
+# so that the solve modes can look them up rather than recalculating them
+# Pairs with a non-finite distance (e.g. to "Anywhere") are left as None and
+# fall back to calc.solve_cost, so they behave exactly as before
+class _CostMatrix(object):
+  def __init__(self, points, jump_range, witchspace_time):
+    self._points = []
+    self._index = {}
+    for p in points:
+      if id(p) not in self._index:
+        self._index[id(p)] = len(self._points)
+        self._points.append(p)
+    dists = vecarray.distance_matrix(vecarray.coords(self._points))
+    self._costs = []
+    for i in range(len(self._points)):
+      row = []
+      for j, b in enumerate(self._points):
+        dist = float(dists[i][j])
+        row.append(None if math.isinf(dist) or math.isnan(dist) else calc.solve_cost_for_distance(dist, b, jump_range, witchspace_time))
+      self._costs.append(row)
+
+  def __len__(self):
+    return len(self._points)
+
+  def get(self, a, b):
+    i = self._index.get(id(a))
+    j = self._index.get(id(b))
+    if i is None or j is None:
+      return None
+    return self._costs[i][j]
+
+
 class Solver(object):
-  def __init__(self, jump_range, diff_limit, witchspace_time = calc.default_ws_time):
+  def __init__(self, jump_range, diff_limit, witchspace_time = calc.default_ws_time, cost_matrix = True, local_search = True, seed = None):
     self._diff_limit = diff_limit
     self._jump_range = jump_range
     self._ws_time = witchspace_time
+    self._use_cost_matrix = cost_matrix
+    self._use_local_search = local_search
+    self._rng = random.Random(seed)
+    self._costs = None
+
+  def _cost(self, a, b):
+    if self._costs is not None:
+      cost = self._costs.get(a, b)
+      if cost is not None:
+        return cost
+    return calc.solve_cost(a, b, self._jump_range, witchspace_time=self._ws_time)
+
+  def _route_cost(self, route):
+    cost = 0.0
+    for i in range(0, len(route)-1):
+      cost += self._cost(route[i], route[i+1])
+    return cost
 
 
   def solve(self, stations, start, end, maxstops, preferred_mode = CLUSTERED, route_sets = None, tours = None):
@@ -89,9 +146,20 @@ class Solver(object):
 
     timer = util.start_timer()
 
+    if self._use_cost_matrix:
+      points = [start, end] + list(stations)
+      for route_set in (route_sets or []):
+        points += route_set.stations
+      self._costs = _CostMatrix(points, self._jump_range, self._ws_time)
+      log.debug("Built {0}x{0} cost matrix after {1}", len(self._costs), util.format_timer(timer))
+
+    if preferred_mode == EXACT and len(stations) > get_exact_max_size():
+      fallback_mode = BASIC if route_sets else CLUSTERED
+      log.warning("Too many stations ({}) to solve exactly, using mode '{}' instead", len(stations), fallback_mode)
+      preferred_mode = fallback_mode
     # We can't use route sets in clustered mode because systems in the set
     # might end up in different clusters.
-    if route_sets is not None and len(route_sets):
+    if route_sets is not None and len(route_sets) and preferred_mode != EXACT:
       preferred_mode = BASIC
     # If the user asked for clustered but the number of destinations is small enough, just use basic
     if preferred_mode in (CLUSTERED_REPEAT, CLUSTERED) and len(stations) <= max_single_solve_size:
@@ -106,11 +174,18 @@ class Solver(object):
       result = self.solve_basic(stations, start, end, maxstops, route_sets = route_sets, tours = tours), True
     elif preferred_mode == NEAREST_NEIGHBOUR:
       result = self.solve_nearest_neighbour(stations, start, end, maxstops, tours = tours), True
+    elif preferred_mode == EXACT:
+      result = self.solve_exact(stations, start, end, maxstops, route_sets = route_sets, tours = tours), True
     else:
       log.error("Tried to use invalid preferred mode {}", preferred_mode)
       result = None
 
+    # The heuristic modes can usually be improved on by shuffling stops around
+    if result is not None and self._use_local_search and preferred_mode in (CLUSTERED, CLUSTERED_REPEAT, NEAREST_NEIGHBOUR):
+      result = self.improve_route(result[0], tours = tours), result[1]
+
     log.debug("Solve from {} to {} using mode {} finished after {}", start, end, preferred_mode, util.format_timer(timer))
+    self._costs = None
     return result
 
   def solve_basic(self, stations, start, end, maxstops, route_sets = None, tours = None):
@@ -123,7 +198,7 @@ class Solver(object):
       if start == end:
         return [start], 0.0
       else:
-        return [start, end], calc.solve_cost(start, end, self._jump_range, witchspace_time=self._ws_time)
+        return [start, end], self._cost(start, end)
 
     count = 0
     mincost = None
@@ -136,10 +211,10 @@ class Solver(object):
 
     for route in vr:
       count += 1
-      cost_normal = calc.solve_route_cost(route, self._jump_range, witchspace_time=self._ws_time)
+      cost_normal = self._route_cost(route)
       if reversible:
         route_reversed = [route[0]] + list(reversed(route[1:-1])) + [route[-1]]
-        cost_reversed = calc.solve_route_cost(route_reversed, self._jump_range, witchspace_time=self._ws_time)
+        cost_reversed = self._route_cost(route_reversed)
 
         cost = cost_normal if (cost_normal <= cost_reversed) else cost_reversed
         route = route if (cost_normal <= cost_reversed) else route_reversed
@@ -155,6 +230,51 @@ class Solver(object):
     return minroute, mincost
 
 
+  def solve_exact(self, stations, start, end, maxstops, route_sets = None, tours = None):
+    result, _ = self.solve_exact_with_cost(stations, start, end, maxstops, route_sets = route_sets, tours = tours)
+    return result
+
+  def solve_exact_with_cost(self, stations, start, end, maxstops, route_sets = None, tours = None):
+    # Held-Karp: the cheapest path to each (set of stations visited, last
+    # station) is built up one station at a time, so the result is optimal.
+    # Like the basic mode, this visits maxstops-2 stations and only checks
+    # route sets against the final choice of stations
+    n = len(stations)
+    if n > get_exact_max_size():
+      raise ValueError("Too many stations ({}) to solve exactly".format(n))
+    count = min(n, maxstops - 2)
+    if count <= 0:
+      return self.solve_basic_with_cost([], start, end, maxstops)
+    costs = [[self._cost(a, b) for b in stations] for a in stations]
+    start_costs = [_finite_cost(self._cost(start, b)) for b in stations]
+    end_costs = [_finite_cost(self._cost(a, end)) for a in stations]
+    # Each station in a tour needs the one before it to be visited first
+    preds = [-1] * n
+    index = dict((id(stn), i) for i, stn in reversed(list(enumerate(stations))))
+    for tour in (tours or []):
+      for prev, stn in zip(tour, tour[1:]):
+        if id(stn) in index and id(prev) in index:
+          preds[index[id(stn)]] = index[id(prev)]
+    set_bits = []
+    for route_set in (route_sets or []):
+      bits = 0
+      for i, stn in enumerate(stations):
+        if stn in route_set.stations:
+          bits |= 1 << i
+      set_bits.append((bits, route_set.min, route_set.max))
+
+    timer = util.start_timer()
+    if vecarray.have_numpy():
+      order = _held_karp_numpy(costs, start_costs, end_costs, count, preds, set_bits)
+    else:
+      order = _held_karp_python(costs, start_costs, end_costs, count, preds, set_bits)
+    log.debug("Exact solve of {} stations for {} stops finished after {}", n, count, util.format_timer(timer))
+    if order is None:
+      return None, None
+    route = [start] + [stations[i] for i in order] + [end]
+    return route, self._route_cost(route)
+
+
   def solve_nearest_neighbour(self, stations, start, end, maxstops, tours = None):
     result, _ = self.solve_nearest_neighbour_with_cost(stations, start, end, maxstops, tours = tours)
     return result
@@ -169,7 +289,7 @@ class Solver(object):
       for s in remaining:
         if tours and not self._check_tour_route(route[1:], tours, s):
           continue
-        cost = calc.solve_cost(route[-1], s, self._jump_range, witchspace_time=self._ws_time)
+        cost = self._cost(route[-1], s)
         if cost < cur_cost:
           cur_stop = s
           cur_cost = cost
@@ -186,10 +306,11 @@ class Solver(object):
     result, _ = self.solve_clustered_with_cost(stations, start, end, maxstops, tours = tours)
     return result
 
-  def solve_clustered_with_cost(self, stations, start, end, maxstops, tours = None):
-    cluster_count = int(math.ceil(float(len(stations) + 2) / cluster_divisor))
-    log.debug("Splitting problem into {0} clusters...", cluster_count)
-    clusters = find_centers(stations, cluster_count)
+  def solve_clustered_with_cost(self, stations, start, end, maxstops, tours = None, clusters = None):
+    if clusters is None:
+      cluster_count = int(math.ceil(float(len(stations) + 2) / cluster_divisor))
+      log.debug("Splitting problem into {0} clusters...", cluster_count)
+      clusters = find_centers(stations, cluster_count, restarts = cluster_restarts, rng = self._rng)
     clusters = self._resolve_cluster_sizes(clusters)
 
     sclusters = self._get_best_supercluster_route(clusters, start, end)
@@ -234,14 +355,88 @@ class Solver(object):
   def solve_clustered_repeat_with_cost(self, stations, start, end, maxstops, iterations = cluster_repeat_limit, tours = None):
     minroute = None
     mincost = float('inf')
-    for _ in range(0, iterations):
-      route, cost = self.solve_clustered_with_cost(stations, start, end, maxstops, tours = tours)
+    # Cluster for every iteration in one batch rather than one at a time
+    cluster_count = int(math.ceil(float(len(stations) + 2) / cluster_divisor))
+    cluster_sets = find_center_sets(stations, cluster_count, iterations, rng = self._rng)
+    for clusters in cluster_sets:
+      route, cost = self.solve_clustered_with_cost(stations, start, end, maxstops, tours = tours, clusters = clusters)
       if cost < mincost:
         mincost = cost
         minroute = route
     return minroute, mincost
 
 
+  def improve_route(self, route, tours = None, time_limit = local_search_time_limit, pass_limit = local_search_pass_limit):
+    # Local search over the order of the intermediate stops: 2-opt reverses a
+    # run of stops and Or-opt moves a run of up to local_search_segment_max
+    # stops elsewhere. The set of stops never changes, so route sets and
+    # maxstops stay satisfied; stops in a tour keep their relative order.
+    if route is None or len(route) < 4:
+      return route
+    timer = util.start_timer()
+    n = len(route)
+    cost = [[_finite_cost(self._cost(a, b)) for b in route] for a in route]
+    tour_nodes = set()
+    for tour in (tours or []):
+      if len(tour) >= 2:
+        tour_nodes.update(i for i, stn in enumerate(route) if stn in tour)
+    tour_sequence = lambda order: [i for i in order if i in tour_nodes]
+    original_sequence = tour_sequence(range(n))
+    valid = lambda order: not tour_nodes or tour_sequence(order) == original_sequence
+
+    order = list(range(n))
+    original_cost = sum(cost[order[i]][order[i+1]] for i in range(n - 1))
+    passes = 0
+    moves = 0
+    improved = True
+    while improved and passes < pass_limit and util.get_timer(timer) < time_limit:
+      passes += 1
+      improved = False
+      # 2-opt: reverse order[i..j], keeping running sums of the segment's cost in each direction
+      for i in range(1, n - 2):
+        forward = 0.0
+        backward = 0.0
+        for j in range(i + 1, n - 1):
+          forward += cost[order[j-1]][order[j]]
+          backward += cost[order[j]][order[j-1]]
+          a, b = order[i-1], order[j+1]
+          delta = (cost[a][order[j]] + backward + cost[order[i]][b]) - (cost[a][order[i]] + forward + cost[order[j]][b])
+          if delta < -1e-9:
+            candidate = order[:i] + order[j:i-1:-1] + order[j+1:]
+            if valid(candidate):
+              order = candidate
+              moves += 1
+              improved = True
+              forward, backward = backward, forward
+      # Or-opt: move order[i..i+length-1] to sit between two other stops
+      for length in range(1, local_search_segment_max + 1):
+        i = 1
+        while i + length < n:
+          first, last = order[i], order[i+length-1]
+          prev, nxt = order[i-1], order[i+length]
+          removed = cost[prev][first] + cost[last][nxt] - cost[prev][nxt]
+          rest = order[:i] + order[i+length:]
+          best_delta, best_pos = -1e-9, None
+          for p in range(1, len(rest)):
+            if p == i:
+              continue
+            x, y = rest[p-1], rest[p]
+            delta = cost[x][first] + cost[last][y] - cost[x][y] - removed
+            if delta < best_delta:
+              candidate = rest[:p] + order[i:i+length] + rest[p:]
+              if valid(candidate):
+                best_delta, best_pos = delta, p
+          if best_pos is not None:
+            order = rest[:best_pos] + order[i:i+length] + rest[best_pos:]
+            moves += 1
+            improved = True
+          i += 1
+
+    new_cost = sum(cost[order[i]][order[i+1]] for i in range(n - 1))
+    log.debug("Local search made {} moves in {} passes after {}, cost {:.1f} -> {:.1f}", moves, passes, util.format_timer(timer), original_cost, new_cost)
+    return [route[i] for i in order]
+
+
   def _resolve_cluster_sizes(self, pclusters):
     clusters = list(pclusters)
     iterations = 0
@@ -253,7 +448,7 @@ class Solver(object):
         if len(c.systems) > cluster_size_max:
           log.debug("Splitting oversized cluster {} into two", c)
           del clusters[i]
-          newclusters = find_centers(c.systems, 2)
+          newclusters = find_centers(c.systems, 2, rng = self._rng)
           clusters += newclusters
           break
       lengths = [len(c.systems) for c in clusters]
@@ -265,7 +460,7 @@ class Solver(object):
           # Too many clusters, consolidate
           subdiv = int(math.ceil(float(len(clusters)) / supercluster_size_max))
           log.debug("Consolidating from {} to {} superclusters", len(clusters), subdiv)
-          clusters = find_centers(clusters, subdiv)
+          clusters = find_centers(clusters, subdiv, rng = self._rng)
           lengths = [len(c.systems) for c in clusters]
           # If everything is now valid...
           if min(lengths) >= cluster_size_min and max(lengths) <= cluster_size_max and len(clusters) <= supercluster_size_max:
@@ -333,7 +528,7 @@ class Solver(object):
         if tours and not self._check_tour_route(route[1:], tours, stn):
           continue
 
-        dist = calc.solve_cost(route[-1], stn, self._jump_range, witchspace_time=self._ws_time)
+        dist = self._cost(route[-1], stn)
         nexts[stn] = dist
 
       if len(nexts):
@@ -408,41 +603,140 @@ class Solver(object):
       for n2 in cluster2:
         if n2 in disallowed and len(cluster2) > 1: # If len(cluster) is 1, start == end so allow it
           continue
-        cost = calc.solve_cost(n1, n2, self._jump_range, witchspace_time=self._ws_time)
+        cost = self._cost(n1, n2)
         if best is None or cost < bestcost:
           best = (n1, n2)
           bestcost = cost
     return best
 
 
+# Costs to or from "Anywhere" aren't finite; it can be reached from anywhere for free
+def _finite_cost(cost):
+  return cost if not (math.isinf(cost) or math.isnan(cost)) else 0.0
+
+
+#
+# Exact solving
+#
+def get_exact_max_size():
+  return exact_max_size if vecarray.have_numpy() else exact_max_size_python
+
+
+def _held_karp_python(costs, start_costs, end_costs, count, preds, set_bits):
+  n = len(costs)
+  # Each layer maps a set of visited stations to {last station: (cost, previous station)}
+  layer = {}
+  for k in range(n):
+    if preds[k] < 0:
+      layer[1 << k] = {k: (start_costs[k], -1)}
+  layers = [None, layer]
+  for _ in range(1, count):
+    next_layer = {}
+    for mask, ends in layer.items():
+      for k in range(n):
+        bit = 1 << k
+        if mask & bit or (preds[k] >= 0 and not (mask >> preds[k]) & 1):
+          continue
+        entry = next_layer.setdefault(mask | bit, {})
+        for j, (cost, _) in ends.items():
+          new_cost = cost + costs[j][k]
+          if k not in entry or new_cost < entry[k][0]:
+            entry[k] = (new_cost, j)
+    layer = next_layer
+    layers.append(layer)
+  best = None
+  for mask, ends in layer.items():
+    if not all(lo <= bin(mask & bits).count('1') <= hi for bits, lo, hi in set_bits):
+      continue
+    for j, (cost, _) in ends.items():
+      total = cost + end_costs[j]
+      if best is None or total < best[0]:
+        best = (total, mask, j)
+  if best is None:
+    return None
+  _, mask, j = best
+  order = []
+  for c in range(count, 0, -1):
+    order.append(j)
+    prev = layers[c][mask][j][1]
+    mask ^= 1 << j
+    j = prev
+  return list(reversed(order))
+
+
+def _held_karp_numpy(costs, start_costs, end_costs, count, preds, set_bits):
+  np = vecarray.np
+  n = len(costs)
+  masks = np.arange(1 << n, dtype=np.int64)
+  popcount = np.zeros(1 << n, dtype=np.int8)
+  for k in range(n):
+    popcount += ((masks >> k) & 1).astype(np.int8)
+  # Only two layers of costs are held at once, indexed by each mask's slot within its layer
+  slot = np.zeros(1 << n, dtype=np.int64)
+  layers = []
+  for c in range(count + 1):
+    layer = np.nonzero(popcount == c)[0]
+    slot[layer] = np.arange(len(layer))
+    layers.append(layer)
+  cost_matrix = np.array(costs, dtype=np.float64)
+  cur = np.full((len(layers[1]), n), np.inf)
+  for k in range(n):
+    if preds[k] < 0:
+      cur[slot[1 << k], k] = start_costs[k]
+  parents = [None, np.full((len(layers[1]), n), -1, dtype=np.int8)]
+  for c in range(1, count):
+    layer = layers[c]
+    nxt = np.full((len(layers[c+1]), n), np.inf)
+    parent = np.full((len(layers[c+1]), n), -1, dtype=np.int8)
+    for k in range(n):
+      bit = 1 << k
+      allowed = (layer & bit) == 0
+      if preds[k] >= 0:
+        allowed &= ((layer >> preds[k]) & 1) == 1
+      rows = np.nonzero(allowed)[0]
+      if not len(rows):
+        continue
+      candidates = cur[rows] + cost_matrix[:, k][np.newaxis, :]
+      best = np.argmin(candidates, axis=1)
+      dest = slot[layer[rows] | bit]
+      nxt[dest, k] = candidates[np.arange(len(rows)), best]
+      parent[dest, k] = best
+    cur = nxt
+    parents.append(parent)
+  final = layers[count]
+  totals = cur + np.array(end_costs, dtype=np.float64)[np.newaxis, :]
+  for bits, lo, hi in set_bits:
+    included = popcount[final & bits]
+    totals[(included < lo) | (included > hi)] = np.inf
+  if not np.isfinite(totals).any():
+    return None
+  row, j = np.unravel_index(np.argmin(totals), totals.shape)
+  mask = int(final[row])
+  j = int(j)
+  order = []
+  for c in range(count, 0, -1):
+    order.append(j)
+    prev = int(parents[c][slot[mask], j])
+    mask ^= 1 << j
+    j = prev
+  return list(reversed(order))
+
+
 #
 # K-means clustering
 #
-def _cluster_points(X, mu):
-  clusters = [[] for i in range(len(mu))]
-  for x in X:
-    bestmukey = min([(i[0], (x.position - mu[i[0]]).length) for i in enumerate(mu)], key=lambda t: t[1])[0]
-    clusters[bestmukey].append(x)
-  return clusters
-
-
-def _reevaluate_centers(mu, clusters):
-  return [vector3.mean([x.position for x in c]) for c in clusters]
-
-
-def _has_converged(mu, oldmu):
-  return (set(mu) == set(oldmu))
-
-
-def find_centers(X, K):
-  # Initialize to K random centers
-  oldmu = random.sample([x.position for x in X], K)
-  mu = random.sample([x.position for x in X], K)
-  clusters = _cluster_points(X, mu)
-  while not _has_converged(mu, oldmu):
-    oldmu = mu
-    # Assign all points in X to clusters
-    clusters = _cluster_points(X, mu)
-    # Reevaluate centers
-    mu = _reevaluate_centers(oldmu, clusters)
-  return [_Cluster(clusters[i], mu[i]) for i in range(len(mu))]
+def _make_clusters(X, labels, centres):
+  return [_Cluster([x for x, label in zip(X, labels) if label == i], vector3.Vector3(*centre)) for i, centre in enumerate(centres)]
+
+
+def find_center_sets(X, K, count, rng = None):
+  # One clustering per k-means++ restart, all computed in one batch
+  results = vecarray.kmeans(vecarray.coords(X), K, restarts = count, rng = rng)
+  return [_make_clusters(X, labels, centres) for labels, centres, _ in results]
+
+
+def find_centers(X, K, restarts = 1, rng = None):
+  # The best clustering of several restarts, by total squared distance to the centres
+  results = vecarray.kmeans(vecarray.coords(X), K, restarts = restarts, rng = rng)
+  labels, centres, _ = min(results, key=lambda r: r[2])
+  return _make_clusters(X, labels, centres)
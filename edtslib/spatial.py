@@ -0,0 +1,237 @@
+import heapq
+import math
+
+from . import sector
+from . import util
+
+log = util.get_logger("spatial")
+
+
+# A uniform grid over a fixed set of objects with positions, used to answer
+# "what is near this point" queries without scanning every object
+# Cells are keyed by the floor of each coordinate divided by the cell size;
+# a cell size equal to the usual query radius keeps queries to 27 cells
+class Grid(object):
+  def __init__(self, items, cell_size, position_fn = None):
+    if cell_size <= 0.0:
+      raise ValueError("Grid cell size must be positive")
+    self._cell_size = float(cell_size)
+    self._position_fn = position_fn if position_fn is not None else (lambda o: o.position)
+    self._items = list(items)
+    self._cells = {}
+    for i, item in enumerate(self._items):
+      pos = self._position_fn(item)
+      key = self._key(pos.x, pos.y, pos.z)
+      cell = self._cells.get(key)
+      if cell is None:
+        self._cells[key] = [i]
+      else:
+        cell.append(i)
+
+  def __len__(self):
+    return len(self._items)
+
+  @property
+  def cell_size(self):
+    return self._cell_size
+
+  def _coord(self, value):
+    return int(math.floor(value / self._cell_size))
+
+  def _key(self, x, y, z):
+    return (self._coord(x), self._coord(y), self._coord(z))
+
+  def indices_near(self, position, radius):
+    # Returns the indices of every item in cells overlapping the cube around
+    # position; callers must still apply their own exact distance test
+    x0, y0, z0 = self._key(position.x - radius, position.y - radius, position.z - radius)
+    x1, y1, z1 = self._key(position.x + radius, position.y + radius, position.z + radius)
+    result = []
+    cells = self._cells
+    for x in range(x0, x1 + 1):
+      for y in range(y0, y1 + 1):
+        for z in range(z0, z1 + 1):
+          cell = cells.get((x, y, z))
+          if cell is not None:
+            result += cell
+    # Keep the original item order so results don't depend on the grid layout
+    result.sort()
+    return result
+
+  def near(self, position, radius):
+    items = self._items
+    return [items[i] for i in self.indices_near(position, radius)]
+
+  def within(self, position, radius):
+    items = self._items
+    pos_fn = self._position_fn
+    return [items[i] for i in self.indices_near(position, radius) if (pos_fn(items[i]) - position).length < radius]
+
+
+# A bounding volume hierarchy over a fixed set of spheres, used to find the
+# spheres containing a point, or the sphere centres nearest to it, without
+# testing every one
+# Nodes are split at the median centre along their widest axis; their boxes
+# are padded a little so that rounding never excludes a sphere which the
+# exact distance test would include
+class SphereTree(object):
+  _leaf_size = 4
+  _padding = 1e-6
+
+  def __init__(self, items, centre_fn = None, radius_fn = None):
+    centre_fn = centre_fn if centre_fn is not None else (lambda o: o.centre)
+    radius_fn = radius_fn if radius_fn is not None else (lambda o: o.radius)
+    self._items = list(items)
+    self._centres = [centre_fn(o) for o in self._items]
+    self._radii = [radius_fn(o) for o in self._items]
+    self._root = self._build(list(range(len(self._items)))) if self._items else None
+
+  def __len__(self):
+    return len(self._items)
+
+  @property
+  def items(self):
+    return self._items
+
+  def _build(self, indices):
+    # Nodes are (lo, hi, children, indices), with one of the last two None
+    centres = self._centres
+    radii = self._radii
+    lo = tuple(min(centres[i][a] - radii[i] for i in indices) - self._padding for a in range(3))
+    hi = tuple(max(centres[i][a] + radii[i] for i in indices) + self._padding for a in range(3))
+    if len(indices) <= self._leaf_size:
+      return (lo, hi, None, indices)
+    spans = [max(centres[i][a] for i in indices) - min(centres[i][a] for i in indices) for a in range(3)]
+    axis = spans.index(max(spans))
+    indices.sort(key=lambda i: centres[i][axis])
+    mid = len(indices) // 2
+    return (lo, hi, (self._build(indices[:mid]), self._build(indices[mid:])), None)
+
+  def indices_containing(self, position):
+    # Returns the indices of every sphere containing position, in item order
+    result = []
+    if self._root is None:
+      return result
+    centres = self._centres
+    radii = self._radii
+    x, y, z = position.x, position.y, position.z
+    stack = [self._root]
+    while stack:
+      lo, hi, children, indices = stack.pop()
+      if x < lo[0] or y < lo[1] or z < lo[2] or x > hi[0] or y > hi[1] or z > hi[2]:
+        continue
+      if children is not None:
+        stack += children
+      else:
+        # The same test as HASphere.contains
+        result += [i for i in indices if (centres[i] - position).length <= radii[i]]
+    result.sort()
+    return result
+
+  def containing(self, position):
+    items = self._items
+    return [items[i] for i in self.indices_containing(position)]
+
+  def nearest(self, position, max_distance = None):
+    # Yields (distance, index) for each item, in order of the distance from
+    # position to its centre; items at the same distance come in item order
+    # Only as much of the tree as the caller consumes is visited, so taking
+    # the first few is cheap
+    if self._root is None:
+      return
+    centres = self._centres
+    x, y, z = position.x, position.y, position.z
+    # Nodes sort before items at the same distance, as they may hold
+    # earlier items at that distance
+    heap = [(0.0, 0, 0, self._root)]
+    count = 1
+    while heap:
+      dist, kind, key, entry = heapq.heappop(heap)
+      if kind == 1:
+        yield (dist, key)
+        continue
+      lo, hi, children, indices = entry
+      if children is not None:
+        for child in children:
+          clo, chi = child[0], child[1]
+          dx = max(clo[0] - x, 0.0, x - chi[0])
+          dy = max(clo[1] - y, 0.0, y - chi[1])
+          dz = max(clo[2] - z, 0.0, z - chi[2])
+          bound = math.sqrt(dx*dx + dy*dy + dz*dz)
+          if max_distance is None or bound < max_distance:
+            heapq.heappush(heap, (bound, 0, count, child))
+            count += 1
+      else:
+        for i in indices:
+          d = (position - centres[i]).length
+          if max_distance is None or d < max_distance:
+            heapq.heappush(heap, (d, 1, i, None))
+
+
+# Morton (Z-order) keys
+# Positions are quantised to 1/8Ly cells measured from the galactic origin and
+# the three 21-bit cell coordinates are interleaved, so a key fits in a signed
+# 64-bit integer and systems which are close in space tend to be close in key
+# order; this is enough to cover the whole galaxy
+morton_bits = 21
+morton_cell_size = 0.125
+morton_origin = (sector.internal_origin_offset.x, sector.internal_origin_offset.y, sector.internal_origin_offset.z)
+_morton_max_cell = (1 << morton_bits) - 1
+
+def _morton_spread(v):
+  # Spaces out the low 21 bits of v so there are two zero bits between each
+  # Works the same on numpy int64 arrays, as used by vecarray.morton_keys
+  v &= 0x1FFFFF
+  v = (v | (v << 32)) & 0x1F00000000FFFF
+  v = (v | (v << 16)) & 0x1F0000FF0000FF
+  v = (v | (v << 8)) & 0x100F00F00F00F00F
+  v = (v | (v << 4)) & 0x10C30C30C30C30C3
+  v = (v | (v << 2)) & 0x1249249249249249
+  return v
+
+def morton_cell(value, axis):
+  cell = int(math.floor((value - morton_origin[axis]) / morton_cell_size))
+  return min(_morton_max_cell, max(0, cell))
+
+def morton_interleave(cx, cy, cz):
+  return _morton_spread(cx) | (_morton_spread(cy) << 1) | (_morton_spread(cz) << 2)
+
+def morton_key(x, y, z):
+  return morton_interleave(morton_cell(x, 0), morton_cell(y, 1), morton_cell(z, 2))
+
+def morton_ranges(min_x, min_y, min_z, max_x, max_y, max_z, max_ranges = 64):
+  # Decomposes a box into inclusive (first, last) Morton key ranges, which
+  # together cover every cell the box touches; when that would take more than
+  # max_ranges ranges, partially covered octree nodes are included whole
+  # Callers must still apply their own exact test to whatever the ranges find
+  lo = (morton_cell(min_x, 0), morton_cell(min_y, 1), morton_cell(min_z, 2))
+  hi = (morton_cell(max_x, 0), morton_cell(max_y, 1), morton_cell(max_z, 2))
+  ranges = []
+  pending = [(0, 0, 0)]
+  level = morton_bits
+  while pending:
+    partial = []
+    for node in pending:
+      if any(node[a] > hi[a] or node[a] + (1 << level) - 1 < lo[a] for a in range(3)):
+        continue
+      if level == 0 or all(lo[a] <= node[a] and node[a] + (1 << level) - 1 <= hi[a] for a in range(3)):
+        start = morton_interleave(*node)
+        ranges.append((start, start + (1 << (3 * level)) - 1))
+      else:
+        partial.append(node)
+    if len(ranges) + 8 * len(partial) > max_ranges:
+      for node in partial:
+        start = morton_interleave(*node)
+        ranges.append((start, start + (1 << (3 * level)) - 1))
+      break
+    level -= 1
+    half = 1 << level
+    pending = [(x + dx, y + dy, z + dz) for x, y, z in partial for dz in (0, half) for dy in (0, half) for dx in (0, half)]
+  ranges.sort()
+  merged = []
+  for first, last in ranges:
+    if merged and first <= merged[-1][1] + 1:
+      merged[-1] = (merged[-1][0], max(merged[-1][1], last))
+    else:
+      merged.append((first, last))
+  return merged
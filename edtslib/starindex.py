@@ -0,0 +1,312 @@
+import array
+import json
+import os
+import shutil
+
+from . import filtering
+from . import spatial
+from . import system_internal
+from . import util
+from . import vecarray
+from . import vector3
+
+try:
+  import numpy as np
+except ImportError:
+  np = None
+
+log = util.get_logger("starindex")
+
+index_version = 2
+default_suffix = '.starindex'
+
+_permit_values = {None: 0, False: 1, True: 2}
+_permit_lookup = [None, False, True]
+_permit_shift = 8
+_class_mask = 0xFF
+
+# Filter keys which can be answered entirely from the index
+_supported_filters = set(['close_to', 'arrival_star', 'limit', 'x', 'y', 'z'])
+
+_operators = {
+  '<': lambda a, b: a < b,
+  '<=': lambda a, b: a <= b,
+  '=': lambda a, b: a == b,
+  '>=': lambda a, b: a >= b,
+  '>': lambda a, b: a > b,
+  '!=': lambda a, b: a != b,
+  '<>': lambda a, b: a != b,
+}
+
+_files = ['pos', 'morton', 'id', 'id64', 'flags', 'name_start', 'name_len', 'names']
+
+# Upper bound on the Morton key ranges scanned for one AABB query
+_max_ranges = 256
+
+
+def is_available():
+  return np is not None
+
+
+# A packed, read-only copy of the systems table
+# Positions are held as float32; EDSM coordinates are multiples of 1/32Ly so
+# they are represented exactly, and all range tests are done in float64
+# Rows are sorted by Morton key (see spatial.morton_key), so an AABB query is a
+# handful of binary searches and contiguous reads, even from a cold mmap
+class StarIndex(object):
+  def __init__(self, path, meta, arrays):
+    self._path = path
+    self._meta = meta
+    self._classes = meta['classes']
+    self._pos = arrays['pos']
+    self._id = arrays['id']
+    self._id64 = arrays['id64']
+    self._flags = arrays['flags']
+    self._name_start = arrays['name_start']
+    self._name_len = arrays['name_len']
+    self._names = arrays['names']
+    self._morton = arrays['morton']
+
+  def __len__(self):
+    return len(self._id)
+
+  @property
+  def path(self):
+    return self._path
+
+  @property
+  def data_version(self):
+    return self._meta.get('data_version')
+
+  @classmethod
+  def load(self, path, data_version = None):
+    if np is None:
+      return None
+    try:
+      with open(os.path.join(path, 'meta.json'), 'r') as f:
+        meta = json.load(f)
+    except (IOError, OSError, ValueError):
+      return None
+    if meta.get('version') != index_version:
+      log.debug("Star index at {} has version {}, expected {}", path, meta.get('version'), index_version)
+      return None
+    if data_version is not None and meta.get('data_version') != data_version:
+      log.debug("Star index at {} is out of date", path)
+      return None
+    try:
+      arrays = dict((name, np.load(os.path.join(path, '{}.npy'.format(name)), mmap_mode = 'r')) for name in _files)
+    except (IOError, OSError, ValueError) as ex:
+      log.warning("Failed to load star index from {}: {}", path, ex)
+      return None
+    log.debug("Loaded star index of {} systems from {}", len(arrays['id']), path)
+    return self(path, meta, arrays)
+
+  @classmethod
+  def build(self, systems, path, data_version = None):
+    # systems is an iterable of system result dicts, as returned by the backend
+    if np is None:
+      raise RuntimeError("The star index requires numpy")
+    timer = util.start_timer()
+    pos = array.array('f')
+    ids = array.array('q')
+    id64s = array.array('q')
+    flags = array.array('H')
+    name_start = array.array('q')
+    name_len = array.array('L')
+    names = bytearray()
+    classes = [None]
+    class_codes = {None: 0}
+    for s in systems:
+      cls = s.get('arrival_star_class')
+      code = class_codes.get(cls)
+      if code is None:
+        code = class_codes[cls] = len(classes)
+        classes.append(cls)
+        if code > _class_mask:
+          raise ValueError("Too many distinct arrival star classes for the star index")
+      pos.extend((s['x'], s['y'], s['z']))
+      ids.append(s['id'] if s['id'] is not None else -1)
+      id64s.append(s['id64'] if s['id64'] is not None else -1)
+      permit = s.get('needs_permit')
+      flags.append(code | (_permit_values[bool(permit) if permit is not None else None] << _permit_shift))
+      name = util.get_bytes(s['name'])
+      name_start.append(len(names))
+      name_len.append(len(name))
+      names += name
+    count = len(ids)
+    log.debug("Read {} systems for star index in {}", count, util.format_timer(timer))
+
+    arrays = {
+      'pos': np.frombuffer(pos, dtype=np.float32).reshape((count, 3)) if count else np.zeros((0, 3), dtype=np.float32),
+      'id': np.frombuffer(ids, dtype=np.int64) if count else np.zeros(0, dtype=np.int64),
+      'id64': np.frombuffer(id64s, dtype=np.int64) if count else np.zeros(0, dtype=np.int64),
+      'flags': np.frombuffer(flags, dtype=np.uint16) if count else np.zeros(0, dtype=np.uint16),
+      'name_start': np.frombuffer(name_start, dtype=np.int64) if count else np.zeros(0, dtype=np.int64),
+      'name_len': np.array(name_len, dtype=np.uint32),
+    }
+    arrays['morton'] = vecarray.morton_keys(arrays['pos'])
+    order = np.argsort(arrays['morton'], kind='mergesort')
+    arrays = dict((k, v[order]) for k, v in arrays.items())
+    arrays['names'] = np.frombuffer(bytes(names), dtype=np.uint8) if len(names) else np.zeros(0, dtype=np.uint8)
+
+    meta = {'version': index_version, 'data_version': data_version, 'count': count, 'classes': classes}
+    tmp_path = path + '.tmp'
+    if os.path.isdir(tmp_path):
+      shutil.rmtree(tmp_path)
+    os.makedirs(tmp_path)
+    for name in _files:
+      np.save(os.path.join(tmp_path, '{}.npy'.format(name)), arrays[name])
+    with open(os.path.join(tmp_path, 'meta.json'), 'w') as f:
+      json.dump(meta, f)
+    if os.path.isdir(path):
+      shutil.rmtree(path)
+    os.rename(tmp_path, path)
+    log.debug("Wrote star index of {} systems to {} in {}", count, path, util.format_timer(timer))
+    return self.load(path, data_version)
+
+  def supports_filters(self, filters):
+    if not filters:
+      return True
+    return all(k in _supported_filters for k in filters)
+
+  def _name(self, i):
+    start = int(self._name_start[i])
+    return self._names[start:start + int(self._name_len[i])].tobytes().decode('utf-8')
+
+  def _make_system(self, i):
+    flags = int(self._flags[i])
+    sysid = int(self._id[i])
+    id64 = int(self._id64[i])
+    return system_internal.KnownSystem({
+      'id': sysid if sysid >= 0 else None,
+      'name': self._name(i),
+      'x': float(self._pos[i, 0]),
+      'y': float(self._pos[i, 1]),
+      'z': float(self._pos[i, 2]),
+      'id64': id64 if id64 >= 0 else None,
+      'needs_permit': _permit_lookup[flags >> _permit_shift],
+      'arrival_star_class': self._classes[flags & _class_mask],
+    })
+
+  def systems(self, indices):
+    for i in indices:
+      yield self._make_system(int(i))
+
+  def _candidates(self, min_x, min_y, min_z, max_x, max_y, max_z):
+    ranges = spatial.morton_ranges(min_x, min_y, min_z, max_x, max_y, max_z, _max_ranges)
+    if not ranges:
+      return np.zeros(0, dtype=np.intp)
+    bounds = np.array(ranges, dtype=np.int64)
+    lo = np.searchsorted(self._morton, bounds[:, 0], side='left')
+    hi = np.searchsorted(self._morton, bounds[:, 1], side='right')
+    return np.concatenate([np.arange(a, b) for a, b in zip(lo, hi)])
+
+  def _positions(self, indices):
+    return self._pos[indices].astype(np.float64)
+
+  def aabb_indices(self, min_x, min_y, min_z, max_x, max_y, max_z):
+    # The key ranges cover whole cells, so this is followed by the exact test
+    indices = self._candidates(min_x, min_y, min_z, max_x, max_y, max_z)
+    pos = self._positions(indices)
+    mask = (min_x <= pos[:, 0]) & (pos[:, 0] < max_x) & (min_y <= pos[:, 1]) & (pos[:, 1] < max_y) & (min_z <= pos[:, 2]) & (pos[:, 2] < max_z)
+    return indices[mask]
+
+  def filter_indices(self, indices, filters):
+    # Applies the supported filters to a set of row indices, returning the
+    # surviving indices in the order the SQL equivalent would sort them
+    if indices is None:
+      indices = np.arange(len(self))
+    if not filters:
+      return indices
+    pos = self._positions(indices)
+    mask = np.ones(len(indices), dtype=bool)
+    order_keys = []
+    for axis, col in (('x', 0), ('y', 1), ('z', 2)):
+      for oentry in filters.get(axis, []):
+        for entry in oentry[filtering.PosArgs]:
+          mask &= _operators[entry.operator](pos[:, col], entry.value)
+    for oentry in filters.get('close_to', []):
+      for entry in oentry[filtering.PosArgs]:
+        ref = util.get_as_position(entry.value)
+        diff = np.array([ref.x, ref.y, ref.z]) - pos
+        dist2 = diff[:, 0] * diff[:, 0] + diff[:, 1] * diff[:, 1] + diff[:, 2] * diff[:, 2]
+        for opval in oentry.get('distance', []):
+          if opval.operator in ('<', '<=', '='):
+            for col in range(3):
+              mask &= _operators[opval.operator](diff[:, col], opval.value)
+          mask &= _operators[opval.operator](dist2, opval.value * opval.value)
+        order_keys.append(dist2)
+        for dentry in oentry.get('direction', []):
+          dpos = util.get_as_position(dentry.value)
+          angle = _angles(-diff, np.array([dpos.x - ref.x, dpos.y - ref.y, dpos.z - ref.z]))
+          for aentry in oentry.get('angle', []):
+            mask &= _operators[aentry.operator](angle, aentry.value * np.pi / 180.0)
+          order_keys.append(angle)
+    if 'arrival_star' in filters:
+      codes = self._flags[indices] & _class_mask
+      for oentry in filters['arrival_star']:
+        for entry in oentry[filtering.PosArgs]:
+          if entry.operator == '=' and entry.value is filtering.Any:
+            mask &= (codes != 0)
+          elif entry.operator in ['!=', '<>'] and entry.value is filtering.Any:
+            mask &= (codes == 0)
+          else:
+            wanted = [i for i, c in enumerate(self._classes) if c is not None and c in entry.value]
+            matches = np.isin(codes, wanted)
+            if entry.operator == '=':
+              mask &= matches
+            elif entry.operator == '!=':
+              # '!=' lets unknown classes through, '<>' doesn't (as NOT IN in SQL)
+              mask &= (~matches) | (codes == 0)
+            else:
+              mask &= (~matches) & (codes != 0)
+    result = indices[mask]
+    if order_keys:
+      key = order_keys[0][mask]
+      for extra in order_keys[1:]:
+        key = key + extra[mask]
+      result = result[np.argsort(key, kind='mergesort')]
+    if 'limit' in filters:
+      result = result[:int(filters['limit'][0][filtering.PosArgs][0].value)]
+    return result
+
+  def find_systems_by_aabb(self, min_x, min_y, min_z, max_x, max_y, max_z, filters = None):
+    return list(self.systems(self.filter_indices(self.aabb_indices(min_x, min_y, min_z, max_x, max_y, max_z), filters)))
+
+  def find_systems_by_cylinder(self, vec_from, vec_to, buffer_both, filters = None):
+    indices = self.aabb_indices(
+      min(vec_from.x, vec_to.x) - buffer_both, min(vec_from.y, vec_to.y) - buffer_both, min(vec_from.z, vec_to.z) - buffer_both,
+      max(vec_from.x, vec_to.x) + buffer_both, max(vec_from.y, vec_to.y) + buffer_both, max(vec_from.z, vec_to.z) + buffer_both)
+    mask = vecarray.cylinder_mask(self._positions(indices), vec_from, vec_to, buffer_both)
+    return list(self.systems(self.filter_indices(indices[mask], filters)))
+
+  def find_all_systems(self, filters = None):
+    return self.systems(self.filter_indices(None, filters))
+
+
+def _angles(vecs, direction):
+  # Vectorised equivalent of Vector3.angle_to for each row of vecs
+  lengths = np.sqrt(vecs[:, 0] * vecs[:, 0] + vecs[:, 1] * vecs[:, 1] + vecs[:, 2] * vecs[:, 2])
+  dlength = vector3.Vector3(direction).length
+  with np.errstate(divide='ignore', invalid='ignore'):
+    dot_p = (vecs[:, 0] / lengths) * (direction[0] / dlength) + (vecs[:, 1] / lengths) * (direction[1] / dlength) + (vecs[:, 2] / lengths) * (direction[2] / dlength)
+    angles = np.arccos(np.clip(dot_p, -1.0, 1.0))
+  angles[np.abs(dot_p - 1.0) < 0.000001] = 0.0
+  return angles
+
+
+def open_index(backend, build = True):
+  # Loads the sidecar index for a backend, (re)building it if it is missing or stale
+  if np is None:
+    log.warning("The star index requires numpy, which is not available; falling back to the database")
+    return None
+  path = backend.get_sidecar_path(default_suffix)
+  if path is None:
+    log.warning("Backend {} does not support a star index", backend.backend_name)
+    return None
+  data_version = backend.get_data_version()
+  index = StarIndex.load(path, data_version)
+  if index is None and build:
+    log.info("Building star index at {}, this may take some time...", path)
+    index = StarIndex.build(backend.find_all_systems(), path, data_version)
+  return index
@@ -30,9 +30,17 @@ class System(object):
     self._id64 = id64
     self._uncertainty = uncertainty
     self.uses_sc = False
-    self._hash = u"{}/{},{},{}".format(self.name, self.position.x, self.position.y, self.position.z).__hash__()
+    self._hash = self._calc_hash()
     self._arrival_star = Star({ 'name': name, 'is_main_star': True, })
 
+  def _calc_hash(self):
+    return u"{}/{},{},{}".format(self.name, self.position.x, self.position.y, self.position.z).__hash__()
+
+  def __setstate__(self, state):
+    # String hashes differ between processes, so a pickled hash can't be trusted
+    self.__dict__.update(state)
+    self._hash = self._calc_hash()
+
   @property
   def system_name(self):
     """The system's name, or None if this is not available"""
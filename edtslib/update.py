@@ -7,17 +7,19 @@ import collections
 import csv
 import gc
 import json
+import multiprocessing
 import os
 import shutil
 import re
 import sys
-import tempfile
 
 from . import db_sqlite3 as db
 from . import defs
+from . import download
 from . import env
+from . import gzipstream
+from . import pgtable
 from . import util
-from .thirdparty import gzipinputstream as gzis
 
 log = util.get_logger("update")
 
@@ -27,25 +29,41 @@ class DownloadOnly(object):
     for _ in many:
       continue
   populate_table_systems = ignore
+  populate_table_system_rows = ignore
+  upsert_system_rows = ignore
   populate_table_stations = ignore
   populate_table_coriolis_fsds = ignore
+  def get_systems_watermark(self): return None
+  def set_systems_watermark(self, watermark): pass
   def close(self): pass
 
 edsm_systems_url  = "https://www.edsm.net/dump/systemsWithCoordinates.json.gz"
 edsm_syspop_url   = "https://www.edsm.net/dump/systemsPopulated.json.gz"
+edsm_sysdelta_url = "https://www.edsm.net/dump/systemsWithCoordinates7days.json.gz"
 edsm_stations_url = "https://www.edsm.net/dump/stations.json.gz"
 coriolis_fsds_url = "https://raw.githubusercontent.com/edcd/coriolis-data/master/modules/standard/frame_shift_drive.json"
 
 local_path = 'data'
 edsm_systems_local_path  = os.path.join(local_path, "systemsWithCoordinates.json")
 edsm_syspop_local_path   = os.path.join(local_path, "systemsPopulated.json")
+edsm_sysdelta_local_path = os.path.join(local_path, "systemsWithCoordinates7days.json")
 edsm_stations_local_path = os.path.join(local_path, "stations.json")
 coriolis_fsds_local_path = os.path.join(local_path, "frame_shift_drive.json")
 
 _re_json_line = re.compile(r'^\s*(\{.*\})[\s,]*$')
 
+default_jobs = 1
+# Size of the blocks of whole lines handed to import workers
+import_block_size = 1 << 20
+# Rows committed at a time by imports which can be resumed
+import_checkpoint_rows = 100000
+# Suffixes of the journal kept alongside a DB being imported into, and of a
+# new DB being built by a clean update
+import_journal_suffix = '.import.json'
+partial_db_suffix = '.partial'
+
 default_steps = ['clean', 'systems', 'stations', 'fsds']
-extra_steps   = ['systems_populated', 'id64']
+extra_steps   = ['systems_populated', 'systems_delta', 'id64', 'sector_table']
 valid_steps   = default_steps + extra_steps
 all_steps     = valid_steps + ['default', 'extra', 'all']
 
@@ -108,6 +126,54 @@ def read_all_json(data):
   return json.loads(data)
 
 
+# Runs in import worker processes: turns a block of whole lines of an EDSM
+# systems dump into systems table rows
+def parse_edsm_systems_block(block):
+  rows = []
+  failed = 0
+  for line in block.decode('utf-8').splitlines():
+    obj = read_line_json(line, None)
+    if obj is None:
+      failed += 1
+    elif obj is not False:
+      rows.append(db.edsm_system_row(obj))
+  return (rows, failed, len(block))
+
+
+# Like pool.imap, but reading no more than depth items ahead of the results
+# being consumed, so that a fast reader can't fill memory with pending work
+def bounded_imap(pool, fn, items, depth):
+  pending = collections.deque()
+  for item in items:
+    pending.append(pool.apply_async(fn, (item, )))
+    if len(pending) >= depth:
+      yield pending.popleft().get()
+  while pending:
+    yield pending.popleft().get()
+
+
+# How far an import from a local file into a DB has got; only valid for the
+# same file, unchanged, imported for the same purpose
+class ImportJournal(object):
+  def __init__(self, path, url, description):
+    self.path = path
+    filename = util.url_to_path(url)
+    stat = os.stat(filename) if os.path.isfile(filename) else None
+    self.key = {'url': url, 'description': description, 'size': stat.st_size if stat else None, 'mtime': stat.st_mtime if stat else None}
+    saved = download.load_json(path)
+    self.offset = saved['offset'] if saved is not None and saved.get('key') == self.key else 0
+    # Left by an import of something else, which this one can't carry on
+    self.stale = saved is not None and saved.get('key') != self.key
+
+  def save(self, offset):
+    self.offset = offset
+    download.save_json(self.path, {'key': self.key, 'offset': offset})
+
+  def remove(self):
+    if os.path.exists(self.path):
+      os.unlink(self.path)
+
+
 def cleanup_local(f, scratch):
   if f is not None and not f.closed:
     try:
@@ -135,11 +201,15 @@ class Application(object):
     ap.add_argument('-l', '--local', required=False, action='store_true', help='Instead of downloading, update from local files in the data directory')
     ap.add_argument(      '--steps', required=False, type=steps_type, default=default_steps, help='Manually (re-)perform comma-separated steps of the update process.')
     ap.add_argument(      '--print-urls', required=False, action='store_true', help='Do not download anything, just print the URLs which we would fetch from')
+    ap.add_argument(      '--delta-source', required=False, help='File or URL of changed systems (one JSON object per line) for the systems_delta step, instead of the EDSM last 7 days dump')
+    ap.add_argument('-j', '--jobs', required=False, type=int, default=default_jobs, help='Worker processes to parse systems data with; with more than one, reading, parsing and writing to the DB are pipelined')
     args = ap.parse_args(sys.argv[1:])
     if args.batch or args.batch_size:
       args.batch_size = args.batch_size if args.batch_size is not None else 1024
       if not args.batch_size > 0:
         raise ValueError("Batch size must be a natural number!")
+    if args.jobs < 1:
+      raise ValueError("Number of jobs must be a natural number!")
     args.copy_local = args.download_only or args.copy_local
     if args.copy_local and args.local:
       raise ValueError("Invalid use of --local and --{}!", "download-only" if args.download_only else "copy-local")
@@ -175,14 +245,19 @@ class Application(object):
         os.makedirs(db_dir)
 
       if 'clean' in self.args.steps:
-        # Open then close a temporary file, essentially reserving the name.
-        fd, db_tmp_filename = tempfile.mkstemp('.tmp', os.path.basename(db_file), db_dir if db_dir else '.')
-        os.close(fd)
-
-        log.info("Initialising database...")
-        sys.stdout.flush()
+        # The new DB is only moved into place once the update succeeds; until
+        # then an interrupted import into it can be carried on by the next run
+        db_tmp_filename = db_file + partial_db_suffix
         t = util.start_timer()
-        dbc = db.initialise_db(db_tmp_filename)
+        dbc = self.open_partial_db(db_tmp_filename)
+        if dbc is None:
+          for path in [db_tmp_filename, db_tmp_filename + import_journal_suffix]:
+            if os.path.isfile(path):
+              os.unlink(path)
+          log.info("Initialising database...")
+          sys.stdout.flush()
+          dbc = db.initialise_db(db_tmp_filename)
+        dbc.enable_bulk_load()
         db_open_filename = db_tmp_filename
         log.info("Done in {}.", util.format_timer(t))
       else:
@@ -196,35 +271,48 @@ class Application(object):
         else:
           log.error("Failed to open existing DB!")
           sys.exit(2)
+      self.db_open_filename = db_open_filename
 
     try:
       # Repoint local paths to use the right relative path
       cur_edsm_systems_local_path  = os.path.join(relpath, edsm_systems_local_path)
       cur_edsm_syspop_local_path   = os.path.join(relpath, edsm_syspop_local_path)
+      cur_edsm_sysdelta_local_path = os.path.join(relpath, edsm_sysdelta_local_path)
       cur_edsm_stations_local_path = os.path.join(relpath, edsm_stations_local_path)
       cur_coriolis_fsds_local_path = os.path.join(relpath, coriolis_fsds_local_path)
-      # Decide whether to source data from local paths or remote URLs
-      edsm_systems_path  = util.path_to_url(cur_edsm_systems_local_path)  if self.args.local else edsm_systems_url
-      edsm_syspop_path   = util.path_to_url(cur_edsm_syspop_local_path)   if self.args.local else edsm_syspop_url
-      edsm_stations_path = util.path_to_url(cur_edsm_stations_local_path) if self.args.local else edsm_stations_url
-      coriolis_fsds_path = util.path_to_url(cur_coriolis_fsds_local_path) if self.args.local else coriolis_fsds_url
-
       if self.args.copy_local:
         download_dir = os.path.sep.join([relpath, local_path])
         if not os.path.exists(download_dir):
           os.makedirs(download_dir)
 
       if 'systems' in self.args.steps:
-        dbc.populate_table_systems(self.import_json_from_url(edsm_systems_path, cur_edsm_systems_local_path, 'EDSM systems', self.args.batch_size, is_url_local=self.args.local), True)
+        source = self.get_source(edsm_systems_url, cur_edsm_systems_local_path)
+        if source is not None and not self.args.download_only:
+          self.import_systems(dbc, source, 'EDSM systems', True)
         log.info("Done.")
       if 'systems_populated' in self.args.steps:
-        dbc.populate_table_systems(self.import_json_from_url(edsm_syspop_path, cur_edsm_syspop_local_path, 'EDSM populated systems', self.args.batch_size, is_url_local=self.args.local))
+        source = self.get_source(edsm_syspop_url, cur_edsm_syspop_local_path)
+        if source is not None and not self.args.download_only:
+          self.import_systems(dbc, source, 'EDSM populated systems')
+        log.info("Done.")
+      if 'systems_delta' in self.args.steps:
+        if self.args.delta_source is not None:
+          is_delta_local = '://' not in self.args.delta_source
+          source = (util.path_to_url(self.args.delta_source) if is_delta_local else self.args.delta_source, is_delta_local)
+        else:
+          source = self.get_source(edsm_sysdelta_url, cur_edsm_sysdelta_local_path)
+        if source is not None and not self.args.download_only:
+          self.import_systems_delta(dbc, source[0], 'EDSM changed systems', is_url_local=source[1])
         log.info("Done.")
       if 'stations' in self.args.steps:
-        dbc.populate_table_stations(self.import_json_from_url(edsm_stations_path, cur_edsm_stations_local_path, 'EDSM stations', self.args.batch_size, is_url_local=self.args.local))
+        source = self.get_source(edsm_stations_url, cur_edsm_stations_local_path)
+        if source is not None and not self.args.download_only:
+          dbc.populate_table_stations(self.import_json_from_url(source[0], 'EDSM stations', self.args.batch_size, is_url_local=source[1]))
         log.info("Done.")
       if 'fsds' in self.args.steps:
-        dbc.populate_table_coriolis_fsds(self.import_json_from_url(coriolis_fsds_path, cur_coriolis_fsds_local_path, 'Coriolis FSDs', None, is_url_local=self.args.local, key='fsd'))
+        source = self.get_source(coriolis_fsds_url, cur_coriolis_fsds_local_path)
+        if source is not None and not self.args.download_only:
+          dbc.populate_table_coriolis_fsds(self.import_json_from_url(source[0], 'Coriolis FSDs', None, is_url_local=source[1], key='fsd'))
         log.info("Done.")
       if 'id64' in self.args.steps:
         log.info("Setting known system ID64s...")
@@ -232,6 +320,12 @@ class Application(object):
         t = util.start_timer()
         dbc.update_table_systems_with_id64()
         log.info("Done in {}.".format(util.format_timer(t)))
+      if 'sector_table' in self.args.steps and not self.args.download_only:
+        log.info("Building PG sector name table...")
+        sys.stdout.flush()
+        t = util.start_timer()
+        pgtable.SectorTable.build(pgtable.default_path).close()
+        log.info("Done in {}.".format(util.format_timer(t)))
     except MemoryError:
       log.error("Out of memory!")
       if self.args.batch_size is None:
@@ -239,17 +333,11 @@ class Application(object):
       elif self.args.batch_size > 64:
         log.error("Try --batch-size {0}", self.args.batch_size / 2)
       if not self.args.download_only:
-        if 'clean' in self.args.steps:
-          cleanup_local(None, db_open_filename)
-        else:
-          log.warning("Update operation on existing database cancelled - database state could be invalid")
+        self.abandon_update(dbc, db_open_filename)
       return
     except:
       if not self.args.download_only:
-        if 'clean' in self.args.steps:
-          cleanup_local(None, db_open_filename)
-        else:
-          log.warning("Update operation on existing database cancelled - database state could be invalid")
+        self.abandon_update(dbc, db_open_filename)
       raise
 
     if not self.args.download_only:
@@ -260,38 +348,238 @@ class Application(object):
         if os.path.isfile(db_file):
           os.unlink(db_file)
         shutil.move(db_open_filename, db_file)
+        # Left if a resumed import ended up coming from somewhere else
+        if os.path.isfile(db_open_filename + import_journal_suffix):
+          os.unlink(db_open_filename + import_journal_suffix)
       else:
         log.debug("Existing database updated")
 
     log.info("All done in {}.".format(util.format_timer(g)))
 
-  def import_csv_from_url(self, url, filename, description, batch_size, is_url_local = False, key = None):
-    return self.import_data_from_url(read_header_csv, read_line_csv, read_all_csv, url, filename, description, batch_size, is_url_local, key)
-
-  def import_json_from_url(self, url, filename, description, batch_size, is_url_local = False, key = None):
-    return self.import_data_from_url(None, read_line_json, read_all_json, url, filename, description, batch_size, is_url_local, key)
+  def open_partial_db(self, filename):
+    # The DB left by an interrupted clean update, if there's an import into
+    # it to carry on with
+    if not (os.path.isfile(filename) and os.path.isfile(filename + import_journal_suffix)):
+      return None
+    log.info("Opening database left by an interrupted update...")
+    sys.stdout.flush()
+    try:
+      dbc = db.open_db(filename)
+      if dbc.check_integrity():
+        return dbc
+      dbc.close()
+    except Exception as ex:
+      log.debug("Failed to open {}: {}", filename, ex)
+    log.warning("Database left by an interrupted update is damaged, starting again")
+    return None
 
-  def import_data_from_url(self, fn_read_header, fn_read_line, fn_read_all, url, filename, description, batch_size, is_url_local, key):
+  def abandon_update(self, dbc, db_open_filename):
+    if 'clean' not in self.args.steps:
+      log.warning("Update operation on existing database cancelled - database state could be invalid")
+    elif os.path.isfile(db_open_filename + import_journal_suffix):
+      dbc.close()
+      log.warning("Update cancelled; running it again will carry on importing from where it stopped")
+    else:
+      cleanup_local(None, db_open_filename)
+
+  def get_source(self, url, local_file):
+    # Where to import from, as (url, is_url_local): the remote URL itself, or
+    # a complete, verified local copy of it
+    if not (self.args.local or self.args.copy_local):
+      return (url, False)
+    # Local copies of compressed files are kept compressed
+    path = local_file + '.gz' if url.endswith('.gz') else local_file
     if self.args.copy_local:
-      try:
-        dirname = os.path.dirname(filename)
-        fd, scratch = tempfile.mkstemp('.tmp', os.path.basename(filename), dirname if dirname else '.')
-        f = os.fdopen(fd, 'wb')
-      except:
-        log.error("Failed to create a temporary file")
-        raise
+      log.info("Downloading {} to {} ...", url, path)
+      sys.stdout.flush()
+      t = util.start_timer()
+      if download.fetch(url, path) is None:
+        log.error("Failed to download {}", url)
+        return None
+      log.info("Done in {}.", util.format_timer(t))
+    else:
+      # Older versions kept uncompressed local copies
+      path = path if os.path.isfile(path) else local_file
+      if os.path.isfile(path) and not download.verify(path):
+        return None
+    return (util.path_to_url(path), True)
+
+  def import_systems(self, dbc, source, description, drop_indices = False):
+    url, is_url_local = source
+    if is_url_local:
+      # An interrupted import from a local file can pick up from the last
+      # batch written, whether into an existing DB or a clean one
+      journal = ImportJournal(self.db_open_filename + import_journal_suffix, url, description)
+      if journal.stale and 'clean' in self.args.steps:
+        log.info("Interrupted import was of a different file, starting again")
+        dbc.clear_table_systems()
+      dbc.populate_table_system_rows(self.import_systems_checkpointed(url, description, journal), drop_indices, batches = True)
+      journal.remove()
+    elif self.args.jobs > 1:
+      dbc.populate_table_system_rows(self.import_systems_parallel(url, description, is_url_local), drop_indices)
+    else:
+      dbc.populate_table_systems(self.import_json_from_url(url, description, self.args.batch_size, is_url_local=is_url_local), drop_indices)
+
+  def import_csv_from_url(self, url, description, batch_size, is_url_local = False, key = None):
+    return self.import_data_from_url(read_header_csv, read_line_csv, read_all_csv, url, description, batch_size, is_url_local, key)
+
+  def import_json_from_url(self, url, description, batch_size, is_url_local = False, key = None):
+    return self.import_data_from_url(None, read_line_json, read_all_json, url, description, batch_size, is_url_local, key)
+
+  def import_systems_delta(self, dbc, url, description, is_url_local = False):
+    # Only systems changed since the last delta are written; the rest of the
+    # dump (e.g. the overlap between consecutive 7 day dumps) is skipped
+    watermark = dbc.get_systems_watermark()
+    if watermark is not None:
+      log.info("Applying changes to systems since {}", watermark)
+    progress = {'newest': watermark, 'skipped': 0}
+    systems = self.import_json_from_url(url, description, self.args.batch_size, is_url_local=is_url_local)
+    count = dbc.upsert_system_rows(self.changed_system_rows(systems, watermark, progress))
+    if count is not None:
+      log.info("Updated {} system(s), skipped {} unchanged since the last update", count, progress['skipped'])
+    if progress['newest'] != watermark:
+      dbc.set_systems_watermark(progress['newest'])
+
+  def changed_system_rows(self, systems, watermark, progress):
+    # EDSM dates are 'YYYY-MM-DD HH:MM:SS', so compare correctly as strings
+    # Systems changed at exactly the watermark are applied again, harmlessly
+    for s in systems:
+      date = s.get('date')
+      if date is not None:
+        if watermark is not None and date < watermark:
+          progress['skipped'] += 1
+          continue
+        if progress['newest'] is None or date > progress['newest']:
+          progress['newest'] = date
+      yield db.edsm_system_row(s)
+
+  def open_import_stream(self, url, is_url_local):
+    is_url_gzip = url.endswith(".gz")
+    request_gzip_enc = (not is_url_gzip)  # Don't try to request gzip encoding if the file is already gzipped
+    # Try to open the stream
+    stream = util.open_url(url, allow_no_ssl=is_url_local, allow_gzip=request_gzip_enc, threaded_gzip=True)
+    # If we have a gzip file, wrap the stream in a decompressor
+    if stream is not None and is_url_gzip:
+      stream = gzipstream.ThreadedGzipInputStream(stream)
+    return stream
+
+  def import_systems_parallel(self, url, description, is_url_local = False):
+    # Pipelined import: this process reads the dump and splits it into blocks
+    # of whole lines, a pool of workers parses the blocks into rows, and the
+    # rows come back in order to be written in one transaction by the caller
+    log.info("Importing {0} list from {1} with {2} workers ... ", description, url, self.args.jobs)
+    sys.stdout.flush()
+    start = util.start_timer()
+    done = 0
+    failed = 0
+    read = 0
+    last_elapsed = 0
+    for rows, block_failed, block_size in self.parse_system_blocks(url, is_url_local):
+      for row in rows:
+        yield row
+      done += len(rows)
+      failed += block_failed
+      read += block_size
+      elapsed = util.get_timer(start)
+      if elapsed - last_elapsed >= 30:
+        log.info("Loaded {0} row(s) of {1} data to DB ({2:.0f} rows/s, {3:.1f}MB/s read)...", done, description, done / elapsed, read / elapsed / 1048576)
+        last_elapsed = elapsed
+    elapsed = util.get_timer(start)
+    if failed:
+      log.info("Lines failing JSON parse: {0}", failed)
+    log.info("Loaded {0} row(s) of {1} data to DB ({2:.0f} rows/s, {3:.1f}MB/s read)", done, description, done / elapsed if elapsed else 0, read / elapsed / 1048576 if elapsed else 0)
+    log.info("Imported data in {}, generating relevant indexes...".format(util.format_timer(start)))
+
+  def import_systems_checkpointed(self, url, description, journal):
+    # Batches of rows, each committed by the caller before asking for the
+    # next; the journal then records how far through the file we are
+    # Blocks are parsed in order even by a pool of workers, so the offset
+    # saved after each batch always falls between lines
+    offset = journal.offset
+    workers = " with {} workers".format(self.args.jobs) if self.args.jobs > 1 else ""
+    if offset:
+      log.info("Resuming import of {0} list from {1} at byte {2}{3} ... ", description, url, offset, workers)
+    else:
+      log.info("Importing {0} list from {1}{2} ... ", description, url, workers)
+    sys.stdout.flush()
+    start = util.start_timer()
+    done = 0
+    failed = 0
+    last_elapsed = 0
+    batch = []
+    for rows, block_failed, block_size in self.parse_system_blocks(url, True, offset):
+      batch += rows
+      failed += block_failed
+      offset += block_size
+      if len(batch) >= import_checkpoint_rows:
+        yield batch
+        journal.save(offset)
+        done += len(batch)
+        batch = []
+        elapsed = util.get_timer(start)
+        if elapsed - last_elapsed >= 30:
+          log.info("Loaded {0} row(s) of {1} data to DB...", done, description)
+          last_elapsed = elapsed
+    if batch:
+      yield batch
+      done += len(batch)
+    if failed:
+      log.info("Lines failing JSON parse: {0}", failed)
+    log.info("Loaded {0} row(s) of {1} data to DB...", done, description)
+    log.info("Imported data in {}, generating relevant indexes...".format(util.format_timer(start)))
+
+  def parse_system_blocks(self, url, is_url_local, offset = 0):
+    # (rows, failed lines, bytes read) for each block of the dump after
+    # offset, in order; parsed by a pool of workers with more than one job
+    blocks = self.read_blocks_from_url(url, is_url_local, offset)
+    if self.args.jobs <= 1:
+      for block in blocks:
+        yield parse_edsm_systems_block(block)
+      return
+    pool = multiprocessing.Pool(self.args.jobs)
+    try:
+      for result in bounded_imap(pool, parse_edsm_systems_block, blocks, 2 * self.args.jobs):
+        yield result
+      pool.close()
+    except:
+      pool.terminate()
+      raise
+    finally:
+      pool.join()
+
+  def read_blocks_from_url(self, url, is_url_local, offset = 0):
+    # Blocks of raw bytes which each end at the end of a line, after skipping
+    # offset bytes of the (decompressed) data
+    stream = self.open_import_stream(url, is_url_local)
+    if stream is None:
+      return
+    try:
+      while offset > 0:
+        data = util.read_stream_block(stream, min(offset, import_block_size))
+        if not data:
+          return
+        offset -= len(data)
+      remainder = b''
+      while True:
+        data = util.read_stream_block(stream, import_block_size)
+        if not data:
+          break
+        data = remainder + data
+        end = data.rfind(b'\n') + 1
+        remainder = data[end:]
+        if end:
+          yield data[:end]
+      if remainder:
+        yield remainder
+    finally:
+      # Also stops any decompression running ahead if we finish early
+      stream.close()
+
+  def import_data_from_url(self, fn_read_header, fn_read_line, fn_read_all, url, description, batch_size, is_url_local, key):
     try:
-      is_url_gzip = url.endswith(".gz")
-      request_gzip_enc = (not is_url_gzip)  # Don't try to request gzip encoding if the file is already gzipped
-      # Try to open the stream
-      stream = util.open_url(url, allow_no_ssl=is_url_local, allow_gzip=request_gzip_enc)
+      stream = self.open_import_stream(url, is_url_local)
       if stream is None:
-        if self.args.copy_local:
-          cleanup_local(f, scratch)
         return
-      # If we have a gzip file, wrap the stream in a decompressor
-      if is_url_gzip:
-        stream = gzis.GzipInputStream(stream)
       # Are we batch downloading?
       if batch_size is not None:
         log.info("Batch downloading {0} list from {1} ... ", description, url)
@@ -310,10 +598,6 @@ class Application(object):
           line = util.read_stream_line(stream)
           if not line:
             break
-          if self.args.copy_local:
-            util.write_stream(f, line)
-          if self.args.download_only:
-            continue
           # Check if this is the first line and we should read a header
           if fn_read_header is not None and header is None:
             header = fn_read_header(line)
@@ -338,55 +622,39 @@ class Application(object):
               last_elapsed = elapsed
             batch = []
         done += len(batch)
-        if not self.args.download_only:
-          for obj in batch:
-            yield obj
-          if failed:
-            log.info("Lines failing JSON parse: {0}", failed)
-          log.info("Loaded {0} row(s) of {1} data to DB...", done, description)
-          log.info("Imported data in {}, generating relevant indexes...".format(util.format_timer(start)))
+        for obj in batch:
+          yield obj
+        if failed:
+          log.info("Lines failing JSON parse: {0}", failed)
+        log.info("Loaded {0} row(s) of {1} data to DB...", done, description)
+        log.info("Imported data in {}, generating relevant indexes...".format(util.format_timer(start)))
       else:
         log.info("Downloading {0} list from {1} ... ", description, url)
         sys.stdout.flush()
         t = util.start_timer()
         encoded = util.read_stream(stream)
         log.info("Done in {}.".format(util.format_timer(t)))
-        if self.args.copy_local:
-          log.info("Writing {0} local data...", description)
-          sys.stdout.flush()
-          t = util.start_timer()
-          util.write_stream(f, encoded)
-          log.info("Done in {}.".format(util.format_timer(t)))
-        if not self.args.download_only:
-          log.info("Loading {0} data...", description)
-          sys.stdout.flush()
-          t = util.start_timer()
-          obj = fn_read_all(encoded)
-          log.info("Done in {}.".format(util.format_timer(t)))
-          log.info("Adding {0} data to DB...", description)
-          sys.stdout.flush()
-          t = util.start_timer()
-          if key is not None:
-            obj = obj[key]
-          for o in obj:
-            yield o
-          log.info("Imported data in {}, generating relevant indexes...".format(util.format_timer(t)))
+        log.info("Loading {0} data...", description)
+        sys.stdout.flush()
+        t = util.start_timer()
+        obj = fn_read_all(encoded)
+        log.info("Done in {}.".format(util.format_timer(t)))
+        log.info("Adding {0} data to DB...", description)
+        sys.stdout.flush()
+        t = util.start_timer()
+        if key is not None:
+          obj = obj[key]
+        for o in obj:
+          yield o
+        log.info("Imported data in {}, generating relevant indexes...".format(util.format_timer(t)))
       # Force GC collection to try to avoid memory errors
       encoded = None
       obj = None
       batch = None
       gc.collect()
-      if self.args.copy_local:
-        f.close()
-        f = None
-        shutil.move(scratch, filename)
     except MemoryError:
       encoded = None
       obj = None
       batch = None
       gc.collect()
       raise
-    except:
-      if self.args.copy_local:
-        cleanup_local(f, scratch)
-      raise
@@ -1,4 +1,5 @@
 import collections
+import io
 import json
 import logging
 import math
@@ -12,9 +13,9 @@ import sys
 import timeit
 
 from . import defs
+from . import gzipstream
 from . import vector3
 from .opaque_types import OpaqEncoder
-from .thirdparty import gzipinputstream as gzis
 
 if sys.version_info >= (3, 0):
   import urllib.parse
@@ -113,14 +114,21 @@ def _open_url_inner_py2(url, headers, allow_no_ssl):
 
 _open_url_inner = _open_url_inner_py3 if sys.version_info >= (3, 0) else _open_url_inner_py2
 
-def open_url(url, allow_gzip = True, allow_no_ssl = False):
-  headers = {'User-Agent': USER_AGENT}
+def open_url(url, allow_gzip = True, allow_no_ssl = False, headers = None, threaded_gzip = False):
+  headers = dict(headers or {}, **{'User-Agent': USER_AGENT})
   if allow_gzip:
     headers['Accept-Encoding'] = 'gzip'
   response = _open_url_inner(url, headers, allow_no_ssl)
   if response and response.info().get('Content-Encoding') == 'gzip':
     try:
-      return gzis.GzipInputStream(response)
+      # Only large downloads, such as dumps being imported, are worth
+      # decompressing alongside the reader; the rest are read in one go
+      if threaded_gzip:
+        return gzipstream.ThreadedGzipInputStream(response)
+      try:
+        return io.BytesIO(gzipstream.decompress(response.read()))
+      finally:
+        response.close()
     except:
       log.error("Error decompressing {0}", url)
       return None
@@ -145,7 +153,7 @@ def read_stream_line(stream):
 def _read_stream_inner_py3(stream, limit):
   return stream.read(limit).decode("utf-8")
 def _read_stream_inner_py2(stream, limit):
-  if limit is None and not isinstance(stream, gzis.GzipInputStream):
+  if limit is None and not isinstance(stream, gzipstream.ThreadedGzipInputStream):
     limit = -1
   return stream.read(limit)
 _read_stream_inner = _read_stream_inner_py3 if sys.version_info >= (3, 0) else _read_stream_inner_py2
@@ -160,6 +168,17 @@ def read_stream(stream, limit = None):
     else:
       raise
 
+# Raw bytes, for callers which split the data up before decoding it
+def read_stream_block(stream, size):
+  try:
+    return stream.read(size)
+  except socket.error as e:
+    if e.errno == socket.errno.ECONNRESET:
+      log.warning("Received ECONNRESET while reading from socket-based stream")
+      return None
+    else:
+      raise
+
 def read_from_url(url, allow_gzip = True, allow_no_ssl = False):
   return read_stream(open_url(url, allow_gzip=allow_gzip, allow_no_ssl=allow_no_ssl))
 
@@ -170,6 +189,9 @@ write_stream = _write_stream_py3 if sys.version_info >= (3, 0) else _write_strea
 def _path_to_url_py3(path): return urllib.parse.urljoin('file:', urllib.request.pathname2url(os.path.abspath(path)))
 def _path_to_url_py2(path): return urlparse.urljoin('file:', urllib.pathname2url(os.path.abspath(path)))
 path_to_url = _path_to_url_py3 if sys.version_info >= (3, 0) else _path_to_url_py2
+def _url_to_path_py3(url): return urllib.request.url2pathname(urllib.parse.urlparse(url).path)
+def _url_to_path_py2(url): return urllib.url2pathname(urlparse.urlparse(url).path)
+url_to_path = _url_to_path_py3 if sys.version_info >= (3, 0) else _url_to_path_py2
 
 def _urlencode_py3(args): return urllib.parse.urlencode(args)
 def _urlencode_py2(args): return urllib.urlencode(args)
@@ -0,0 +1,238 @@
+import math
+import random
+
+from . import spatial
+from . import util
+
+try:
+  import numpy as np
+except ImportError:
+  np = None
+
+log = util.get_logger("vecarray")
+
+
+# Batch geometry over arrays of coordinates
+# With numpy available coordinates are held as an (N, 3) float64 array and
+# each test is a single vectorised pass; otherwise they are a list of tuples
+# and the same arithmetic is done in a plain loop, without creating Vector3s
+# Both paths do the arithmetic in the same order as Vector3, so they give
+# identical answers
+
+def have_numpy():
+  return np is not None
+
+
+def coords(items, position_fn = None):
+  if position_fn is None:
+    position_fn = lambda o: o.position
+  points = [tuple(position_fn(o)) for o in items]
+  if np is not None:
+    return np.array(points, dtype=np.float64).reshape((len(points), 3))
+  return points
+
+
+def indices(mask):
+  if np is not None and isinstance(mask, np.ndarray):
+    return np.nonzero(mask)[0].tolist()
+  return [i for i, m in enumerate(mask) if m]
+
+
+def cylinder_mask(points, vec_from, vec_to, buffer_both):
+  # Distance of each point from the infinite line through vec_from and vec_to
+  denominator = (vec_to - vec_from).length
+  fx, fy, fz = vec_from
+  tx, ty, tz = vec_to
+  if np is not None and isinstance(points, np.ndarray):
+    ax, ay, az = points[:, 0] - fx, points[:, 1] - fy, points[:, 2] - fz
+    bx, by, bz = points[:, 0] - tx, points[:, 1] - ty, points[:, 2] - tz
+    cx = ay*bz - by*az
+    cy = az*bx - bz*ax
+    cz = ax*by - bx*ay
+    return (np.sqrt(cx*cx + cy*cy + cz*cz) / denominator) < buffer_both
+  mask = []
+  for x, y, z in points:
+    ax, ay, az = x - fx, y - fy, z - fz
+    bx, by, bz = x - tx, y - ty, z - tz
+    cx = ay*bz - by*az
+    cy = az*bx - bz*ax
+    cz = ax*by - bx*ay
+    mask.append(math.sqrt(cx*cx + cy*cy + cz*cz) / denominator < buffer_both)
+  return mask
+
+
+def sphere_mask(points, vec, radius):
+  vx, vy, vz = vec
+  if np is not None and isinstance(points, np.ndarray):
+    dx, dy, dz = points[:, 0] - vx, points[:, 1] - vy, points[:, 2] - vz
+    return np.sqrt(dx*dx + dy*dy + dz*dz) < radius
+  mask = []
+  for x, y, z in points:
+    dx, dy, dz = x - vx, y - vy, z - vz
+    mask.append(math.sqrt(dx*dx + dy*dy + dz*dz) < radius)
+  return mask
+
+
+def distance_matrix(points):
+  # Distances between every pair of points, as Vector3 would calculate them
+  return _distance_block(points, 0, len(points))
+
+
+def distance_matrix_blocks(points, block_cells = 1 << 20):
+  # The same distances a block of whole rows at a time, as (first row, rows),
+  # so that only about block_cells distances are held at once
+  block_rows = max(1, block_cells // max(1, len(points)))
+  for start in range(0, len(points), block_rows):
+    yield start, _distance_block(points, start, min(start + block_rows, len(points)))
+
+
+def _distance_block(points, start, stop):
+  if np is not None and isinstance(points, np.ndarray):
+    # Points at infinity (e.g. "Anywhere") give NaNs, which callers check for
+    with np.errstate(invalid='ignore'):
+      dx = points[start:stop, 0][:, np.newaxis] - points[:, 0][np.newaxis, :]
+      dy = points[start:stop, 1][:, np.newaxis] - points[:, 1][np.newaxis, :]
+      dz = points[start:stop, 2][:, np.newaxis] - points[:, 2][np.newaxis, :]
+      return np.sqrt(dx*dx + dy*dy + dz*dz)
+  result = []
+  for ax, ay, az in points[start:stop]:
+    row = []
+    for bx, by, bz in points:
+      dx, dy, dz = ax - bx, ay - by, az - bz
+      row.append(math.sqrt(dx*dx + dy*dy + dz*dz))
+    result.append(row)
+  return result
+
+
+def _squared_distances(points, centre):
+  cx, cy, cz = centre
+  if np is not None and isinstance(points, np.ndarray):
+    return ((points - np.array([cx, cy, cz], dtype=np.float64)) ** 2).sum(axis=1)
+  return [(x - cx)**2 + (y - cy)**2 + (z - cz)**2 for x, y, z in points]
+
+
+def _kmeans_seeds(points, k, rng):
+  # k-means++: each further seed is picked with probability proportional to
+  # its squared distance from the nearest seed so far
+  n = len(points)
+  seeds = [rng.randrange(n)]
+  d2 = _squared_distances(points, points[seeds[0]])
+  while len(seeds) < k:
+    total = float(d2.sum()) if np is not None and isinstance(d2, np.ndarray) else float(sum(d2))
+    if total <= 0.0:
+      # Only duplicates of existing seeds are left
+      seeds.append(rng.choice([i for i in range(n) if i not in seeds]))
+    else:
+      target = rng.random() * total
+      if np is not None and isinstance(points, np.ndarray):
+        index = int(np.searchsorted(np.cumsum(d2), target, side='right'))
+      else:
+        index, cumulative = 0, d2[0]
+        while cumulative <= target and index < n - 1:
+          index += 1
+          cumulative += d2[index]
+      seeds.append(min(index, n - 1))
+    new_d2 = _squared_distances(points, points[seeds[-1]])
+    if np is not None and isinstance(points, np.ndarray):
+      d2 = np.minimum(d2, new_d2)
+    else:
+      d2 = [min(a, b) for a, b in zip(d2, new_d2)]
+  return seeds
+
+
+def kmeans(points, k, restarts = 1, rng = None, iterations = 100):
+  # Lloyd's algorithm from k-means++ seeds, once per restart
+  # Returns a list of (labels, centres, inertia), one per restart; with numpy
+  # each iteration of a restart is a few passes over an (N, k) array
+  rng = rng if rng is not None else random
+  n = len(points)
+  k = min(k, n)
+  seeds = [_kmeans_seeds(points, k, rng) for _ in range(restarts)]
+  if np is not None and isinstance(points, np.ndarray):
+    results = []
+    for restart_seeds in seeds:
+      centres = points[np.array(restart_seeds, dtype=np.intp)]
+      labels = None
+      for _ in range(iterations):
+        # One axis at a time, so that only (N, k) arrays are ever allocated
+        d2 = np.zeros((n, k))
+        for axis in range(3):
+          diff = points[:, axis][:, np.newaxis] - centres[:, axis][np.newaxis, :]
+          d2 += diff * diff
+        new_labels = d2.argmin(axis=1)
+        if labels is not None and (new_labels == labels).all():
+          break
+        labels = new_labels
+        counts = np.bincount(labels, minlength=k)
+        occupied = counts > 0
+        for axis in range(3):
+          sums = np.bincount(labels, weights=points[:, axis], minlength=k)
+          centres[occupied, axis] = sums[occupied] / counts[occupied]
+      inertia = float(d2.min(axis=1).sum())
+      results.append((labels.tolist(), [tuple(c) for c in centres.tolist()], inertia))
+    return results
+  results = []
+  for restart_seeds in seeds:
+    centres = [points[i] for i in restart_seeds]
+    labels = None
+    for _ in range(iterations):
+      d2 = [_squared_distances(points, c) for c in centres]
+      new_labels = [min(range(k), key=lambda c: d2[c][i]) for i in range(n)]
+      if new_labels == labels:
+        break
+      labels = new_labels
+      for c in range(k):
+        members = [points[i] for i in range(n) if labels[i] == c]
+        if members:
+          centres[c] = tuple(sum(p[axis] for p in members) / len(members) for axis in range(3))
+    inertia = sum(d2[labels[i]][i] for i in range(n))
+    results.append((labels, centres, inertia))
+  return results
+
+
+def morton_keys(points):
+  # The same keys as spatial.morton_key, for every point at once
+  if np is not None and isinstance(points, np.ndarray):
+    keys = np.zeros(len(points), dtype=np.int64)
+    for axis in range(3):
+      cells = np.floor((points[:, axis].astype(np.float64) - spatial.morton_origin[axis]) / spatial.morton_cell_size)
+      cells = np.clip(cells, 0, (1 << spatial.morton_bits) - 1).astype(np.int64)
+      keys |= spatial._morton_spread(cells) << axis
+    return keys
+  return [spatial.morton_key(x, y, z) for x, y, z in points]
+
+
+# A list of objects with positions alongside their coordinates, so that
+# repeated geometric filtering doesn't need to revisit each object
+class PointSet(object):
+  def __init__(self, items, points = None):
+    self.items = list(items)
+    self.points = points if points is not None else coords(self.items)
+
+  def __len__(self):
+    return len(self.items)
+
+  def __iter__(self):
+    return iter(self.items)
+
+  def __getitem__(self, index):
+    return self.items[index]
+
+  def __contains__(self, item):
+    return item in self.items
+
+  def subset(self, idx):
+    if np is not None and isinstance(self.points, np.ndarray):
+      points = self.points[np.array(idx, dtype=np.intp)] if len(idx) else self.points[:0]
+    else:
+      points = [self.points[i] for i in idx]
+    return PointSet([self.items[i] for i in idx], points)
+
+  def filter(self, fn):
+    return self.subset([i for i, o in enumerate(self.items) if fn(o)])
+
+  def cylinder(self, vec_from, vec_to, buffer_both):
+    return self.subset(indices(cylinder_mask(self.points, vec_from, vec_to, buffer_both)))
+
+  def sphere(self, vec, radius):
+    return self.subset(indices(sphere_mask(self.points, vec, radius)))
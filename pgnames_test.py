@@ -2,6 +2,7 @@
 
 import json
 import math
+import random
 import sys
 import time
 
@@ -10,12 +11,14 @@ from edtslib import pgdata
 from edtslib import pgnames
 from edtslib import sector
 from edtslib import system
+from edtslib import util
+from edtslib import vector3
 from edtslib.pgnames import log
 
 env.configure_logging(env.global_args.log_level)
 
 def run_test(it):
-  teststart = time.clock()
+  teststart = util.start_timer()
 
   alls = 0
   ok1 = 0
@@ -129,32 +132,60 @@ def run_test(it):
     else:
       notpg += 1
   
-  duration = time.clock() - teststart
+  duration = util.get_timer(teststart)
 
   log.info("Totals: All = {}, OK1 = {}, OK2 = {}, OKHA = {}, OKHAName = {}, Bad1 = {}, Bad2 = {}, BadHA = {}, BadHAName = {}, None1 = {}, None2 = {}, NoneHA = {}, notPG = {}", alls, ok1, ok2, okha, okhaname, bad1, bad2, badha, badhaname, none1, none2, noneha, notpg)
   log.info("Time: {0:.6f}s, {1:.6f}s per system", duration, duration / alls)
 
 
+c1_offset_test_data = {
+  'Mycapp': 623548, 'LYchoitl': 541608, 'Shruery': 410512, 'Phrauph': 574396,
+  'Myreasp': 459657, 'Pythaics': 557994, 'Pythaipr': 803991, 'Styaill': 214060,
+  'Styefs': 836644, 'Leeh': 99373, 'Keet': 99364, 'Schreang': 607155,
+  'Sqeass': 263332, 'Squer': 639916, 'Cryaths': 246810, 'Phylur': 328741,
+  'Slyeax': 443539, 'Mynoaw': 541610, 'Gyruenz': 459554, 'Sphuezz': 132132,
+  'Spliech': 132135, 'Groec': 164896, 'Vigs': 148514, 'Tzorbs': 115616,
+  'Phloiws': 115617, 'Tyrootz': 164768, 'Sigy': 148381, 'Soac': 148389,
+  'Pyoer': 492698,
+  # 'Isheau': 99239, 'Aowheou': 574476, 'Aochou': 492476,
+  # 'Aaeyoe': 623543, 'Aaeshoa': 705543, 'Eaezi': 820396, 
+  # Nasty ones
+  'Chroabs': 492710, 'Kyloalz': 574382, 'Flyaulz': 574516, 'Froaphs': 492589,
+  'Swoiphs': 312233, 'Cyoilz': 213923,
+}
+
+
+def run_batch_benchmark(count, mcode):
+  # Names of systems in the sectors above, and positions spread over the
+  # galaxy and around the bubble (where the HA regions are), looked up one
+  # at a time and then as a batch
+  rng = random.Random(0)
+  sectors = [pgnames.get_sector(name) for name in sorted(c1_offset_test_data.keys()) + ['Dryau Aowsy', 'Gria Eaec', 'Col 285 Sector']]
+  in_sectors = []
+  for _ in range(count):
+    origin = rng.choice(sectors).get_origin(sector.get_mcode_cube_width(mcode))
+    in_sectors.append(origin + vector3.Vector3(rng.uniform(0, sector.sector_size), rng.uniform(0, sector.sector_size), rng.uniform(0, sector.sector_size)))
+  names = ['{}{}'.format(s.name, rng.randint(0, 500)) for s in pgnames.get_systems(in_sectors, mcode)]
+  positions = [vector3.Vector3(rng.uniform(-10000, 10000), rng.uniform(-1000, 1000), rng.uniform(-10000, 30000)) for _ in range(count // 2)]
+  positions += [vector3.Vector3(rng.uniform(-500, 500), rng.uniform(-500, 500), rng.uniform(-500, 500)) for _ in range(count - len(positions))]
+
+  for desc, inputs, mcodes in [('names', names, None), ('positions', positions, mcode)]:
+    start = time.time()
+    single = [pgnames.get_system(i, mcodes) for i in inputs]
+    single_time = time.time() - start
+    start = time.time()
+    batch = pgnames.get_systems(inputs, mcodes)
+    batch_time = time.time() - start
+    same = all((a is None and b is None) or (a.name == b.name and a.position == b.position) for a, b in zip(single, batch))
+    log.info("{} {}: single {:.3f}s ({:.0f}/s), batch {:.3f}s ({:.0f}/s), speedup {:.1f}x, same results: {}",
+      len(inputs), desc, single_time, len(inputs) / single_time, batch_time, len(inputs) / batch_time, single_time / batch_time, same)
+
 
 # Test modes
 if __name__ == '__main__':
   if len(sys.argv) >= 2:
     if sys.argv[1] == "c1ot":
-      test_data = {
-        'Mycapp': 623548, 'LYchoitl': 541608, 'Shruery': 410512, 'Phrauph': 574396,
-        'Myreasp': 459657, 'Pythaics': 557994, 'Pythaipr': 803991, 'Styaill': 214060,
-        'Styefs': 836644, 'Leeh': 99373, 'Keet': 99364, 'Schreang': 607155,
-        'Sqeass': 263332, 'Squer': 639916, 'Cryaths': 246810, 'Phylur': 328741,
-        'Slyeax': 443539, 'Mynoaw': 541610, 'Gyruenz': 459554, 'Sphuezz': 132132,
-        'Spliech': 132135, 'Groec': 164896, 'Vigs': 148514, 'Tzorbs': 115616,
-        'Phloiws': 115617, 'Tyrootz': 164768, 'Sigy': 148381, 'Soac': 148389,
-        'Pyoer': 492698,
-        # 'Isheau': 99239, 'Aowheou': 574476, 'Aochou': 492476,
-        # 'Aaeyoe': 623543, 'Aaeshoa': 705543, 'Eaezi': 820396, 
-        # Nasty ones
-        'Chroabs': 492710, 'Kyloalz': 574382, 'Flyaulz': 574516, 'Froaphs': 492589,
-        'Swoiphs': 312233, 'Cyoilz': 213923,
-      }
+      test_data = c1_offset_test_data
       badcnt = 0
       for name in dict(test_data):
         actual = test_data[name]
@@ -164,6 +195,11 @@ if __name__ == '__main__':
           badcnt += 1
       print("Total: OK = {0}, bad = {1}".format(len(test_data)-badcnt, badcnt))
 
+    elif sys.argv[1] == "batchbench":
+      count = int(sys.argv[2]) if len(sys.argv) > 2 else 20000
+      mcode = sys.argv[3] if len(sys.argv) > 3 else 'd'
+      run_batch_benchmark(count, mcode)
+
     elif sys.argv[1] == "run2":
       input = sys.argv[2] # "Schuae Flye"
       limit = int(sys.argv[3]) if len(sys.argv) > 3 else None
@@ -0,0 +1,36 @@
+import unittest
+import sys
+
+sys.path.insert(0, '../..')
+from edtslib.system_internal import KnownSystem
+del sys.path[0]
+
+
+def make_system(star_class):
+  return KnownSystem({'id': 1, 'name': 'Test', 'x': 0, 'y': 0, 'z': 0, 'id64': None, 'arrival_star_class': star_class})
+
+
+class TestBodies(unittest.TestCase):
+  def test_arrival_star_class(self):
+    s = make_system('K')
+    self.assertEqual(s.arrival_star_class, 'K')
+    self.assertTrue(s.arrival_star.scoopable)
+    self.assertFalse(s.arrival_star.superchargeable)
+
+    s = make_system('N')
+    self.assertEqual(s.arrival_star_class, 'N')
+    self.assertFalse(s.arrival_star.scoopable)
+    self.assertTrue(s.arrival_star.superchargeable)
+
+    s = make_system('DA')
+    self.assertEqual(s.arrival_star_class, 'D')
+    self.assertTrue(s.arrival_star.superchargeable)
+
+    s = make_system(None)
+    self.assertIsNone(s.arrival_star_class)
+    self.assertFalse(s.arrival_star.scoopable)
+    self.assertFalse(s.arrival_star.superchargeable)
+
+
+if __name__ == '__main__':
+  unittest.main()
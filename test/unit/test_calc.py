@@ -0,0 +1,100 @@
+import random
+import unittest
+import sys
+
+sys.path.insert(0, '../..')
+from edtslib import calc
+from edtslib import spatial
+from edtslib.vector3 import Vector3
+del sys.path[0]
+
+import testdata
+
+def make_stars(count, length, seed):
+  return testdata.make_known_systems(count, seed, lo = (0, -20, -20), hi = (length, 20, 20))
+
+class TestCalc(unittest.TestCase):
+  def test_grid_near(self):
+    stars = make_stars(500, 200.0, 1)
+    grid = spatial.Grid(stars, 15.0)
+    centre = Vector3(100, 0, 0)
+    expected = [s for s in stars if (s.position - centre).length < 15.0]
+    self.assertEqual(grid.within(centre, 15.0), expected)
+    self.assertTrue(all(s in grid.near(centre, 15.0) for s in expected))
+
+  def test_morton_ranges(self):
+    rng = random.Random(4)
+    ranges = spatial.morton_ranges(-30.5, -5, 10, 12, 7.25, 40, 16)
+    self.assertTrue(len(ranges) <= 16)
+    for i in range(2000):
+      x, y, z = rng.uniform(-30.5, 12), rng.uniform(-5, 7.25), rng.uniform(10, 40)
+      key = spatial.morton_key(x, y, z)
+      self.assertTrue(any(first <= key <= last for first, last in ranges))
+
+  def test_astar_grid_matches_scan(self):
+    jump_range = 20.0
+    stars = make_stars(1500, 400.0, 2)
+    sys_from = min(stars, key=lambda s: s.position.x)
+    sys_to = max(stars, key=lambda s: s.position.x)
+    valid_neighbour_fn = lambda n, current: n != current and n.distance_to(current) < jump_range
+    cost_fn = lambda cur, neighbour, path: calc.astar_cost(cur, neighbour, path, jump_range)
+    scanned = calc.astar(stars, sys_from, sys_to, valid_neighbour_fn, cost_fn)
+    gridded = calc.astar(stars, sys_from, sys_to, valid_neighbour_fn, cost_fn, jump_range)
+    self.assertIsNotNone(scanned)
+    self.assertEqual(scanned, gridded)
+    self.assertEqual(scanned[0], sys_from)
+    self.assertEqual(scanned[-1], sys_to)
+    self.assertTrue(all(scanned[i].distance_to(scanned[i+1]) < jump_range for i in range(len(scanned) - 1)))
+
+  def test_bidirectional_astar(self):
+    jump_range = 20.0
+    stars = make_stars(1500, 400.0, 2)
+    sys_from = min(stars, key=lambda s: s.position.x)
+    sys_to = max(stars, key=lambda s: s.position.x)
+    valid_neighbour_fn = lambda n, current: n != current and n.distance_to(current) < jump_range
+    cost_fn = lambda cur, neighbour, path: calc.astar_cost(cur, neighbour, path, jump_range)
+    route = calc.bidirectional_astar(stars, sys_from, sys_to, valid_neighbour_fn, cost_fn, cost_fn, None, jump_range)
+    self.assertIsNotNone(route)
+    self.assertEqual((route[0], route[-1]), (sys_from, sys_to))
+    self.assertEqual(len(set(route)), len(route))
+    self.assertTrue(all(route[i].distance_to(route[i+1]) < jump_range for i in range(len(route) - 1)))
+    # Joined-up routes which fail validation are passed over
+    midpoint = route[len(route) // 2]
+    validate_fn = lambda r: None if midpoint in r else r
+    avoided = calc.bidirectional_astar(stars, sys_from, sys_to, valid_neighbour_fn, cost_fn, cost_fn, validate_fn, jump_range)
+    self.assertIsNotNone(avoided)
+    self.assertNotIn(midpoint, avoided)
+
+  def test_shortest_path(self):
+    stars = make_stars(60, 200.0, 5)
+    sys_from = min(stars, key=lambda s: s.position.x)
+    sys_to = max(stars, key=lambda s: s.position.x)
+    neighbours_fn = lambda cur: [s for s in stars if s != cur and s.distance_to(cur) < 40.0]
+    cost_fn = lambda cur, neighbour: 10.0 + cur.distance_to(neighbour)
+    heuristic_fn = lambda cur: cur.distance_to(sys_to)
+    path = calc.shortest_path(sys_from, sys_to, neighbours_fn, cost_fn, heuristic_fn)
+    path_cost = lambda p: sum(cost_fn(a, b) for a, b in zip(p, p[1:]))
+    # Without a heuristic this is Dijkstra's algorithm, so the cost must match
+    dijkstra = calc.shortest_path(sys_from, sys_to, neighbours_fn, cost_fn, lambda cur: 0.0)
+    self.assertEqual((path[0], path[-1]), (sys_from, sys_to))
+    self.assertAlmostEqual(path_cost(path), path_cost(dijkstra))
+
+  def test_route_path(self):
+    stars = make_stars(6, 100.0, 3)
+    path = calc.RoutePath(stars[0])
+    for s in stars[1:]:
+      path = path.extend(s)
+    self.assertEqual(len(path), len(stars))
+    self.assertEqual(path.to_list(), stars)
+    self.assertEqual(list(path), stars)
+    self.assertEqual([path[i] for i in range(-6, 6)], stars + stars)
+    self.assertEqual(calc.route_key(path), calc.route_key(stars))
+    self.assertNotEqual(calc.route_key(path), calc.route_key(list(reversed(stars))))
+    self.assertEqual(list(calc.route_legs(path)), list(calc.route_legs(stars)))
+    dist = stars[0].distance_to(stars[-1])
+    self.assertAlmostEqual(calc.route_variance(path, dist), calc.route_variance(stars, dist))
+    self.assertAlmostEqual(calc.route_stdev(path, dist), calc.route_stdev(stars, dist))
+
+
+if __name__ == '__main__':
+  unittest.main()
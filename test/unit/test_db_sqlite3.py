@@ -0,0 +1,135 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+import sys
+
+sys.path.insert(0, '../..')
+from edtslib import db_sqlite3
+from edtslib import env_backend
+from edtslib import filtering
+from edtslib import spatial
+del sys.path[0]
+
+import testdata
+
+def make_rows(count, seed):
+  return [(s['id'], s['name'], s['x'], s['y'], s['z'], None, None, None, None) for s in testdata.make_systems(count, seed)]
+
+class TestSQLite3DB(unittest.TestCase):
+  def setUp(self):
+    self.dir = tempfile.mkdtemp()
+    self.path = os.path.join(self.dir, 'test.db')
+    self.rows = make_rows(1000, 1)
+    self.dbc = db_sqlite3.initialise_db(self.path)
+    self.dbc._conn.executemany('INSERT INTO systems VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', [r + (spatial.morton_key(*r[2:5]), ) for r in self.rows])
+    self.dbc._conn.commit()
+
+  def tearDown(self):
+    self.dbc.close()
+    shutil.rmtree(self.dir)
+
+  def aabb_ids(self, dbc):
+    return sorted(s['id'] for s in dbc.find_systems_by_aabb(-50, -10, -80, 60, 20, 30))
+
+  def expected_ids(self):
+    return sorted(r[0] for r in self.rows if -50 <= r[2] < 60 and -10 <= r[3] < 20 and -80 <= r[4] < 30)
+
+  def test_aabb(self):
+    if not self.dbc.spatial_index:
+      self.skipTest("SQLite R*Tree module is not available")
+    self.assertEqual(self.aabb_ids(self.dbc), self.expected_ids())
+    # Triggers should keep the spatial index up to date
+    self.dbc._conn.execute('UPDATE systems SET pos_x = 1000 WHERE id = ?', (self.expected_ids()[0], ))
+    self.dbc._conn.execute('DELETE FROM systems WHERE id = ?', (self.expected_ids()[1], ))
+    self.assertEqual(self.aabb_ids(self.dbc), self.expected_ids()[2:])
+
+  def test_aabb_morton(self):
+    self.dbc._spatial_index = False
+    self.assertEqual(self.aabb_ids(self.dbc), self.expected_ids())
+
+  def test_migrate(self):
+    # Build a schema version 12 database by hand and let open_db upgrade it
+    path = os.path.join(self.dir, 'old.db')
+    conn = sqlite3.connect(path)
+    conn.execute('CREATE TABLE edts_info (db_version INTEGER, db_mtime INTEGER NOT NULL)')
+    conn.execute('INSERT INTO edts_info VALUES (12, 0)')
+    conn.execute('CREATE TABLE systems (id INTEGER PRIMARY KEY, name TEXT COLLATE NOCASE NOT NULL, pos_x REAL NOT NULL, pos_y REAL NOT NULL, pos_z REAL NOT NULL, id64 INTEGER, needs_permit BOOLEAN, allegiance TEXT, arrival_star_class TEXT)')
+    conn.executemany('INSERT INTO systems VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)', self.rows)
+    conn.commit()
+    conn.close()
+    dbc = db_sqlite3.open_db(path)
+    try:
+      self.assertEqual(dbc.schema_version, db_sqlite3.schema_version)
+      self.assertTrue(dbc.morton_index)
+      self.assertEqual(self.aabb_ids(dbc), self.expected_ids())
+      dbc._spatial_index = False
+      self.assertEqual(self.aabb_ids(dbc), self.expected_ids())
+    finally:
+      dbc.close()
+
+  def test_route_cache(self):
+    cache = self.dbc.route_cache
+    self.assertTrue(cache)
+    cache.max_entries = 2
+    self.assertIsNone(self.dbc.get_cached_route('a'))
+    for key in ['a', 'b', 'c']:
+      self.dbc.cache_route(key, [{'key': key}])
+    # 'a' was the least recently used entry
+    self.assertIsNone(self.dbc.get_cached_route('a'))
+    self.assertEqual(self.dbc.get_cached_route('c'), [{'key': 'c'}])
+    self.assertEqual((cache.hits, cache.misses), (1, 2))
+    # Changing the systems invalidates every route
+    self.dbc._touch_mtime()
+    self.assertIsNone(self.dbc.get_cached_route('c'))
+    # Including systems written as they're fetched from EDSM
+    self.dbc.cache_route('d', [{'key': 'd'}])
+    self.dbc.insert_or_replace_systems_edsm([{'id': 1, 'id64': None, 'name': 'Test 0', 'coords': {'x': 500.0, 'y': 0.0, 'z': 0.0}}], mode = 'REPLACE')
+    self.assertIsNone(self.dbc.get_cached_route('d'))
+
+  def test_stream_systems(self):
+    # Small batches, so that several fetches are needed
+    rows = list(self.dbc.stream_systems(columns=('id', 'x'), batch_size=64))
+    self.assertEqual(sorted(rows), sorted((r[0], r[2]) for r in self.rows))
+    self.assertEqual(rows[0]._fields, ('id', 'x'))
+    full = {s['id']: s for s in self.dbc.find_all_systems()}
+    self.assertEqual(len(full), len(self.rows))
+    for row in self.dbc.stream_systems(batch_size=100):
+      self.assertEqual(full[row.id]['name'], row.name)
+    names = [row.name for row in self.dbc.stream_systems_by_name('Test 99*', mode=env_backend.FIND_GLOB, columns=('name', ))]
+    self.assertEqual(sorted(names), ['Test 99', 'Test 990', 'Test 991', 'Test 992', 'Test 993', 'Test 994', 'Test 995', 'Test 996', 'Test 997', 'Test 998', 'Test 999'])
+    with self.assertRaises(ValueError):
+      list(self.dbc.stream_systems(columns=('id', 'pos_x')))
+
+  def test_query_statement_text(self):
+    def query(x, distance, limit):
+      filters = filtering.parse('close_to=?,distance<{};limit={}'.format(distance, limit), (x, 0.0, 0.0))
+      return db_sqlite3._construct_query(['systems'], db_sqlite3._find_method_systems_entries, [], [], [], filters, self.dbc.spatial_index)
+    cmd, params = query(0.0, 50, 5)
+    # Only the values differ, so the statement text is shared
+    cmd2, params2 = query(10.0, 80, 7)
+    self.assertEqual(cmd, cmd2)
+    self.assertNotEqual(params, params2)
+    self.assertEqual(params2[-1], 7)
+    ids = [r[0] for r in self.dbc._conn.execute(cmd2, params2)]
+    self.assertEqual(len(ids), 7)
+
+  def test_upsert_systems(self):
+    self.assertIsNone(self.dbc.get_systems_watermark())
+    moved = list(self.rows[self.expected_ids()[0] - 1])
+    moved[2] = 1000.0
+    added = (5000, u'Test new', 0.0, 0.0, 0.0, None, None, None, None)
+    self.dbc.upsert_system_rows([tuple(r) + (spatial.morton_key(*r[2:5]), ) for r in [moved, added]])
+    self.dbc.set_systems_watermark('2017-01-02 03:04:05')
+    self.assertEqual(self.dbc.get_systems_watermark(), '2017-01-02 03:04:05')
+    self.assertEqual(self.dbc._conn.execute('SELECT COUNT(*) FROM systems').fetchone()[0], len(self.rows) + 1)
+    # Indexes, including the spatial one, follow the changes
+    self.rows[moved[0] - 1] = tuple(moved)
+    self.rows.append(added)
+    self.assertEqual(self.aabb_ids(self.dbc), self.expected_ids())
+    self.assertEqual([s['id'] for s in self.dbc.find_systems_by_name('Test new')], [5000])
+
+
+if __name__ == '__main__':
+  unittest.main()
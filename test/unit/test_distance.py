@@ -0,0 +1,46 @@
+import unittest
+import sys
+
+sys.path.insert(0, '../..')
+from edtslib import distance
+from edtslib import vecarray
+del sys.path[0]
+
+import testdata
+
+def make_systems(count, seed):
+  return testdata.make_known_systems(count, seed, lo = (-1000, -100, -1000), hi = (1000, 100, 1000))
+
+class TestDistanceMatrix(unittest.TestCase):
+  def check_matrix(self, systems):
+    app = distance.Application(matrix = True)
+    rows = list(app._matrix_rows(systems))
+    self.assertEqual(app.matrix_systems, systems)
+    self.assertEqual([r.origin.system for r in rows], systems)
+    for row in rows:
+      self.assertEqual(list(row.distances), [row.origin.system.distance_to(s) for s in systems])
+    self.assertEqual(len(row.to_opaq()['distances']), len(systems))
+
+  def test_matrix(self):
+    systems = make_systems(50, 1)
+    self.check_matrix(systems)
+    have_numpy = vecarray.np
+    try:
+      vecarray.np = None
+      self.check_matrix(systems)
+    finally:
+      vecarray.np = have_numpy
+
+  def test_blocks(self):
+    points = vecarray.coords(make_systems(37, 2))
+    full = vecarray.distance_matrix(points)
+    starts = []
+    for start, block in vecarray.distance_matrix_blocks(points, block_cells = 37 * 5):
+      starts.append(start)
+      for i, row in enumerate(block):
+        self.assertEqual(list(row), list(full[start + i]))
+    self.assertEqual(starts, list(range(0, 37, 5)))
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,138 @@
+import gzip
+import hashlib
+import io
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+import sys
+
+try:
+  from http.server import BaseHTTPRequestHandler, HTTPServer
+except ImportError:
+  from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+
+sys.path.insert(0, '../..')
+from edtslib import download
+del sys.path[0]
+
+def gzip_data(data):
+  buf = io.BytesIO()
+  with gzip.GzipFile(fileobj = buf, mode = 'wb') as f:
+    f.write(data)
+  return buf.getvalue()
+
+# Serves the server's data with Range support, optionally dropping the
+# connection once cut_after bytes of the file have been sent
+class RangeHandler(BaseHTTPRequestHandler):
+  def do_GET(self):
+    data = self.server.data
+    start = 0
+    ranged = self.headers.get('Range')
+    if ranged is not None and self.headers.get('If-Range') in (None, self.server.etag):
+      start = int(ranged.split('=')[1].split('-')[0])
+      self.send_response(206)
+      self.send_header('Content-Range', 'bytes {}-{}/{}'.format(start, len(data) - 1, len(data)))
+    else:
+      self.send_response(200)
+    self.send_header('Content-Length', str(len(data) - start))
+    self.send_header('ETag', self.server.etag)
+    self.end_headers()
+    end = len(data)
+    if self.server.cut_after is not None:
+      end = max(start, min(end, self.server.cut_after))
+      self.server.cut_after = None
+    self.wfile.write(data[start:end])
+    self.server.requests.append((ranged, start))
+
+  def log_message(self, *args):
+    pass
+
+class TestDownload(unittest.TestCase):
+  def setUp(self):
+    self.dir = tempfile.mkdtemp()
+    self.path = os.path.join(self.dir, 'systems.json.gz')
+    self.server = HTTPServer(('127.0.0.1', 0), RangeHandler)
+    self.server.data = gzip_data(b''.join(b'{"id": %d}\n' % i for i in range(20000)))
+    self.server.etag = '"v1"'
+    self.server.cut_after = None
+    self.server.requests = []
+    self.url = 'http://127.0.0.1:{}/systems.json.gz'.format(self.server.server_port)
+    self.thread = threading.Thread(target = self.server.serve_forever)
+    self.thread.daemon = True
+    self.thread.start()
+
+  def tearDown(self):
+    self.server.shutdown()
+    self.server.server_close()
+    shutil.rmtree(self.dir)
+
+  def test_resume(self):
+    self.server.cut_after = len(self.server.data) // 3
+    self.assertIsNone(download.fetch(self.url, self.path))
+    self.assertFalse(os.path.exists(self.path))
+    self.assertEqual(os.path.getsize(download.part_path(self.path)), len(self.server.data) // 3)
+    self.assertEqual(download.fetch(self.url, self.path), self.path)
+    self.assertEqual(self.server.requests[-1], ('bytes={}-'.format(len(self.server.data) // 3), len(self.server.data) // 3))
+    with open(self.path, 'rb') as f:
+      self.assertEqual(f.read(), self.server.data)
+    self.assertFalse(os.path.exists(download.part_path(self.path)))
+    self.assertFalse(os.path.exists(download.journal_path(self.path)))
+    self.assertTrue(download.verify(self.path))
+
+  def test_changed_file_restarts(self):
+    self.server.cut_after = 1000
+    self.assertIsNone(download.fetch(self.url, self.path))
+    self.server.data = gzip_data(b'{"id": 1}\n' * 5000)
+    self.server.etag = '"v2"'
+    self.assertEqual(download.fetch(self.url, self.path), self.path)
+    self.assertEqual(self.server.requests[-1][1], 0)
+    with open(self.path, 'rb') as f:
+      self.assertEqual(f.read(), self.server.data)
+
+  def test_corrupt(self):
+    self.server.data = self.server.data[:-100] + b'\0' * 100
+    self.assertIsNone(download.fetch(self.url, self.path))
+    self.assertFalse(os.path.exists(self.path))
+    self.assertFalse(os.path.exists(download.part_path(self.path)))
+
+  def test_verify(self):
+    self.server.data = gzip_data(b'{"id": 1}\n') + gzip_data(b'{"id": 2}\n')
+    self.assertEqual(download.fetch(self.url, self.path), self.path)
+    self.assertTrue(download.verify(self.path))
+    with open(self.path, 'r+b') as f:
+      f.seek(-1, os.SEEK_END)
+      f.write(b'\1')
+    self.assertFalse(download.verify(self.path))
+    with open(self.path, 'r+b') as f:
+      f.truncate(len(self.server.data) - 10)
+    self.assertFalse(download.verify(self.path))
+
+  def test_verify_manifest(self):
+    self.assertEqual(download.fetch(self.url, self.path), self.path)
+    # With a manifest only the checksum is compared, without decompressing
+    decompressobj = download.zlib.decompressobj
+    download.zlib.decompressobj = None
+    try:
+      self.assertTrue(download.verify(self.path))
+    finally:
+      download.zlib.decompressobj = decompressobj
+    # Without one, the file is decompressed to check it
+    os.unlink(download.manifest_path(self.path))
+    self.assertTrue(download.verify(self.path))
+    with open(self.path, 'r+b') as f:
+      f.truncate(len(self.server.data) - 10)
+    self.assertFalse(download.verify(self.path))
+
+  def test_resume_checksum(self):
+    # Checksums cover the part downloaded before the interruption too
+    self.server.cut_after = len(self.server.data) // 2
+    self.assertIsNone(download.fetch(self.url, self.path))
+    self.assertEqual(download.fetch(self.url, self.path), self.path)
+    with open(download.manifest_path(self.path), 'r') as f:
+      self.assertEqual(f.read().split(' ', 1)[0], hashlib.sha256(self.server.data).hexdigest())
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -92,6 +92,12 @@ class TestFSD(unittest.TestCase):
     wmin, wmax = f.fuel_weight_range(41.41, mass=521.8)
     self.assertAlmostEqual(wmin, 0.21, 2)
     self.assertAlmostEqual(wmax, 1598.25, 2)
+    f.supercharge(True)
+    self.assertAlmostEqual(f.boost, 1.25, 2)
+    f.supercharge(2.0)
+    self.assertAlmostEqual(f.boost, 1.5, 2)
+    f.supercharge('X')
+    self.assertAlmostEqual(f.boost, 1.0, 2)
 
   def test_boost(self):
     f = fsd.FSD("6A")
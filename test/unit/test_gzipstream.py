@@ -0,0 +1,87 @@
+import gzip
+import io
+import random
+import unittest
+import sys
+
+sys.path.insert(0, '../..')
+from edtslib import gzipstream
+from edtslib import util
+del sys.path[0]
+
+def gzip_data(data):
+  buf = io.BytesIO()
+  with gzip.GzipFile(fileobj = buf, mode = 'wb') as f:
+    f.write(data)
+  return buf.getvalue()
+
+class TestGzipStream(unittest.TestCase):
+  def setUp(self):
+    rng = random.Random(1)
+    self.lines = [('{"id": %d, "name": "%s"}\n' % (i, 'x' * rng.randint(0, 200))).encode('ascii') for i in range(50000)]
+    self.data = b''.join(self.lines)
+    self.old_output_block_size = gzipstream.output_block_size
+    # Small pieces, so that lines and reads span several of them
+    gzipstream.output_block_size = 4096
+
+  def tearDown(self):
+    gzipstream.output_block_size = self.old_output_block_size
+
+  def test_readline(self):
+    stream = gzipstream.ThreadedGzipInputStream(io.BytesIO(gzip_data(self.data)))
+    self.assertEqual(list(stream), self.lines)
+    self.assertEqual(stream.tell(), len(self.data))
+    self.assertEqual(stream.read(), b'')
+
+  def test_read(self):
+    stream = gzipstream.ThreadedGzipInputStream(io.BytesIO(gzip_data(self.data)))
+    self.assertEqual(stream.read(10), self.data[:10])
+    self.assertEqual(stream.readline(), self.lines[0][10:])
+    self.assertEqual(stream.read(100000), self.data[len(self.lines[0]):len(self.lines[0]) + 100000])
+    self.assertEqual(stream.read(), self.data[len(self.lines[0]) + 100000:])
+
+  def test_multiple_members(self):
+    half = len(self.lines) // 2
+    data = gzip_data(b''.join(self.lines[:half])) + gzip_data(b'') + gzip_data(b''.join(self.lines[half:]))
+    stream = gzipstream.ThreadedGzipInputStream(io.BytesIO(data))
+    self.assertEqual(stream.read(), self.data)
+
+  def test_truncated(self):
+    stream = gzipstream.ThreadedGzipInputStream(io.BytesIO(gzip_data(self.data)[:-1000]))
+    self.assertRaises(IOError, stream.read)
+
+  def test_close_early(self):
+    stream = gzipstream.ThreadedGzipInputStream(io.BytesIO(gzip_data(self.data)))
+    self.assertEqual(stream.readline(), self.lines[0])
+    stream.close()
+    self.assertFalse(stream._thread.is_alive())
+
+  def test_decompress(self):
+    half = len(self.lines) // 2
+    data = gzip_data(b''.join(self.lines[:half])) + gzip_data(b'') + gzip_data(b''.join(self.lines[half:]))
+    self.assertEqual(gzipstream.decompress(data), self.data)
+    self.assertEqual(gzipstream.decompress(b''), b'')
+    if sys.version_info >= (3, 0):
+      self.assertRaises(IOError, gzipstream.decompress, gzip_data(self.data)[:-1000])
+
+  def test_open_url(self):
+    # Gzip-encoded responses are only decompressed on a thread when asked to
+    class Response(io.BytesIO):
+      def info(self):
+        return {'Content-Encoding': 'gzip'}
+    open_url_inner = util._open_url_inner
+    util._open_url_inner = lambda url, headers, allow_no_ssl: Response(gzip_data(self.data))
+    try:
+      stream = util.open_url('http://localhost/test')
+      self.assertFalse(isinstance(stream, gzipstream.ThreadedGzipInputStream))
+      self.assertEqual(stream.read(), self.data)
+      stream = util.open_url('http://localhost/test', threaded_gzip = True)
+      self.assertTrue(isinstance(stream, gzipstream.ThreadedGzipInputStream))
+      self.assertEqual(stream.read(), self.data)
+      stream.close()
+    finally:
+      util._open_url_inner = open_url_inner
+
+
+if __name__ == '__main__':
+  unittest.main()
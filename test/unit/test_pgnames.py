@@ -1,3 +1,7 @@
+import os
+import random
+import shutil
+import tempfile
 import unittest
 import sys
 
@@ -5,6 +9,8 @@ sys.path.insert(0, '../..')
 from edtslib import env
 from edtslib import pgnames
 from edtslib import pgdata
+from edtslib import pgtable
+from edtslib import sector
 from edtslib import vector3 as v3
 del sys.path[0]
 
@@ -61,6 +67,42 @@ class TestPGNames(unittest.TestCase):
     self.assertEqual(test4.position, v3.Vector3(-25.0, 135.0, 455.0) + (20, 20, 20))
     self.assertEqual(test4.uncertainty, 40.0 / 2)
 
+  def test_batches(self):
+    names = ["Wregoe AC-D d12-0", "Eol Prou RS-T d3-94", "Pipe (stem) Sector AL-X c1-12", "wregoe ac-d d12-0", "Not A System"]
+    positions = [v3.Vector3(34, 55, 18278), v3.Vector3(0.0, 0.0, 0.0), v3.Vector3(8322, 1271, -1169), v3.Vector3(4600, 1550, 7330), v3.Vector3(-1280.0 - 65.0, -25.0, -1065.0)]
+    for allow_ha in [True, False]:
+      for single, batch in zip([pgnames.get_system(n, allow_ha=allow_ha) for n in names], pgnames.get_systems(names, allow_ha=allow_ha)):
+        self.assertEqual(None if single is None else (single.name, single.position), None if batch is None else (batch.name, batch.position))
+      for single, batch in zip([pgnames.get_system(p, 'd', allow_ha=allow_ha) for p in positions], pgnames.get_systems(positions, 'd', allow_ha=allow_ha)):
+        self.assertEqual((single.name, single.position, single.sector.name), (batch.name, batch.position, batch.sector.name))
+      self.assertEqual([str(pgnames.get_sector(p, allow_ha=allow_ha)) for p in positions + ["Wregoe"]], [str(s) for s in pgnames.get_sectors(positions + ["Wregoe"], allow_ha=allow_ha)])
+    self.assertEqual([s.name for s in pgnames.get_systems(positions[:2], ['c', 'h'])], [pgnames.get_system(positions[0], 'c').name, pgnames.get_system(positions[1], 'h').name])
+    self.assertRaises(ValueError, pgnames.get_systems, positions, ['c'])
+
+  def test_sector_table(self):
+    path = os.path.join(tempfile.mkdtemp(), 'pgsectors.tbl')
+    old_table, old_checked = pgnames._sector_table, pgnames._sector_table_checked
+    try:
+      # Only part of the galaxy, so the rest still has to be calculated
+      table = pgtable.SectorTable.build(path, 20000)
+      self.assertEqual(pgtable.validate(table), [])
+      centres = [sector.PGSector(*pgnames._get_sector_pos_from_offset(o, sector.galaxy_size)).centre for o in range(0, 40000, 397)]
+      pgnames.use_sector_table(None)
+      expected = [pgnames.get_sector_name(c, allow_ha=False) for c in centres]
+      expected_sectors = [str(pgnames.get_sector(n, allow_ha=False)) for n in expected]
+      pgnames.use_sector_table(table)
+      self.assertEqual([pgnames.get_sector_name(c, allow_ha=False) for c in centres], expected)
+      self.assertEqual([str(pgnames.get_sector(n, allow_ha=False)) for n in expected], expected_sectors)
+      self.assertEqual(table.get_offset(expected[1].upper()), 397)
+      self.assertEqual(table.get_offset("Wregoe"), None)
+      table.close()
+      self.assertTrue(pgnames.load_sector_table(path))
+      self.assertEqual(pgnames.get_sector_name(centres[1], allow_ha=False), expected[1])
+      pgnames._sector_table.close()
+    finally:
+      pgnames._sector_table, pgnames._sector_table_checked = old_table, old_checked
+      shutil.rmtree(os.path.dirname(path))
+
   def test_pg_system_names_good(self):
     self.assertTrue(pgnames.is_pg_system_name("Wregoe AC-D d12-0", strict=True))
     self.assertTrue(pgnames.is_pg_system_name("Soad YY-Z d5", strict=True))
@@ -174,3 +216,20 @@ class TestPGNames(unittest.TestCase):
     test3 = pgnames.get_ha_sectors((616.52344, -446.42578, -1107.67383), 50)
     self.assertEqual(len(test3), 4)
     self.assertEqual(list(test3.keys()), ["Orion Sector", "Trapezium Sector", "Running Man Sector", "NGC 1981 Sector"])
+    test4 = pgnames.get_ha_sectors((616.52344, -446.42578, -1107.67383), limit = 2)
+    self.assertEqual(list(test4.keys()), ["Orion Sector", "Trapezium Sector"])
+    self.assertRaises(ValueError, pgnames.get_ha_sectors, None, None, 2)
+
+  def test_ha_index(self):
+    rng = random.Random(1)
+    regions = list(pgdata.ha_regions.values())
+    positions = [v3.Vector3(rng.uniform(-5000, 5000), rng.uniform(-1000, 1000), rng.uniform(-5000, 25000)) for _ in range(200)]
+    # Points in and around region spheres, including on their surfaces
+    for r in regions[::10]:
+      positions += [r.spheres[0].centre, r.spheres[0].centre + v3.Vector3(r.spheres[0].radius, 0, 0), r.spheres[0].centre + v3.Vector3(0, 0, -1.01 * r.spheres[0].radius)]
+    for pos in positions:
+      scan = [r for r in regions if r.contains(pos)]
+      self.assertEqual(pgnames._ha_get_name(pos), scan[0].name if scan else None)
+      nearest = sorted(regions, key=lambda r: (pos - r.centre).length)
+      self.assertEqual(list(pgnames.get_ha_regions(pos, limit = 5).values()), nearest[:5])
+      self.assertEqual(list(pgnames.get_ha_regions(pos, 500).values()), [r for r in nearest if (pos - r.centre).length < 500])
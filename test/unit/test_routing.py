@@ -0,0 +1,159 @@
+import random
+import unittest
+import sys
+
+sys.path.insert(0, '../..')
+from edtslib import calc
+from edtslib import fsd
+from edtslib import routing
+from edtslib import spatial
+from edtslib import vecarray
+from edtslib.system_internal import KnownSystem
+del sys.path[0]
+
+
+def make_star(i, x, y, z, star_class):
+  return KnownSystem({'id': i, 'name': 'Test {}'.format(i), 'x': x, 'y': y, 'z': z, 'id64': None, 'arrival_star_class': star_class})
+
+def make_field(seed, length = 240.0, neutrons = (30.0, 75.0, 120.0, 165.0, 210.0)):
+  # Normal stars every few Ly along the x axis, with a few neutron stars and
+  # white dwarfs among them
+  rng = random.Random(seed)
+  stars = [make_star(i, i * 4.0, rng.uniform(-3, 3), rng.uniform(-3, 3), 'K') for i in range(int(length / 4.0) + 1)]
+  stars += [make_star(len(stars) + i, x, rng.uniform(-2, 2), rng.uniform(-2, 2), 'N' if i % 2 == 0 else 'DA') for i, x in enumerate(neutrons)]
+  return stars
+
+
+class FakeEnvData(object):
+  def __init__(self, stars):
+    self.stars = stars
+    self.filters = []
+
+  def find_systems_by_cylinder(self, vec_from, vec_to, buffer_both, filters = None):
+    # Filters are recorded but not applied, so that plot_neutron's own checks are tested
+    self.filters.append(filters)
+    return vecarray.PointSet(self.stars).cylinder(vec_from, vec_to, buffer_both).items
+
+
+class FakeEnv(object):
+  def __init__(self, envdata):
+    self.envdata = envdata
+
+  def __enter__(self):
+    return self.envdata
+
+  def __exit__(self, exc_type, exc_value, traceback):
+    return False
+
+
+class TestRouting(unittest.TestCase):
+  def setUp(self):
+    self.jump_range = 10.0
+    self._use = routing.env.use
+    self._shortest_path = calc.shortest_path
+    self.plans = []
+    def shortest_path(*args, **kwargs):
+      plan = self._shortest_path(*args, **kwargs)
+      self.plans.append(plan)
+      return plan
+    calc.shortest_path = shortest_path
+
+  def tearDown(self):
+    routing.env.use = self._use
+    calc.shortest_path = self._shortest_path
+
+  def plot_neutron(self, stars, sys_from, sys_to, route_filters = None):
+    self.envdata = FakeEnvData(stars)
+    routing.env.use = lambda *args, **kwargs: FakeEnv(self.envdata)
+    r = routing.Routing(None, route_strategy='neutron', fuel_strategy='optimal', jump_range=self.jump_range, use_cache=False)
+    return r, r.plot(sys_from, sys_to, [], self.jump_range, route_filters = route_filters)
+
+  def check_hops(self, r, route):
+    # Every hop is a normal jump, or a supercharged one from a superchargeable star
+    supercharged = []
+    for a, b in zip(route, route[1:]):
+      if a.distance_to(b) >= self.jump_range:
+        self.assertTrue(a.arrival_star.superchargeable)
+        self.assertTrue(a.distance_to(b) < self.jump_range * r.supercharge_boost(a))
+        supercharged.append((a, b))
+    return supercharged
+
+  def test_neutron(self):
+    stars = make_field(1)
+    sys_from, sys_to = stars[0], [s for s in stars if s.arrival_star_class == 'K'][-1]
+    r, route = self.plot_neutron(stars, sys_from, sys_to)
+    self.assertIsNotNone(route)
+    self.assertEqual(route[0], sys_from)
+    self.assertEqual(route[-1], sys_to)
+    self.assertEqual(len(set(route)), len(route))
+    self.assertEqual(self.envdata.filters[0], 'arrival_star=superchargeable')
+
+    # The plan only goes through superchargeable stars, even if the DB doesn't filter them
+    plan = self.plans[0]
+    self.assertEqual(plan[0], sys_from)
+    self.assertEqual(plan[-1], sys_to)
+    self.assertTrue(len(plan) > 2)
+    self.assertTrue(all(s.arrival_star.superchargeable for s in plan[1:-1]))
+    self.assertTrue(all(s in route for s in plan))
+
+    supercharged = self.check_hops(r, route)
+    self.assertTrue(any(supercharged))
+    self.assertTrue(len(route) - 1 < sys_from.distance_to(sys_to) / self.jump_range)
+    for leg_from, leg_to in zip(plan, plan[1:]):
+      first_range = self.jump_range * r.supercharge_boost(leg_from)
+      if first_range > self.jump_range and leg_from.distance_to(leg_to) >= first_range:
+        # Lands on the star nearest the next one in the plan, within the boosted range
+        landing = route[route.index(leg_from) + 1]
+        in_range = [s for s in stars if s != leg_from and s.distance_to(leg_from) < first_range]
+        self.assertEqual(landing, min(in_range, key=lambda s: s.distance_to(leg_to)))
+
+  def test_neutron_no_superchargeable(self):
+    # With nothing to supercharge from, sys_to is still reachable by normal jumps
+    stars = make_field(2, neutrons = ())
+    sys_from, sys_to = stars[0], stars[-1]
+    r, route = self.plot_neutron(stars, sys_from, sys_to)
+    self.assertEqual(self.plans[0], [sys_from, sys_to])
+    self.assertIsNotNone(route)
+    self.assertEqual(route[0], sys_from)
+    self.assertEqual(route[-1], sys_to)
+    self.assertEqual(self.check_hops(r, route), [])
+
+  def test_neutron_filters(self):
+    # The plan is always over superchargeable stars, while the route filters
+    # only apply to the stars in between, even if they'd rule out neutron stars
+    stars = make_field(1)
+    sys_from, sys_to = stars[0], [s for s in stars if s.arrival_star_class == 'K'][-1]
+    r, route = self.plot_neutron(stars, sys_from, sys_to, route_filters = 'arrival_star=scoopable')
+    self.assertIsNotNone(route)
+    self.assertEqual(self.envdata.filters[0], 'arrival_star=superchargeable')
+    self.assertTrue(len(self.envdata.filters) > 1)
+    self.assertTrue(all(f == 'arrival_star=scoopable' for f in self.envdata.filters[1:]))
+    self.assertTrue(any(self.check_hops(r, route)))
+
+  def test_neutron_heuristic(self):
+    # A* over the neutron graph must find plans as good as Dijkstra's
+    r = routing.Routing(None, route_strategy='neutron', fuel_strategy='optimal', jump_range=self.jump_range, use_cache=False)
+    boosted_range = self.jump_range * fsd.boost_multipliers['N']
+    leg_max = boosted_range + self.jump_range * r._neutron_filler_jumps
+    for seed in range(10):
+      rng = random.Random(seed)
+      nodes = [make_star(i, rng.uniform(0, 600), rng.uniform(-30, 30), rng.uniform(-30, 30), rng.choice(['N', 'DA'])) for i in range(60)]
+      # A chain of neutron stars just inside the boosted range of each other
+      nodes += [make_star(100 + i, i * (boosted_range - 0.5), rng.uniform(-0.1, 0.1), 0, 'N') for i in range(1, 15)]
+      sys_from = make_star(-1, 0, 0, 0, 'N')
+      sys_to = make_star(-2, 600, 0, 0, 'K')
+      grid = spatial.Grid(nodes + [sys_to], leg_max)
+      neighbours_fn = lambda cur: [n for n in grid.within(cur.position, leg_max) if n != cur] + ([sys_to] if cur.distance_to(sys_to) >= leg_max else [])
+      cost_fn, heuristic_fn = r.neutron_cost_fns(sys_to, self.jump_range, boosted_range)
+      plan_cost = lambda plan: sum(cost_fn(a, b) for a, b in zip(plan, plan[1:]))
+      astar_plan = calc.shortest_path(sys_from, sys_to, neighbours_fn, cost_fn, heuristic_fn)
+      dijkstra_plan = calc.shortest_path(sys_from, sys_to, neighbours_fn, cost_fn, lambda cur: 0)
+      self.assertAlmostEqual(plan_cost(astar_plan), plan_cost(dijkstra_plan))
+      self.assertEqual(astar_plan, dijkstra_plan)
+      # The estimate is never more than the real cost of the rest of the plan
+      for i, cur in enumerate(astar_plan):
+        self.assertTrue(heuristic_fn(cur) <= plan_cost(astar_plan[i:]) + 1e-9)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,99 @@
+import random
+import unittest
+import sys
+
+sys.path.insert(0, '../..')
+from edtslib import calc
+from edtslib import solver
+from edtslib.station import Station
+del sys.path[0]
+
+import testdata
+
+def make_stations(count, seed):
+  rng = random.Random(seed)
+  systems = testdata.make_known_systems(count, seed, lo = (0, -50, 0), hi = (500, 50, 500))
+  return [Station({'name': 'Station {}'.format(i), 'distance_to_star': rng.randint(10, 5000), 'type': None, 'has_refuel': True, 'max_landing_pad_size': 'L', 'is_planetary': False}, system) for i, system in enumerate(systems)]
+
+class TestSolver(unittest.TestCase):
+  def test_cost_matrix(self):
+    stations = make_stations(8, 1)
+    start, end = stations[0], stations[-1]
+    costs = solver._CostMatrix(stations, 30.0, calc.default_ws_time)
+    for a in stations:
+      for b in stations:
+        self.assertEqual(costs.get(a, b), calc.solve_cost(a, b, 30.0))
+    with_matrix, _ = solver.Solver(30.0, 1.5).solve(stations[1:-1], start, end, len(stations), preferred_mode = solver.BASIC)
+    without_matrix, _ = solver.Solver(30.0, 1.5, cost_matrix = False).solve(stations[1:-1], start, end, len(stations), preferred_mode = solver.BASIC)
+    self.assertEqual(with_matrix, without_matrix)
+
+  def test_exact(self):
+    stations = make_stations(9, 2)
+    start, end = stations[0], stations[-1]
+    # A diff limit this big makes the basic mode try every route
+    s = solver.Solver(30.0, 1000.0)
+    basic, _ = s.solve(stations[1:-1], start, end, len(stations), preferred_mode = solver.BASIC)
+    exact, definitive = s.solve(stations[1:-1], start, end, len(stations), preferred_mode = solver.EXACT)
+    self.assertTrue(definitive)
+    self.assertEqual(sorted(exact, key=id), sorted(basic, key=id))
+    self.assertAlmostEqual(s._route_cost(exact), s._route_cost(basic))
+    have_numpy = solver.vecarray.np
+    try:
+      solver.vecarray.np = None
+      python, _ = s.solve(stations[1:-1], start, end, len(stations), preferred_mode = solver.EXACT)
+    finally:
+      solver.vecarray.np = have_numpy
+    self.assertAlmostEqual(s._route_cost(python), s._route_cost(exact))
+
+  def test_exact_constraints(self):
+    stations = make_stations(9, 3)
+    start, end = stations[0], stations[-1]
+    middle = stations[1:-1]
+    route_set = solver.RouteSet(stations = middle[:3], min = 1, max = 1)
+    tour = [middle[5], middle[3]]
+    s = solver.Solver(30.0, 1.5)
+    maxstops = len(middle) - 2 + 2
+    basic, _ = s.solve(middle, start, end, maxstops, preferred_mode = solver.BASIC, route_sets = [route_set])
+    exact, _ = s.solve(middle, start, end, maxstops, preferred_mode = solver.EXACT, route_sets = [route_set])
+    self.assertTrue(route_set.validate(exact))
+    self.assertEqual(len(exact), maxstops)
+    self.assertAlmostEqual(s._route_cost(exact), s._route_cost(basic))
+    exact, _ = s.solve(middle, start, end, len(stations), preferred_mode = solver.EXACT, tours = [tour])
+    self.assertLess(exact.index(tour[0]), exact.index(tour[1]))
+
+  def test_local_search(self):
+    stations = make_stations(30, 4)
+    start, end = stations[0], stations[-1]
+    middle = stations[1:-1]
+    tour = [middle[10], middle[2], middle[7]]
+    s = solver.Solver(30.0, 1.5, local_search = False)
+    route, _ = s.solve(list(middle), start, end, len(stations), preferred_mode = solver.NEAREST_NEIGHBOUR, tours = [tour])
+    improved = s.improve_route(route, tours = [tour])
+    self.assertEqual((improved[0], improved[-1]), (start, end))
+    self.assertEqual(sorted(improved, key=id), sorted(route, key=id))
+    self.assertLess(s._route_cost(improved), s._route_cost(route))
+    self.assertEqual([stn for stn in improved if stn in tour], [stn for stn in route if stn in tour])
+
+  def test_kmeans(self):
+    stations = make_stations(60, 5)
+    first = solver.find_center_sets(stations, 6, 4, rng = random.Random(7))
+    second = solver.find_center_sets(stations, 6, 4, rng = random.Random(7))
+    self.assertEqual([[c.systems for c in clusters] for clusters in first], [[c.systems for c in clusters] for clusters in second])
+    for clusters in first:
+      self.assertEqual(sorted(sum([c.systems for c in clusters], []), key=id), sorted(stations, key=id))
+      # Lloyd's algorithm has converged, so every station is in the cluster with the nearest centre
+      for c in clusters:
+        for stn in c.systems:
+          nearest = min(clusters, key=lambda o: (stn.position - o.position).length)
+          self.assertAlmostEqual((stn.position - c.position).length, (stn.position - nearest.position).length)
+    best = solver.find_centers(stations, 6, restarts = 4, rng = random.Random(7))
+    self.assertEqual(len(best), 6)
+
+  def test_seed(self):
+    stations = make_stations(40, 6)
+    routes = [solver.Solver(30.0, 1.5, seed = 3).solve(stations[1:-1], stations[0], stations[-1], len(stations), preferred_mode = solver.CLUSTERED)[0] for _ in range(2)]
+    self.assertEqual(routes[0], routes[1])
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,88 @@
+import os
+import shutil
+import tempfile
+import unittest
+import sys
+
+sys.path.insert(0, '../..')
+from edtslib import db_sqlite3
+from edtslib import filtering
+from edtslib import spatial
+from edtslib import starindex
+from edtslib.vector3 import Vector3
+del sys.path[0]
+
+import testdata
+
+def make_rows(count, seed):
+  return testdata.make_systems(count, seed, with_id64 = True, grid = 32,
+                               choices = [('needs_permit', [None, False, True]), ('arrival_star_class', ['K', 'M', 'N', None])])
+
+@unittest.skipUnless(starindex.is_available(), "numpy is not available")
+class TestStarIndex(unittest.TestCase):
+  def setUp(self):
+    self.dir = tempfile.mkdtemp()
+    self.rows = make_rows(2000, 1)
+    self.index = starindex.StarIndex.build(self.rows, os.path.join(self.dir, 'test.starindex'), 42)
+
+  def tearDown(self):
+    shutil.rmtree(self.dir)
+
+  def test_reload(self):
+    path = os.path.join(self.dir, 'test.starindex')
+    self.assertIsNotNone(starindex.StarIndex.load(path, 42))
+    self.assertIsNone(starindex.StarIndex.load(path, 43))
+
+  def test_aabb(self):
+    found = self.index.find_systems_by_aabb(-50, -10, -80, 60, 20, 30)
+    expected = [r for r in self.rows if -50 <= r['x'] < 60 and -10 <= r['y'] < 20 and -80 <= r['z'] < 30]
+    self.assertEqual(sorted(s.id for s in found), sorted(r['id'] for r in expected))
+    byid = dict((r['id'], r) for r in self.rows)
+    for s in found:
+      r = byid[s.id]
+      self.assertEqual((s.name, s.id64, s.position), (r['name'], r['id64'], Vector3(r['x'], r['y'], r['z'])))
+      self.assertEqual(s.needs_system_permit, r['needs_permit'])
+
+  def test_close_to(self):
+    centre = Vector3(10, 0, -10)
+    filters = {
+      'close_to': [{filtering.PosArgs: [filtering.Operator('=', centre)], 'distance': [filtering.Operator('<', 40.0)]}],
+      'arrival_star': [{filtering.PosArgs: [filtering.Operator('=', ['K', 'N'])]}],
+      'limit': [{filtering.PosArgs: [filtering.Operator('=', 5)]}]}
+    found = list(self.index.find_all_systems(filters))
+    expected = sorted([r for r in self.rows if r['arrival_star_class'] in ['K', 'N'] and (Vector3(r['x'], r['y'], r['z']) - centre).length < 40.0],
+                      key=lambda r: (Vector3(r['x'], r['y'], r['z']) - centre).length)
+    self.assertEqual([s.id for s in found], [r['id'] for r in expected[:5]])
+
+  def test_cylinder(self):
+    vec_from = Vector3(-150, 0, -150)
+    vec_to = Vector3(150, 10, 150)
+    found = self.index.find_systems_by_cylinder(vec_from, vec_to, 20.0)
+    expected = []
+    for r in self.rows:
+      p = Vector3(r['x'], r['y'], r['z'])
+      in_box = all(min(a, b) - 20.0 <= c < max(a, b) + 20.0 for a, b, c in zip(vec_from, vec_to, p))
+      if in_box and ((p - vec_from).cross(p - vec_to)).length / (vec_to - vec_from).length < 20.0:
+        expected.append(r['id'])
+    self.assertEqual(sorted(s.id for s in found), sorted(expected))
+
+  def test_arrival_star_matches_sql(self):
+    dbc = db_sqlite3.initialise_db(os.path.join(self.dir, 'test.db'))
+    try:
+      dbc._conn.executemany('INSERT INTO systems VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', [
+        (r['id'], r['name'], r['x'], r['y'], r['z'], r['id64'], r['needs_permit'], None, r['arrival_star_class'], spatial.morton_key(r['x'], r['y'], r['z'])) for r in self.rows])
+      dbc._conn.commit()
+      for op in ['=', '!=', '<>']:
+        filters = {'arrival_star': [{filtering.PosArgs: [filtering.Operator(op, ['K', 'N'])]}]}
+        found = sorted(s.id for s in self.index.find_all_systems(filters))
+        expected = sorted(s['id'] for s in dbc.find_all_systems(filters))
+        self.assertEqual(found, expected, op)
+        if op == '<>':
+          byid = dict((r['id'], r) for r in self.rows)
+          self.assertTrue(all(byid[i]['arrival_star_class'] is not None for i in found))
+    finally:
+      dbc.close()
+
+
+if __name__ == '__main__':
+  unittest.main()
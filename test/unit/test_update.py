@@ -0,0 +1,111 @@
+import argparse
+import json
+import os
+import shutil
+import tempfile
+import unittest
+import sys
+
+sys.path.insert(0, '../..')
+from edtslib import db_sqlite3
+from edtslib import update
+from edtslib import util
+del sys.path[0]
+
+import testdata
+
+def make_systems(count, seed):
+  # As they come in the EDSM dumps
+  return [{'id': s['id'], 'id64': s['id64'], 'name': s['name'], 'coords': {'x': s['x'], 'y': s['y'], 'z': s['z']}}
+          for s in testdata.make_systems(count, seed, with_id64 = True)]
+
+def make_dump(systems):
+  # Laid out like the EDSM dumps, one system per line inside a JSON array,
+  # without a newline at the end
+  return ('[\n' + ',\n'.join('    ' + json.dumps(s) for s in systems) + '\n]').encode('utf-8')
+
+
+# Runs items one at a time as they're collected, counting how many are pending
+class FakeResult(object):
+  def __init__(self, pool, value):
+    self.pool = pool
+    self.value = value
+
+  def get(self):
+    self.pool.pending -= 1
+    return self.value
+
+class FakePool(object):
+  def __init__(self):
+    self.pending = 0
+    self.max_pending = 0
+
+  def apply_async(self, fn, args):
+    self.pending += 1
+    self.max_pending = max(self.max_pending, self.pending)
+    return FakeResult(self, fn(*args))
+
+
+class TestUpdate(unittest.TestCase):
+  def setUp(self):
+    self.dir = tempfile.mkdtemp()
+    self.systems = make_systems(500, 1)
+    self.data = make_dump(self.systems)
+    self.path = os.path.join(self.dir, 'systems.json')
+    with open(self.path, 'wb') as f:
+      f.write(self.data)
+    self.block_size = update.import_block_size
+    # Small enough that most blocks end part way through a line
+    update.import_block_size = 1000
+    self.app = object.__new__(update.Application)
+    self.app.args = argparse.Namespace(jobs = 2)
+
+  def tearDown(self):
+    update.import_block_size = self.block_size
+    shutil.rmtree(self.dir)
+
+  def test_read_blocks(self):
+    blocks = list(self.app.read_blocks_from_url(util.path_to_url(self.path), True))
+    self.assertTrue(len(blocks) > 2)
+    self.assertEqual(b''.join(blocks), self.data)
+    self.assertTrue(all(b.endswith(b'\n') for b in blocks[:-1]))
+    # The last line has no newline, and comes out on its own
+    self.assertEqual(blocks[-1], b']')
+    # Resuming part way through skips exactly that many bytes
+    offset = len(b''.join(blocks[:3]))
+    self.assertEqual(b''.join(self.app.read_blocks_from_url(util.path_to_url(self.path), True, offset)), self.data[offset:])
+
+  def test_parse_block(self):
+    block = b'[\n' + json.dumps(self.systems[0]).encode('utf-8') + b',\n    {"id": 2, "name": },\n' + json.dumps(self.systems[1]).encode('utf-8') + b'\n]'
+    rows, failed, size = update.parse_edsm_systems_block(block)
+    self.assertEqual(rows, [db_sqlite3.edsm_system_row(s) for s in self.systems[:2]])
+    self.assertEqual(failed, 1)
+    self.assertEqual(size, len(block))
+
+  def test_bounded_imap(self):
+    pool = FakePool()
+    self.assertEqual(list(update.bounded_imap(pool, abs, range(0, -50, -1), 4)), list(range(50)))
+    self.assertEqual(pool.max_pending, 4)
+    self.assertEqual(pool.pending, 0)
+
+  def test_import_journal(self):
+    url = util.path_to_url(self.path)
+    path = os.path.join(self.dir, 'test.db.import.json')
+    journal = update.ImportJournal(path, url, 'test')
+    self.assertEqual((journal.offset, journal.stale), (0, False))
+    journal.save(1234)
+    journal = update.ImportJournal(path, url, 'test')
+    self.assertEqual((journal.offset, journal.stale), (1234, False))
+    # Only good for the same file imported for the same purpose
+    journal = update.ImportJournal(path, url, 'other')
+    self.assertEqual((journal.offset, journal.stale), (0, True))
+    journal.remove()
+    self.assertFalse(os.path.exists(path))
+
+  def test_import_parallel(self):
+    rows = list(self.app.import_systems_parallel(util.path_to_url(self.path), 'test', True))
+    self.assertEqual(rows, [db_sqlite3.edsm_system_row(s) for s in self.systems])
+
+
+if __name__ == '__main__':
+  unittest.main()
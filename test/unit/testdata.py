@@ -0,0 +1,27 @@
+import random
+import sys
+
+sys.path.insert(0, '../..')
+from edtslib.system_internal import KnownSystem
+del sys.path[0]
+
+
+# Random systems for tests, as the dicts KnownSystem takes, numbered from 1
+# and spread evenly between the corners lo and hi
+# with_id64 gives them made up id64s, grid rounds their coordinates to a
+# fraction of a Ly, and choices picks a random value for each of its keys
+def make_systems(count, seed, lo = (-200, -50, -200), hi = (200, 50, 200), with_id64 = False, grid = None, choices = None):
+  rng = random.Random(seed)
+  systems = []
+  for i in range(count):
+    pos = [rng.uniform(l, h) for l, h in zip(lo, hi)]
+    if grid is not None:
+      pos = [round(c * grid) / float(grid) for c in pos]
+    system = {'id': i + 1, 'name': u'Test {}'.format(i), 'x': pos[0], 'y': pos[1], 'z': pos[2], 'id64': i * 3 + 1 if with_id64 else None}
+    for key, values in (choices or []):
+      system[key] = rng.choice(values)
+    systems.append(system)
+  return systems
+
+def make_known_systems(count, seed, **kwargs):
+  return [KnownSystem(s) for s in make_systems(count, seed, **kwargs)]
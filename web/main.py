@@ -9,6 +9,7 @@ data_path = '..'
 
 sys.path.insert(1, data_path)
 from edtslib.thirdparty import bottle
+from edtslib import edts
 from edtslib import env
 from edtslib import fsd
 from edtslib import pgnames
@@ -21,6 +22,10 @@ del sys.path[1]
 
 env.configure_logging(env.global_args.log_level)
 
+# Processes any one request may use to plot route legs in parallel
+api_max_jobs = 2
+edts.max_jobs = api_max_jobs
+
 def vec3_to_dict(v):
   return collections.OrderedDict([('x', v.x), ('y', v.y), ('z', v.z)])
 
@@ -182,13 +187,12 @@ def api_system_station(system_name, station_name):
     bottle.response.content_type = 'application/json'
     return {'result': result}
 
+find_system_columns = ('name', 'x', 'y', 'z', 'id64', 'needs_permit', 'allegiance', 'arrival_star_class')
+
 @bottle.route('/api/v1/find_system/<glob>')
 def api_find_system(glob):
-  result = []
   with env.use() as data:
-    for syst in data.find_systems_by_glob(glob, keep_data=True):
-      if syst is not None:
-        result.append(syst.data)
+    result = [row._asdict() for row in data.stream_systems_by_glob(glob, columns=find_system_columns)]
   if not len(result):
     result = None
   bottle.response.content_type = 'application/json'